@@ -54,6 +54,7 @@ import ast
 import re
 import subprocess
 import sys
+import threading
 from collections.abc import Callable, Mapping, Sequence
 from pathlib import Path
 from typing import Any
@@ -175,6 +176,72 @@ def missing_encoders(
     return tuple(sorted(set(wanted) - have))
 
 
+#: Opt-in settings key: encode the reframe pass on a hardware H.264 encoder.
+HARDWARE_ENCODE_KEY = "hardwareEncode"
+
+#: Hardware H.264 encoders in preference order, each with the rate-control
+#: arguments that stand in for libx264's ``-preset medium -crf 18``. The names
+#: never appear as a literal ``-c:v`` token (they are spliced in by
+#: :func:`hardware_video_args`), so they stay outside :data:`REQUIRED_ENCODERS`:
+#: the pipeline never DEMANDS them, it only uses one when the binary lists it.
+#: ``h264_vaapi`` is deliberately absent -- it needs a ``-vaapi_device`` plus a
+#: ``hwupload`` filter stage, not just an encoder swap.
+HARDWARE_H264_ENCODERS: dict[str, tuple[str, ...]] = {
+    "h264_nvenc": ("-preset", "p4", "-rc", "vbr", "-cq", "19", "-b:v", "0"),
+    "h264_videotoolbox": ("-b:v", "8M"),
+    "h264_amf": ("-quality", "balanced"),
+}
+
+_hardware_cache: dict[str, str | None] = {}
+_hardware_lock = threading.Lock()
+
+
+def hardware_h264_encoder(
+    settings: Mapping[str, Any] | None = None,
+    probe_runner: ProbeRunner | None = None,
+) -> str | None:
+    """The hardware H.264 encoder to use, or ``None`` for the libx264 default.
+
+    Only consulted when ``settings.hardwareEncode`` is ``True``: ``-encoders``
+    lists ``h264_nvenc`` on any build compiled with it, GPU or not, so a listing
+    is not proof the encode will run -- the user opts in for a machine they know.
+    The choice is probed once per resolved ffmpeg binary and cached.
+    """
+    if (settings or {}).get(HARDWARE_ENCODE_KEY) is not True:
+        return None
+    try:
+        binary = ffmpeg.ffmpeg_path(settings)
+    except Exception:  # noqa: BLE001 - no ffmpeg resolvable -> no hardware encoder
+        return None
+    with _hardware_lock:
+        if binary in _hardware_cache:
+            return _hardware_cache[binary]
+    have = available_encoders(settings, probe_runner=probe_runner)
+    chosen = next((name for name in HARDWARE_H264_ENCODERS if name in have), None)
+    with _hardware_lock:
+        _hardware_cache[binary] = chosen
+    if chosen is not None:
+        log.info("hardware encode: using %s", chosen)
+    return chosen
+
+
+def hardware_video_args(
+    settings: Mapping[str, Any] | None = None,
+    probe_runner: ProbeRunner | None = None,
+) -> list[str] | None:
+    """``-c:v <hw encoder> <rate control>`` for an opted-in host, else ``None``."""
+    name = hardware_h264_encoder(settings, probe_runner=probe_runner)
+    if name is None:
+        return None
+    return ["-c:v", name, *HARDWARE_H264_ENCODERS[name]]
+
+
+def clear_hardware_cache() -> None:
+    """Forget every probed hardware-encoder choice (tests, or after a binary swap)."""
+    with _hardware_lock:
+        _hardware_cache.clear()
+
+
 def _literal(node: ast.AST | None) -> str | None:
     """The value of a string-literal AST node, else ``None`` (dynamic value)."""
     if isinstance(node, ast.Constant) and isinstance(node.value, str):
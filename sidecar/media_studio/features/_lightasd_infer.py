@@ -302,12 +302,17 @@ def analyze_visual(  # pragma: no cover - heavy native seam
     fps: float,
     *,
     settings: dict[str, Any],
+    audio_wav: str | None = None,
 ) -> tuple[tuple[tuple[Box, ...], ...], tuple[tuple[float, ...], ...], tuple[float, ...]]:
     """YuNet + LR-ASD -> per-(source)-frame boxes, aligned ASD scores, VAD.
 
     Returns three tuples each of length ``total_frames``. Boxes are ``(x,y,w,h)``
     in source pixels; ``visual_scores_per_frame[f][i]`` is the speaking score of
     ``boxes_per_frame[f][i]``; ``vad_per_frame[f]`` is normalised RMS energy.
+
+    ``audio_wav`` is an already-extracted mono :data:`AUDIO_SR` wav of
+    ``media_path`` (the multi-speaker backend extracts one for diarization);
+    when given it is read in place instead of decoding the audio again.
     """
     import cv2  # noqa: PLC0415
     import numpy as np  # noqa: PLC0415
@@ -332,7 +337,9 @@ def analyze_visual(  # pragma: no cover - heavy native seam
     with _work_tree() as work:
         frames_dir = os.path.join(work, "f")
         os.makedirs(frames_dir, exist_ok=True)
-        audio_wav = os.path.join(work, "a.wav")
+        if audio_wav is None:
+            audio_wav = os.path.join(work, "a.wav")
+            _run(["ffmpeg", "-y", "-i", media_path, "-ac", "1", "-vn", "-ar", str(AUDIO_SR), audio_wav])
         _run(
             [
                 "ffmpeg",
@@ -348,7 +355,6 @@ def analyze_visual(  # pragma: no cover - heavy native seam
                 os.path.join(frames_dir, "%06d.jpg"),
             ]
         )
-        _run(["ffmpeg", "-y", "-i", media_path, "-ac", "1", "-vn", "-ar", str(AUDIO_SR), audio_wav])
         flist = sorted(os.path.join(frames_dir, f) for f in os.listdir(frames_dir) if f.endswith(".jpg"))
         n25 = len(flist)
         if n25 == 0:
@@ -0,0 +1,51 @@
+"""Vectorized ``[start, end)`` window grid shared by the per-module ``sample_windows``.
+
+Every Phase-8 module (motion, saliency, audio saliency, scene, VLM) and the
+Parakeet chunker tile a clip the same way: a window every ``hop`` seconds of
+width ``win``, the last end clamped to ``duration``. Each used to walk that grid
+with a Python ``while start < d: ... start += hop`` loop, paying one float add,
+compare and ``min`` per window in the interpreter. :func:`stride_windows`
+computes the whole grid in numpy in one shot.
+
+The starts are a running sum (``np.add.accumulate`` adds left to right, so every
+start is bit-identical to the old ``start += hop`` loop — NOT ``arange``'s
+``i * hop``, which can land a boundary window on the other side of ``duration``).
+Rounding stays with each caller so every module keeps its own precision.
+"""
+
+from __future__ import annotations
+
+
+def stride_windows(
+    duration: float,
+    win_sec: float,
+    hop_sec: float,
+    *,
+    tail: float = 0.0,
+) -> list[tuple[float, float]]:
+    """Return unrounded ``(start, end)`` windows over ``[0, duration - tail)``.
+
+    Starts run ``0, hop, hop + hop, ...`` while ``start < duration - tail``; each
+    end is ``min(start + win_sec, duration)``. ``tail`` is the tolerance some
+    modules use to skip a sliver window at the very end (``1e-9``). Callers
+    validate ``win_sec`` / ``hop_sec`` (positive) and the non-positive-duration
+    floor themselves; an empty limit simply yields no windows.
+    """
+    import numpy as np  # noqa: PLC0415 - numpy is in the venv; kept local for a light surface
+
+    d = float(duration)
+    hop = float(hop_sec)
+    limit = d - tail
+    if not limit > 0.0:
+        return []
+    # ``limit // hop + 3`` covers the accumulated rounding drift of the running
+    # sum for any grid below ~1e8 windows; grow (rarely, if ever) beyond that.
+    count = int(limit // hop) + 3
+    starts = np.add.accumulate(np.full(count, hop))
+    while starts[-1] < limit:  # pragma: no cover - needs a ~1e8-window grid
+        count *= 2
+        starts = np.add.accumulate(np.full(count, hop))
+    starts = np.concatenate(([0.0], starts[:-1]))
+    starts = starts[starts < limit]
+    ends = np.minimum(starts + float(win_sec), d)
+    return list(zip(starts.tolist(), ends.tolist(), strict=True))
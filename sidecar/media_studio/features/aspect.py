@@ -22,6 +22,8 @@ unit-testable and importable by the cycle-sensitive claudeshorts engine.
 
 from __future__ import annotations
 
+import functools
+
 #: The default export aspect (vertical) — unchanged from V1.
 DEFAULT_ASPECT = "9:16"
 
@@ -91,6 +93,7 @@ def require_supported_aspect(aspect: str) -> str:
     return norm
 
 
+@functools.lru_cache(maxsize=32)
 def output_dimensions(aspect: str = DEFAULT_ASPECT) -> tuple[int, int]:
     """Return the ``(width, height)`` the reframe should produce for ``aspect``.
 
@@ -98,6 +101,8 @@ def output_dimensions(aspect: str = DEFAULT_ASPECT) -> tuple[int, int]:
     (:data:`ASPECT_PRESETS`). Any other positive ratio falls back to the engines'
     original generic math: portrait/square fix the HEIGHT to 1920, landscape fix
     the WIDTH to 1920, deriving the other edge from the ratio rounded to even.
+    Memoized per aspect string — every clip of a batch asks for the same one or
+    two targets; a bad ratio still raises (exceptions are never cached).
     """
     norm = normalize_aspect(aspect)
     preset = ASPECT_PRESETS.get(norm)
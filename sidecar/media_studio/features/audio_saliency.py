@@ -40,6 +40,7 @@ from typing import TYPE_CHECKING, Any, Protocol
 
 from ..util import clamp, get_logger
 from . import offline as _offline
+from ._window_grid import stride_windows
 
 if TYPE_CHECKING:  # numpy IS in the venv; kept import-light for symmetry with peers.
     import numpy as np
@@ -215,13 +216,7 @@ def sample_windows(
         return ((0.0, 0.0),)
     win = max(1e-6, float(win_sec))
     hop = max(1e-6, float(hop_sec))
-    windows: list[tuple[float, float]] = []
-    start = 0.0
-    while start < d:
-        end = min(start + win, d)
-        windows.append((round(start, 3), round(end, 3)))
-        start += hop
-    return tuple(windows)
+    return tuple((round(start, 3), round(end, 3)) for start, end in stride_windows(d, win, hop))
 
 
 # --------------------------------------------------------------------------- #
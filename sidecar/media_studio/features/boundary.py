@@ -475,13 +475,16 @@ def build_silencedetect_argv(
     """argv (list, never shell) for ffmpeg ``silencedetect`` over ``video_path``.
 
     ``silencedetect`` writes ``silence_start``/``silence_end`` lines to **stderr**;
-    we decode the video to null so only the analysis runs. Paths with spaces are
-    safe because each is a single argv element (CONTRACTS.md §6).
+    we decode the video to null so only the analysis runs. ``-nostats`` drops the
+    twice-a-second ``frame=... time=...`` line, so the captured stderr holds the
+    analysis lines only instead of growing with the length of the source. Paths
+    with spaces are safe because each is a single argv element (CONTRACTS.md §6).
     """
     return [
         ffmpeg_path,
         "-hide_banner",
         "-nostdin",
+        "-nostats",
         "-i",
         video_path,
         "-af",
@@ -81,6 +81,7 @@ EXPLICITLY DECLINED, with the mechanical reason (NOT a silent drop):
 
 from __future__ import annotations
 
+import functools
 from collections.abc import Mapping, Sequence
 from dataclasses import dataclass
 from typing import Any
@@ -90,10 +91,9 @@ from .caption import (
     CueLike,
     caption_position_fields,
     escape_ass_text,
-    format_ass_timestamp,
+    format_ass_timestamps,
     hook_overlay_parts,
     normalize_caption_box,
-    rebase_cue_time,
 )
 
 # --------------------------------------------------------------------------- #
@@ -169,7 +169,7 @@ def active_color_for_index(index: int, palette: tuple[str, str] = KARAOKE_ACTIVE
 # --------------------------------------------------------------------------- #
 # override resolution — the CaptionOverride merged onto the KARAOKE base
 # --------------------------------------------------------------------------- #
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ResolvedKaraokeStyle:
     """The karaoke visual after merging a validated ``CaptionOverride`` patch.
 
@@ -337,8 +337,13 @@ def group_into_lines(
     words: Sequence[dict[str, Any]],
     max_per_line: int = MAX_WORDS_PER_LINE,
 ) -> list[list[dict[str, Any]]]:
-    """Chunk ``words`` into consecutive lines of 1..``max_per_line`` words (1-4)."""
-    return [list(words[i : i + max_per_line]) for i in range(0, len(words), max_per_line)]
+    """Chunk ``words`` into consecutive lines of 1..``max_per_line`` words (1-4).
+
+    Slicing a ``list`` already yields a fresh list per line, so only a non-list
+    sequence is converted (once, up front) instead of re-copying every slice.
+    """
+    seq = words if isinstance(words, list) else list(words)
+    return [seq[i : i + max_per_line] for i in range(0, len(seq), max_per_line)]
 
 
 def _active_word_block(word_text: str, color: str) -> str:
@@ -390,10 +395,34 @@ def build_line_text(
     wrap could not produce any visible contrast. This is an explicit decline with a
     mechanical reason, not a dropped feature — see the module docstring.
     """
+    return _assemble_line(_escaped_words(line_words, uppercase), active_index, active_color, spoken_color)
+
+
+def _escaped_words(line_words: Sequence[dict[str, Any]], uppercase: bool) -> list[str]:
+    """Each word's ASS-escaped (optionally upper-cased) text, in line order."""
+    return [_escape_word(str(word.get("text") or ""), uppercase) for word in line_words]
+
+
+@functools.lru_cache(maxsize=4096)
+def _escape_word(raw: str, uppercase: bool) -> str:
+    """One word's display text, memoised per ``(raw, uppercase)``.
+
+    Speech is dominated by a small vocabulary ("the", "yeah", a repeated chorus),
+    so most words of a transcript were already upper-cased and escaped for an
+    earlier line; the cache serves those repeats instead of redoing the work.
+    """
+    return escape_ass_text(raw.upper() if uppercase else raw)
+
+
+def _assemble_line(escaped: Sequence[str], active_index: int, active_color: str, spoken_color: str | None) -> str:
+    """Join pre-escaped words into a line with word ``active_index`` highlighted.
+
+    Split from :func:`build_line_text` so :func:`build_karaoke_ass` escapes a
+    line's words ONCE and re-assembles them per active word, instead of
+    re-escaping every word of the line for each of its events.
+    """
     parts: list[str] = []
-    for index, word in enumerate(line_words):
-        raw = str(word.get("text") or "")
-        text = escape_ass_text(raw.upper() if uppercase else raw)
+    for index, text in enumerate(escaped):
         if index == active_index:
             parts.append(_active_word_block(text, active_color))
         elif index < active_index and spoken_color:
@@ -537,8 +566,10 @@ def build_karaoke_ass(
         "Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text",
     ]
 
-    # The hook overlay is emitted FIRST so it draws above the karaoke line.
-    events: list[str] = [*hook_events]
+    # The document is built in ONE list: header, then the hook overlay (emitted
+    # FIRST so it draws above the karaoke line), then the word events.
+    doc = header
+    doc.extend(hook_events)
     global_index = 0
     # Bug-sweep: the shortmaker pipeline feeds ONE-WORD cues (features._cues_for_clip
     # emits a cue per transcript word), so grouping per-cue collapsed every karaoke
@@ -546,21 +577,42 @@ def build_karaoke_ass(
     # so the 1-4-words-per-line look renders from per-word cues. A cue that carries an
     # aligned ``words`` array still contributes its words in order.
     all_words = [word for cue in cues for word in words_from_cue(cue)]
+    # Three phases: (1) re-base every word's start/end as one column op and mark
+    # the events that survive (end > start); (2) walk the lines once, assembling
+    # the text of each kept event; (3) format both time columns in one batch and
+    # zip the columns into Dialogue lines.
+    import numpy as np  # noqa: PLC0415 - numpy is in the venv; kept local for a light surface
+
+    offset = float(source_start)
+    count = len(all_words)
+    # ``fmax`` clamps like ``max(0.0, t - offset)`` in :func:`caption.rebase_cue_time`,
+    # including a NaN time pinning to 0 rather than propagating.
+    starts = np.fmax(np.fromiter((w["start"] for w in all_words), float, count) - offset, 0.0)
+    ends = np.fmax(np.fromiter((w["end"] for w in all_words), float, count) - offset, 0.0)
+    kept = ends > starts  # False: entirely before the clip (or zero-length after re-base)
+    keep = kept.tolist()
+    palette = resolved.active_colors
+    spoken_color = resolved.spoken_color
+    texts: list[str] = []
     for line in group_into_lines(all_words):
-        for active_index, word in enumerate(line):
-            color = active_color_for_index(global_index, resolved.active_colors)
+        escaped = _escaped_words(line, upper)
+        for active_index in range(len(line)):
+            if keep[global_index]:
+                color = active_color_for_index(global_index, palette)
+                texts.append(_assemble_line(escaped, active_index, color, spoken_color))
             global_index += 1
-            start = rebase_cue_time(word.get("start", 0.0), source_start)
-            end = rebase_cue_time(word.get("end", 0.0), source_start)
-            if end <= start:
-                continue  # entirely before the clip (or zero-length after re-base)
-            text = build_line_text(line, active_index, color, uppercase=upper, spoken_color=resolved.spoken_color)
-            events.append(
-                f"Dialogue: 0,{format_ass_timestamp(start)},{format_ass_timestamp(end)},Default,,0,0,0,,{text}"
-            )
+    doc.extend(
+        f"Dialogue: 0,{start},{end},Default,,0,0,0,,{text}"
+        for start, end, text in zip(
+            format_ass_timestamps(starts[kept]), format_ass_timestamps(ends[kept]), texts, strict=True
+        )
+    )
 
     # LF line endings for cross-platform determinism (tests assert exact content).
-    return "\n".join(header + events) + "\n"
+    # The trailing "" supplies the final newline within the single join (no
+    # ``header + events`` list copy, no ``+ "\n"`` copy of the whole document).
+    doc.append("")
+    return "\n".join(doc)
 
 
 __all__ = [
@@ -30,6 +30,7 @@ override degrades field-by-field to the template default; it never raises.
 
 from __future__ import annotations
 
+import functools
 import math
 import re
 from collections.abc import Mapping
@@ -101,6 +102,18 @@ def hex_to_ass_color(value: Any, alpha: str = "00") -> str | None:
     """
     if not isinstance(value, str):
         return None
+    return _hex_str_to_ass_color(value, alpha)
+
+
+@functools.lru_cache(maxsize=256)
+def _hex_str_to_ass_color(value: str, alpha: str) -> str | None:
+    """The string path of :func:`hex_to_ass_color`, memoised per ``(value, alpha)``.
+
+    A style only ever names a handful of colours (text / active / spoken), yet
+    every render re-resolves them; the cache turns each repeat into a dict hit
+    instead of a strip + regex match + slice + ``upper``. Bounded because the
+    values come off the wire.
+    """
     s = value.strip()
     if not _HEX_COLOR.match(s):
         return None
@@ -148,7 +161,7 @@ def _clamp_size_scale(value: Any) -> float:
     return float(value)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ResolvedCaptionStyle:
     """The fully-resolved libass body-caption visual after override merge.
 
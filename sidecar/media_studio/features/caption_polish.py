@@ -31,6 +31,7 @@ stage ever raises on a missing model.
 
 from __future__ import annotations
 
+import functools
 import math
 import re
 from collections.abc import Callable, Sequence
@@ -198,17 +199,22 @@ def wrap_two_lines(text: str, max_cpl: int = MAX_CPL, max_lines: int = MAX_LINES
     if not words:
         return ""
     lines: list[str] = []
-    current = ""
+    # The open line as its words + running joined length, so a candidate word is
+    # measured in O(1) instead of re-building the whole line string per word.
+    current: list[str] = []
+    current_len = 0
     for word in words:
-        candidate = f"{current} {word}".strip()
-        if current and len(candidate) > max_cpl and len(lines) < max_lines - 1:
-            lines.append(current)
-            current = word
+        candidate_len = current_len + 1 + len(word) if current else len(word)
+        if current and candidate_len > max_cpl and len(lines) < max_lines - 1:
+            lines.append(" ".join(current))
+            current = [word]
+            current_len = len(word)
         else:
-            current = candidate
+            current.append(word)
+            current_len = candidate_len
     # ``words`` is non-empty here (guarded above) and ``str.split`` never yields
     # empty tokens, so ``current`` always holds the trailing line.
-    lines.append(current)
+    lines.append(" ".join(current))
     return "\n".join(lines)
 
 
@@ -221,17 +227,20 @@ def _split_text_by_chars(text: str, limit: int) -> list[str]:
     non-empty text, so the result is never empty.
     """
     chunks: list[str] = []
-    current = ""
+    current: list[str] = []
+    current_len = 0
     for word in text.split():
-        candidate = f"{current} {word}".strip()
-        if current and len(candidate) > limit:
-            chunks.append(current)
-            current = word
+        candidate_len = current_len + 1 + len(word) if current else len(word)
+        if current and candidate_len > limit:
+            chunks.append(" ".join(current))
+            current = [word]
+            current_len = len(word)
         else:
-            current = candidate
+            current.append(word)
+            current_len = candidate_len
     # Only ever called with non-empty text (``enforce_cps_cpl`` guards), so the
     # loop always runs and ``current`` holds the trailing chunk.
-    chunks.append(current)
+    chunks.append(" ".join(current))
     return chunks
 
 
@@ -354,6 +363,31 @@ def enforce_min_gap(cues: list[Cue], *, fps: float = DEFAULT_FPS) -> list[Cue]:
 # --------------------------------------------------------------------------- #
 # pure: emphasis + profanity application (model-fed, but applied with pure code)
 # --------------------------------------------------------------------------- #
+def _keyword_pattern(keywords: Sequence[str]) -> tuple[re.Pattern[str], ...] | None:
+    """One whole-word pattern per usable keyword, or ``None`` when none is usable.
+
+    The keywords are normalized (stripped, lower-cased, blanks and duplicates
+    dropped). Each keyword keeps its OWN ``finditer`` scan, so one keyword's
+    matches never overlap each other (a self-overlapping multi-word keyword such
+    as ``"bb bb"`` in ``"bb bb bb"`` matches once, not at every start).
+    """
+    norms = sorted({str(kw or "").strip().lower() for kw in keywords} - {""})
+    if not norms:
+        return None
+    return _compile_keyword_pattern(tuple(norms))
+
+
+@functools.lru_cache(maxsize=64)
+def _compile_keyword_pattern(norms: tuple[str, ...]) -> tuple[re.Pattern[str], ...]:
+    """Compile (once per distinct normalized keyword set) the :func:`_keyword_pattern` regexes.
+
+    A keyword backend often returns the same salient words for neighbouring
+    cues of one clip, so the escaped patterns are compiled once and reused
+    across calls instead of per cue.
+    """
+    return tuple(re.compile(rf"\b{re.escape(kw)}\b") for kw in norms)
+
+
 def apply_emphasis_spans(
     cue: Cue,
     keywords: Sequence[str],
@@ -369,13 +403,14 @@ def apply_emphasis_spans(
     """
     text = str(cue.get("text", "") or "")
     spans = list(_emphasis.find_emphasis_spans(text))
-    lowered = text.lower()
-    for kw in keywords:
-        kw_norm = str(kw or "").strip().lower()
-        if not kw_norm:
-            continue
-        for match in re.finditer(rf"\b{re.escape(kw_norm)}\b", lowered):
-            spans.append({"start": match.start(), "end": match.end(), "kind": "keyword"})
+    patterns = _keyword_pattern(keywords)
+    if patterns is not None:
+        lowered = text.lower()
+        spans.extend(
+            {"start": match.start(), "end": match.end(), "kind": "keyword"}
+            for pattern in patterns
+            for match in pattern.finditer(lowered)
+        )
     out = dict(cue)
     out["emphasis"] = _emphasis.normalize_spans(spans, len(text))
     out["emoji"] = _emphasis.pick_emoji(text)
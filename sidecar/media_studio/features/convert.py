@@ -45,7 +45,9 @@ untrusted renderer over the generic RPC bridge:
 from __future__ import annotations
 
 import os
+import threading
 from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
@@ -53,7 +55,7 @@ from .. import ffmpeg
 from ..jobs import JobContext
 from ..pathsafe import PathTraversalError, ensure_local_media_input, ensure_under
 from ..settings_store import default_config_dir
-from ..util import clamp_pct, get_logger
+from ..util import clamp, clamp_pct, get_logger
 
 log = get_logger("media_studio.convert")
 
@@ -66,6 +68,16 @@ ProbeFn = Callable[..., float]
 # A library-style source resolver: videoId -> absolute path (or None if unknown).
 SourceResolver = Callable[[str], str | None]
 
+#: Settings key: how many batch items may run ffmpeg at once. Opt-in: overlapping
+#: conversions keep the machine busy through the single-threaded stretches of each
+#: (probe, demux, mux, remux-only jobs), but a consumer GPU caps its concurrent
+#: encode sessions, so a batch converts one item at a time unless asked otherwise.
+CONVERT_CONCURRENCY_KEY = "convertConcurrency"
+#: Default worker count: the strictly serial batch.
+DEFAULT_CONVERT_CONCURRENCY = 1
+#: Upper clamp for an explicit ``convertConcurrency``.
+MAX_CONVERT_CONCURRENCY = 8
+
 # CONTRACT-NOTE: §2 only names the option keys, not the file extensions. We map
 # audioFormat / container to sensible default extensions; an explicit ``out`` in
 # the item overrides all derivation, and an unrecognised value is used verbatim
@@ -223,6 +235,7 @@ def convert_one(
     should_cancel: Callable[[], bool] | None = None,
     run: RunFn = ffmpeg.run,
     probe: ProbeFn = ffmpeg.ffprobe_duration,
+    threads: int | None = None,
 ) -> str:
     """Convert a single ``item`` and return the output path.
 
@@ -233,6 +246,7 @@ def convert_one(
     returned. A non-zero ffmpeg exit raises :class:`RuntimeError`; a non-local
     input raises ``UnsafeMediaInputError`` and an out-of-bounds destination
     ``PathTraversalError`` (both ``ValueError``s), BEFORE ffmpeg is spawned.
+    ``threads`` is forwarded to the argv builder (see :func:`threads_per_process`).
     """
     in_path = _resolve_source(item, resolver)
     options = item.get("options") or {}
@@ -246,7 +260,7 @@ def convert_one(
         log.warning("duration probe failed for %s; progress will be coarse", in_path)
         total_sec = 0.0
 
-    argv = ffmpeg.build_convert_argv(in_path, out_path, options, settings)
+    argv = ffmpeg.build_convert_argv(in_path, out_path, options, settings, threads=threads)
     code = run(
         argv,
         total_sec=total_sec,
@@ -258,6 +272,32 @@ def convert_one(
     return out_path
 
 
+def resolve_concurrency(settings: dict[str, Any] | None, n_items: int) -> int:
+    """How many of ``n_items`` batch conversions run at once (``>= 1``).
+
+    An explicit integer ``convertConcurrency`` wins (clamped to
+    ``1..``:data:`MAX_CONVERT_CONCURRENCY`; ``1`` means one at a time); absent, a
+    non-integer, or a ``bool`` falls back to :data:`DEFAULT_CONVERT_CONCURRENCY`.
+    Never more than there are items.
+    """
+    raw = (settings or {}).get(CONVERT_CONCURRENCY_KEY)
+    if isinstance(raw, int) and not isinstance(raw, bool):
+        workers = int(clamp(raw, 1, MAX_CONVERT_CONCURRENCY))
+    else:
+        workers = DEFAULT_CONVERT_CONCURRENCY
+    return max(1, min(workers, n_items))
+
+
+def threads_per_process(workers: int) -> int:
+    """ffmpeg threads for each of ``workers`` concurrent conversions (``>= 1``).
+
+    Left alone, every ffmpeg sizes its encoder and filter pools to ALL cores, so
+    N side-by-side conversions run N x cores threads and thrash each other's
+    caches. Splitting the cores evenly keeps the total at roughly one per core.
+    """
+    return max(1, (os.cpu_count() or 1) // max(1, workers))
+
+
 def convert_batch(
     items: Sequence[dict[str, Any]],
     *,
@@ -268,15 +308,39 @@ def convert_batch(
     run: RunFn = ffmpeg.run,
     probe: ProbeFn = ffmpeg.ffprobe_duration,
 ) -> list[str]:
-    """Convert each item in turn, returning the list of output paths (in order).
+    """Convert every item, returning the list of output paths (in order).
 
     Progress is spread evenly across the items: item ``i`` of ``n`` reports
     ``(i*100 + per_item_pct) / n`` overall, so a 4-item batch climbs 0->25->...
     smoothly. Cancellation is honored between items (and within an item, via the
     ``should_cancel`` seam handed to :func:`ffmpeg.run`).
+
+    Up to :func:`resolve_concurrency` items run at once (see
+    :func:`_convert_concurrently`); with one worker the items run strictly in
+    turn. A batch whose items would write the same output file always runs in
+    turn, so two ffmpegs never race on one path.
+
+    The returned list is always a PREFIX of the items' outputs: ``paths[k]`` is
+    the output of ``items[k]``. A cancelled batch returns the leading items that
+    finished and omits everything from the first item that did not.
     """
     items = list(items)
     n = len(items)
+    workers = resolve_concurrency(settings, n)
+    if workers > 1 and not _distinct_outputs(items, resolver):
+        log.warning("convert batch items share an output path; converting one at a time")
+        workers = 1
+    if workers > 1:
+        return _convert_concurrently(
+            items,
+            workers,
+            settings=settings,
+            resolver=resolver,
+            on_progress=on_progress,
+            should_cancel=should_cancel,
+            run=run,
+            probe=probe,
+        )
     paths: list[str] = []
 
     for i, item in enumerate(items):
@@ -305,6 +369,91 @@ def convert_batch(
     return paths
 
 
+def _distinct_outputs(items: Sequence[dict[str, Any]], resolver: SourceResolver | None) -> bool:
+    """True iff every item resolves and writes a different output file.
+
+    An item that does not resolve also answers ``False``: the serial path then
+    raises its error in item order, after the items before it have converted.
+    """
+    seen: set[str] = set()
+    for item in items:
+        try:
+            in_path = _resolve_source(item, resolver)
+        except ValueError:
+            return False
+        out = output_path(in_path, item.get("options") or {}, item.get("out"))
+        key = os.path.normcase(os.path.realpath(out))
+        if key in seen:
+            return False
+        seen.add(key)
+    return True
+
+
+def _convert_concurrently(
+    items: list[dict[str, Any]],
+    workers: int,
+    *,
+    settings: dict[str, Any] | None,
+    resolver: SourceResolver | None,
+    on_progress: Callable[[float, str], None] | None,
+    should_cancel: Callable[[], bool] | None,
+    run: RunFn,
+    probe: ProbeFn,
+) -> list[str]:
+    """:func:`convert_batch` with ``workers`` ffmpeg processes in flight.
+
+    Overall progress is the mean of the per-item percentages (each kept
+    forward-only), emitted under one lock so the job sees a monotonic bar.
+    Cancellation — or any item failing — stops items that have not started
+    yet; items already running finish. The first failure in item order is
+    re-raised after the pool drains, matching the serial path's error. Each
+    ffmpeg gets its share of the cores (:func:`threads_per_process`). The result
+    stops at the first item that never ran, so it is the same completed prefix
+    the serial loop returns.
+    """
+    n = len(items)
+    lock = threading.Lock()
+    item_pcts = [0.0] * n
+    failed = threading.Event()
+    threads = threads_per_process(workers)
+
+    def _one(i: int) -> str | None:
+        if failed.is_set() or (should_cancel is not None and should_cancel()):
+            return None
+
+        def _item_progress(pct: float, message: str) -> None:
+            assert on_progress is not None
+            with lock:
+                item_pcts[i] = max(item_pcts[i], max(0.0, min(100.0, pct)))
+                on_progress(sum(item_pcts) / n, f"[{i + 1}/{n}] {message}")
+
+        try:
+            return convert_one(
+                items[i],
+                settings=settings,
+                resolver=resolver,
+                on_progress=_item_progress if on_progress is not None else None,
+                should_cancel=should_cancel,
+                run=run,
+                probe=probe,
+                threads=threads,
+            )
+        except BaseException:
+            failed.set()
+            raise
+
+    log.info("converting %d item(s), %d at a time, %d thread(s) each", n, workers, threads)
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="convert") as pool:
+        futures = [pool.submit(_one, i) for i in range(n)]
+    results = [fut.result() for fut in futures]  # re-raises the first failure, in item order
+    paths: list[str] = []
+    for out in results:
+        if out is None:
+            break
+        paths.append(out)
+    return paths
+
+
 # --------------------------------------------------------------------------- #
 # Job handlers (wire convert_one / convert_batch onto JobContext)
 # --------------------------------------------------------------------------- #
@@ -386,6 +535,8 @@ __all__ = [
     "output_path",
     "convert_one",
     "convert_batch",
+    "resolve_concurrency",
+    "threads_per_process",
     "start_handler",
     "batch_handler",
     "clamp_pct",
@@ -78,20 +78,22 @@ def _decode_pcm_or_raise(
     stderr: bytes | None,
     *,
     target_sr: int,
+    as_float64: bool = True,
 ) -> tuple[np.ndarray, int]:
     """Turn an ffmpeg result into ``(samples, sr)`` — or raise on a bad exit.
 
     The PURE, fully-tested core of :func:`_default_audio_loader`: on a non-zero
     ``returncode`` it raises :class:`AudioDecodeError` with the stderr tail (F3b);
-    otherwise it reads the f32le PCM bytes into a float64 array.
+    otherwise it reads the f32le PCM bytes into a float64 array (or, with
+    ``as_float64=False``, a zero-copy float32 view — what faster-whisper takes).
     """
     import numpy as _np  # noqa: PLC0415 - numpy is in the venv; kept lazy for symmetry
 
     if returncode != 0:
         tail = (stderr or b"").decode("utf-8", errors="replace").strip()[-_FFMPEG_STDERR_TAIL:]
         raise AudioDecodeError(f"ffmpeg audio decode failed (exit {returncode}): {tail}")
-    samples = _np.frombuffer(raw or b"", dtype=_np.float32).astype(_np.float64)
-    return samples, target_sr
+    samples = _np.frombuffer(raw or b"", dtype=_np.float32)
+    return (samples.astype(_np.float64) if as_float64 else samples), target_sr
 
 
 # --------------------------------------------------------------------------- #
@@ -178,6 +180,8 @@ class CtcAlignBackend(Protocol):
 
 #: factory seam: default = lazy real impl; tests inject a fake.
 BackendFactory = Callable[[dict[str, Any], str], CtcAlignBackend]
+#: the sample rate of the default ffmpeg decode (the aligner's and whisper's rate).
+PCM_SAMPLE_RATE = 16000
 #: audio decode seam: path -> (mono samples float array, sample-rate). The
 #: default lazily uses ffmpeg -> numpy (NO heavy-ML dep: ffmpeg + numpy only).
 AudioLoader = Callable[[str], "tuple[np.ndarray, int]"]
@@ -335,8 +339,10 @@ def _default_backend_factory(
     return RealCtcAlignBackend(settings, model_id)
 
 
-def _default_audio_loader(media_path: str) -> tuple[np.ndarray, int]:  # pragma: no cover - needs ffmpeg + a real file
-    """Decode ``media_path`` to mono float samples at 16 kHz via ffmpeg.
+def _decode_pcm_16k(
+    media_path: str, *, as_float64: bool
+) -> tuple[np.ndarray, int]:  # pragma: no cover - needs ffmpeg + a real file
+    """Decode ``media_path`` to mono samples at 16 kHz via ffmpeg.
 
     Excluded from coverage: it spawns ffmpeg and reads a real media file (the
     pure logic + the seam branches are covered with a fake loader). Lives here
@@ -346,7 +352,7 @@ def _default_audio_loader(media_path: str) -> tuple[np.ndarray, int]:  # pragma:
 
     from .. import ffmpeg  # noqa: PLC0415 - avoids a top-level import cycle
 
-    target_sr = 16000
+    target_sr = PCM_SAMPLE_RATE
     argv = [
         ffmpeg.ffmpeg_path(None),
         "-hide_banner",
@@ -364,7 +370,25 @@ def _default_audio_loader(media_path: str) -> tuple[np.ndarray, int]:  # pragma:
     completed = subprocess.run(argv, capture_output=True, check=False)  # noqa: S603 - argv list, no shell
     # F3b: honour the returncode — a non-zero exit raises (with the stderr tail)
     # instead of silently returning an empty/garbage buffer.
-    return _decode_pcm_or_raise(completed.returncode, completed.stdout, completed.stderr, target_sr=target_sr)
+    return _decode_pcm_or_raise(
+        completed.returncode, completed.stdout, completed.stderr, target_sr=target_sr, as_float64=as_float64
+    )
+
+
+def _default_audio_loader(media_path: str) -> tuple[np.ndarray, int]:  # pragma: no cover - needs ffmpeg + a real file
+    """Decode ``media_path`` to mono float64 samples at 16 kHz via ffmpeg."""
+    return _decode_pcm_16k(media_path, as_float64=True)
+
+
+def load_pcm_16k(media_path: str) -> tuple[np.ndarray, int]:  # pragma: no cover - needs ffmpeg + a real file
+    """Decode ``media_path`` to mono float32 samples at 16 kHz via ffmpeg.
+
+    The shared-decode form of :func:`_default_audio_loader`: float32 16 kHz mono
+    is exactly the array faster-whisper's ``transcribe`` accepts, so a job that
+    transcribes AND aligns decodes the file once and hands the same buffer to
+    both (``align_words`` widens it to float64 itself).
+    """
+    return _decode_pcm_16k(media_path, as_float64=False)
 
 
 def default_models_present(
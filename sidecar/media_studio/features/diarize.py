@@ -28,6 +28,7 @@ deciding "may I fetch a missing model right now?".
 
 from __future__ import annotations
 
+import bisect
 import math
 from collections.abc import Callable, Sequence
 from typing import Any, Protocol
@@ -70,6 +71,8 @@ ECAPA_SIZE_MB = 80
 
 #: the asset names diarization needs present before it can run.
 REQUIRED_ASSETS: tuple[str, ...] = (VAD_ASSET_NAME, ECAPA_ASSET_NAME)
+#: the VAD-only (single-speaker) path never embeds, so it needs just the VAD.
+VAD_ONLY_ASSETS: tuple[str, ...] = (VAD_ASSET_NAME,)
 
 
 # --------------------------------------------------------------------------- #
@@ -87,11 +90,6 @@ def cosine_similarity(a: Embedding, b: Embedding) -> float:
     return dot / (na * nb)
 
 
-def _add_into(acc: list[float], vec: Embedding) -> list[float]:
-    """Element-wise add ``vec`` into a running sum (for incremental centroids)."""
-    return [a + float(v) for a, v in zip(acc, vec, strict=True)]
-
-
 def greedy_cluster(
     embeddings: Sequence[Embedding],
     *,
@@ -102,29 +100,58 @@ def greedy_cluster(
     Walks the embeddings in time order; each is assigned to the existing cluster
     whose **centroid** is most cosine-similar, opening a NEW cluster when even
     the best similarity is below ``threshold``. Centroids are the running MEAN of
-    their members (kept as sum + count for an exact incremental mean). The first
-    embedding always starts cluster 0. Deterministic; O(n·k).
+    their members. The first embedding always starts cluster 0. Deterministic;
+    O(n·k).
+
+    The per-cluster comparisons are ONE matrix-vector product per embedding: the
+    centroids are kept as running member SUMS in the rows of a ``(k, d)`` float64
+    matrix — cosine is scale-invariant, so a sum scores exactly like its mean and
+    no division by the member count (or re-normalization) is ever needed. Each
+    row's inverse norm is cached and refreshed only when that row changes, so a
+    comparison is ``(sums @ v) * inv_norms`` with the embedding's own norm
+    applied to the winner alone. ``argmax`` takes the FIRST best, so ties still
+    go to the earliest cluster.
     """
+    import numpy as np  # noqa: PLC0415 - numpy is a venv dep; kept out of import time
+
     labels: list[int] = []
-    sums: list[list[float]] = []
-    counts: list[int] = []
+    if not embeddings:
+        return labels
+    dim = len(embeddings[0])
     for vec in embeddings:
-        vec_list = [float(v) for v in vec]
+        if len(vec) != dim:
+            raise ValueError(f"embedding length mismatch: {len(vec)} vs {dim}")
+    # The whole (n, d) embedding matrix and every row norm are built in ONE
+    # conversion + ONE vectorized norm, so the loop below only indexes rows.
+    matrix = np.asarray(embeddings, dtype=np.float64).reshape(len(embeddings), dim)
+    vec_norms = np.linalg.norm(matrix, axis=1).tolist()
+    # At most one cluster per embedding, so the rows never need to grow.
+    sums = np.zeros((len(embeddings), dim), dtype=np.float64)
+    # 1/||sum|| per row; 0.0 for a zero row, so it scores 0.0 like cosine_similarity.
+    inv_norms = np.zeros(len(embeddings), dtype=np.float64)
+    k = 0
+    for v, v_norm in zip(matrix, vec_norms, strict=True):
         best_idx = -1
         best_sim = -1.0
-        for idx, (s, c) in enumerate(zip(sums, counts, strict=True)):
-            centroid = [v / c for v in s]
-            sim = cosine_similarity(vec_list, centroid)
+        if k and v_norm != 0.0:
+            # Scaled by the (positive) ||v|| only after the argmax: same winner.
+            scores = (sums[:k] @ v) * inv_norms[:k]
+            idx = int(scores.argmax())
+            sim = float(scores[idx]) / v_norm
             if sim > best_sim:
-                best_sim = sim
-                best_idx = idx
+                best_idx, best_sim = idx, sim
+        elif k:
+            # A zero vector scores 0.0 against every centroid -> the first wins.
+            best_idx, best_sim = 0, 0.0
         if best_idx < 0 or best_sim < threshold:
-            sums.append(list(vec_list))
-            counts.append(1)
-            labels.append(len(sums) - 1)
+            sums[k] = v
+            inv_norms[k] = 1.0 / v_norm if v_norm else 0.0
+            labels.append(k)
+            k += 1
         else:
-            sums[best_idx] = _add_into(sums[best_idx], vec_list)
-            counts[best_idx] += 1
+            sums[best_idx] += v
+            row_norm = float(np.linalg.norm(sums[best_idx]))
+            inv_norms[best_idx] = 1.0 / row_norm if row_norm else 0.0
             labels.append(best_idx)
     return labels
 
@@ -134,6 +161,33 @@ def speaker_label(index: int) -> str:
     return f"SPEAKER_{int(index):02d}"
 
 
+#: Unmatched segments scored per broadcast block in the nearest-region fallback,
+#: bounding the ``(block, regions)`` distance matrix on a long, sparse diarization.
+_NEAREST_BLOCK = 1024
+
+
+def _nearest_regions(starts: Sequence[float], ends: Sequence[float], mids: Sequence[float]) -> list[int]:
+    """Index of the region nearest each ``mid`` (0 inside a span, else the closer edge).
+
+    All unmatched mid-points are scored against every region at once — a
+    ``(mids, 1)`` vs ``(1, regions)`` broadcast, in blocks of ``_NEAREST_BLOCK``
+    rows — instead of one numpy pass per segment. ``argmin`` returns the FIRST
+    minimum per row, so ties keep input order exactly like the builtin ``min``.
+    """
+    import numpy as np  # noqa: PLC0415 - numpy is a venv dep; kept out of import time
+
+    r_starts = np.asarray(starts, dtype=np.float64)[None, :]
+    r_ends = np.asarray(ends, dtype=np.float64)[None, :]
+    points = np.asarray(mids, dtype=np.float64)[:, None]
+    nearest: list[int] = []
+    for lo in range(0, len(points), _NEAREST_BLOCK):
+        mid = points[lo : lo + _NEAREST_BLOCK]
+        dist = np.minimum(np.abs(mid - r_starts), np.abs(mid - r_ends))
+        dist[(r_starts <= mid) & (mid <= r_ends)] = 0.0
+        nearest.extend(int(i) for i in dist.argmin(axis=1))
+    return nearest
+
+
 def assign_speakers_to_segments(
     segments: Sequence[Segment],
     regions: Sequence[dict[str, Any]],
@@ -146,32 +200,69 @@ def assign_speakers_to_segments(
     the greatest TEMPORAL OVERLAP (its mid-point's region if none overlaps).
     Segments with no region match keep ``speaker = ""``. Returns new dicts — the
     input segments are never mutated (coding-style: immutability).
+
+    A sorted sweep, not an all-pairs scan: regions and segments are both visited
+    in start order, a cursor skips the leading regions that ended before the
+    current segment began, and only the regions starting before the segment ends
+    (a ``bisect`` bound) are scored. The cursor stops at the first region still
+    open, so one long early region keeps every later region in the scored window:
+    the worst case stays O(n·m). Diarized regions are short and mostly disjoint,
+    so in practice each segment scores only the few regions around it. The
+    mid-point fallback (the one step that must look at EVERY region) runs once,
+    after the sweep, as a single numpy broadcast over all unmatched segments.
+    Ties still resolve to the EARLIEST region in input order, and the output
+    keeps the input segment order.
     """
-    region_spans = [
-        (float(r.get("start", 0.0)), float(r.get("end", 0.0)), speaker_label(cluster_labels[i]))
-        for i, r in enumerate(regions)
-        if i < len(cluster_labels)
-    ]
-    out: list[Segment] = []
-    for seg in segments:
+    # Regions are held as parallel columns (structure-of-arrays), not per-region
+    # tuples: the sweep reads plain float lists and the fallback hands the same
+    # columns straight to numpy. Regions past the end of ``cluster_labels`` carry
+    # no label and are ignored.
+    n = min(len(regions), len(cluster_labels))
+    if n == 0:
+        # Nothing to match (silence-only audio / no labelled regions): skip the
+        # sorts and the sweep — every segment just gets the blank label.
+        return [{**seg, "speaker": ""} for seg in segments]
+    r_starts = [float(regions[i].get("start", 0.0)) for i in range(n)]
+    r_ends = [float(regions[i].get("end", 0.0)) for i in range(n)]
+    r_labels = [speaker_label(cluster_labels[i]) for i in range(n)]
+    # A stable sort by start keeps input order among equal starts — the tie-break
+    # that preserves the scan's "first region wins" semantics once re-ordered.
+    by_start = sorted(range(n), key=r_starts.__getitem__)
+    sorted_starts = [r_starts[i] for i in by_start]
+    sorted_ends = [r_ends[i] for i in by_start]
+    seg_order = sorted(range(len(segments)), key=lambda i: float(segments[i].get("start", 0.0)))
+    labels: list[str] = [""] * len(segments)
+    unmatched: list[int] = []  # segments no region overlaps -> nearest-region fallback
+    lo = 0
+    for seg_idx in seg_order:
+        seg = segments[seg_idx]
         s_start = float(seg.get("start", 0.0))
         s_end = float(seg.get("end", 0.0))
-        best_label = ""
+        # Segments arrive in start order, so a region that ended before THIS
+        # segment began cannot overlap any later one either.
+        while lo < n and sorted_ends[lo] <= s_start:
+            lo += 1
+        best_idx = -1
         best_overlap = 0.0
-        for r_start, r_end, label in region_spans:
-            overlap = min(s_end, r_end) - max(s_start, r_start)
-            if overlap > best_overlap:
+        # Only regions starting before the segment ends can overlap it: bisect
+        # that bound once instead of re-testing each start inside the scan.
+        for j in range(lo, bisect.bisect_left(sorted_starts, s_end, lo)):
+            r_start = sorted_starts[j]
+            r_end = sorted_ends[j]
+            r_idx = by_start[j]
+            overlap = (s_end if s_end < r_end else r_end) - (s_start if s_start > r_start else r_start)
+            if overlap > best_overlap or (overlap == best_overlap and best_idx >= 0 and r_idx < best_idx):
                 best_overlap = overlap
-                best_label = label
-        if not best_label and region_spans:
-            mid = (s_start + s_end) / 2.0
-            # nearest region by mid-point distance to its span
-            best_label = min(
-                region_spans,
-                key=lambda rs: 0.0 if rs[0] <= mid <= rs[1] else min(abs(mid - rs[0]), abs(mid - rs[1])),
-            )[2]
-        out.append({**seg, "speaker": best_label})
-    return out
+                best_idx = r_idx
+        if best_idx >= 0:
+            labels[seg_idx] = r_labels[best_idx]
+        else:
+            unmatched.append(seg_idx)
+    if unmatched:
+        mids = [(float(segments[i].get("start", 0.0)) + float(segments[i].get("end", 0.0))) / 2.0 for i in unmatched]
+        for seg_idx, r_idx in zip(unmatched, _nearest_regions(r_starts, r_ends, mids), strict=True):
+            labels[seg_idx] = r_labels[r_idx]
+    return [{**seg, "speaker": label} for seg, label in zip(segments, labels, strict=True)]
 
 
 def roster(cluster_labels: Sequence[int]) -> list[str]:
@@ -186,7 +277,8 @@ def rename_speakers(transcript: Transcript, mapping: dict[str, str]) -> Transcri
     top-level ``speakers`` roster are rewritten through it; labels not in the
     mapping pass through unchanged. Returns a NEW transcript dict — the input is
     never mutated (mirrors :func:`assign_speakers_to_segments`). Segments without
-    a ``speaker`` key are left as-is (no key is added).
+    a ``speaker`` key are left as-is (no key is added). Every segment is copied,
+    so editing the result can never reach back into the input.
     """
     segments: list[Segment] = []
     for seg in transcript.get("segments") or []:
@@ -381,16 +473,18 @@ class Diarize:
 # --------------------------------------------------------------------------- #
 # default heavy seams (lazy real impls; tests inject fakes)
 # --------------------------------------------------------------------------- #
-def default_models_present(settings: dict[str, Any]) -> bool:
-    """True when BOTH gated SpeechBrain assets are installed (no import).
+def default_models_present(settings: dict[str, Any], *, required: Sequence[str] = REQUIRED_ASSETS) -> bool:
+    """True when every ``required`` SpeechBrain asset is installed (no import).
 
-    Uses the asset manager's installed-detection so an already-cached HF
-    snapshot counts — that is what makes offline diarization possible.
+    Defaults to BOTH gated assets; the VAD-only path passes
+    :data:`VAD_ONLY_ASSETS`. Uses the asset manager's installed-detection so an
+    already-cached HF snapshot counts — that is what makes offline diarization
+    possible.
     """
     from ..assets.manager import AssetManager  # noqa: PLC0415 - lazy: avoids a cycle
 
     mgr = AssetManager(settings_provider=lambda: settings)
-    for name in REQUIRED_ASSETS:
+    for name in required:
         entry = manifest.get_asset(name)
         if entry is None or mgr.installed_path(entry) is None:
             return False
@@ -477,6 +571,7 @@ __all__ = [
     "ECAPA_ASSET_NAME",
     "REQUIRED_ASSETS",
     "VAD_ASSET_NAME",
+    "VAD_ONLY_ASSETS",
     "Diarize",
     "DiarizerBackend",
     "assign_speakers_to_segments",
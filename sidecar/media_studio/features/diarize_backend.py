@@ -37,7 +37,9 @@ imports are all inside methods, and it registers no assets as a side effect).
 
 from __future__ import annotations
 
+import contextlib
 import re
+from collections.abc import Sequence
 from typing import Any
 
 from ..assets import manifest
@@ -70,6 +72,27 @@ HOP_SEC = 1.25
 #: Drop a trailing sub-window shorter than this (too little speech to embed well).
 MIN_WINDOW_SEC = 0.5
 
+#: Adjacent VAD speech regions separated by at most this pause (seconds) are
+#: merged BEFORE windowing. VAD splits one speaker's turn at every breath, and each
+#: fragment paid its own clipped trailing window (and fragments under
+#: ``MIN_WINDOW_SEC`` were dropped unembedded); merging first slides the windows
+#: across the whole turn, so there are fewer, fuller windows to embed.
+VAD_MERGE_GAP_SEC = 0.3
+
+#: Windows embedded per ECAPA forward pass. One ``encode_batch`` per window paid a
+#: model launch (and, on CUDA, a sync) for ~2.5 s of audio; batching amortizes
+#: that while the cap keeps a long file from padding into one giant tensor.
+EMBED_BATCH_SIZE = 32
+
+#: Settings key for the ECAPA forward precision: ``"fp32"`` (default) or
+#: ``"fp16"``. fp16 runs the forward under CUDA autocast (tensor cores, half the
+#: activation memory); the pooled embeddings are cast back to fp32 before they
+#: leave the backend, so clustering math is unchanged. Opt-in because
+#: :data:`SUBWINDOW_CLUSTER_THRESHOLD` was tuned on fp32 vectors.
+EMBEDDING_PRECISION_KEY = "diarizeEmbeddingPrecision"
+PRECISION_FP32 = "fp32"
+PRECISION_FP16 = "fp16"
+
 #: Cosine-similarity clustering threshold for the SUB-WINDOW regime. ECAPA vectors
 #: from ~2.5 s windows sit a little lower than from full utterances, so this floor
 #: (below the long-utterance default 0.50 in ``diarize.DEFAULT_THRESHOLD``) keeps
@@ -233,6 +256,122 @@ def _fetch_safe_audio_path(audio_path: str) -> str:
     return str(audio_path).replace("\\", "/")
 
 
+#: The constant "embedding" the VAD-only path stamps on every speech region.
+#: Identical vectors are cosine-1.0 to their own centroid, so the unchanged greedy
+#: clustering puts every region in cluster 0 -> a single ``SPEAKER_00``.
+SINGLE_SPEAKER_EMBEDDING: tuple[float, ...] = (1.0,)
+
+
+def single_speaker_regions(boundaries: Any) -> tuple[list[dict[str, Any]], list[list[float]]]:
+    """VAD ``[start, end]`` rows -> ``(regions, embeddings)`` for ONE speaker.
+
+    The VAD-only backend's whole output: each speech region becomes a region as
+    detected (no sub-windowing — there are no turns to resolve) carrying
+    :data:`SINGLE_SPEAKER_EMBEDDING`, so ``diarize.diarize_transcript`` labels it
+    without the ECAPA pass. Empty / zero-length rows are dropped.
+    """
+    regions: list[dict[str, Any]] = []
+    for row in boundaries:
+        start = float(row[0])
+        end = float(row[1])
+        if end > start:
+            regions.append({"start": start, "end": end})
+    return regions, [list(SINGLE_SPEAKER_EMBEDDING) for _ in regions]
+
+
+def merge_speech_regions(boundaries: Any, max_gap: float = VAD_MERGE_GAP_SEC) -> list[tuple[float, float]]:
+    """VAD ``[start, end]`` rows -> time-ordered regions with short pauses bridged.
+
+    Regions whose gap to the previous (merged) region is at most ``max_gap`` are
+    fused into one, so :func:`sliding_windows` embeds a turn broken by breaths as
+    ONE region instead of a run of short clipped fragments. Empty / inverted rows
+    are dropped first.
+    """
+    rows = sorted((float(row[0]), float(row[1])) for row in boundaries)
+    merged: list[tuple[float, float]] = []
+    for start, end in rows:
+        if end <= start:
+            continue
+        if merged and start - merged[-1][1] <= max_gap:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def sliding_windows(boundaries: Any) -> list[tuple[float, float]]:
+    """Slide a fixed window across each VAD region -> sub-segment spans.
+
+    VAD detects speech, not speaker turns, so each speech region may span
+    several speakers. Stepping a ``WINDOW_SEC`` window by ``HOP_SEC`` across
+    every region yields time-resolved spans the clustering can tell apart;
+    a trailing window shorter than ``MIN_WINDOW_SEC`` is dropped.
+
+    Every window that ends before its region does is a full ``WINDOW_SEC`` one,
+    so only the trailing (clipped) window is length-checked — the per-window
+    ``min``/threshold test is gone from the inner loop on long regions.
+    """
+    window, hop, min_len = WINDOW_SEC, HOP_SEC, MIN_WINDOW_SEC
+    windows: list[tuple[float, float]] = []
+    append = windows.append
+    for row in boundaries:
+        ws = float(row[0])
+        end = float(row[1])
+        while ws + window < end:
+            append((ws, ws + window))
+            ws += hop
+        if end - ws >= min_len:
+            append((ws, end))
+    return windows
+
+
+def embedding_precision(settings: dict[str, Any] | None, device: str) -> str:
+    """The effective ECAPA forward precision for ``device``.
+
+    ``"fp16"`` only when the setting asks for it AND the models run on CUDA —
+    CPU half-precision autocast is slower than fp32, so a CPU fallback quietly
+    keeps fp32. Anything unrecognised is fp32.
+    """
+    value = (settings or {}).get(EMBEDDING_PRECISION_KEY)
+    if isinstance(value, str) and value.strip().lower() == PRECISION_FP16 and device.startswith("cuda"):
+        return PRECISION_FP16
+    return PRECISION_FP32
+
+
+def window_sample_spans(
+    windows: Sequence[tuple[float, float]], sample_rate: int, num_samples: int
+) -> list[tuple[float, float, int, int]]:
+    """``(start, end)`` second windows -> ``(start, end, a, b)`` with sample bounds.
+
+    ``[a, b)`` is the window's slice of a ``num_samples``-long waveform (clipped
+    to its end); windows that slice to nothing are dropped, exactly as the
+    per-window loop skipped an empty chunk.
+    """
+    spans: list[tuple[float, float, int, int]] = []
+    for start, end in windows:
+        a = int(start * sample_rate)
+        b = min(int(end * sample_rate), num_samples)
+        if b > a:
+            spans.append((start, end, a, b))
+    return spans
+
+
+def embedding_batches(
+    spans: Sequence[tuple[float, float, int, int]], batch_size: int = EMBED_BATCH_SIZE
+) -> list[list[int]]:
+    """Group span indices into ``batch_size`` mini-batches of similar length.
+
+    Indices are bucketed by sample length (stable, so equal lengths keep time
+    order) before chunking, so the nearly-uniform ``WINDOW_SEC`` windows share
+    batches and a short trailing window never forces a batch of full windows to
+    pad. The caller scatters each batch's embeddings back by index.
+    """
+    if batch_size < 1:
+        raise ValueError(f"batch_size must be >= 1, got {batch_size}")
+    order = sorted(range(len(spans)), key=lambda i: spans[i][3] - spans[i][2])
+    return [order[i : i + batch_size] for i in range(0, len(order), batch_size)]
+
+
 class SpeechBrainDiarizer:  # pragma: no cover - requires the heavy native stack
     """VAD + ECAPA pipeline over the pretrained SpeechBrain models.
 
@@ -245,6 +384,7 @@ class SpeechBrainDiarizer:  # pragma: no cover - requires the heavy native stack
         self._settings = dict(settings or {})
         self._vad: Any = None
         self._encoder: Any = None
+        self._precision = PRECISION_FP32
 
     def _device(self) -> str:
         """Prefer CUDA, fall back to CPU (mirrors transcribe's policy)."""
@@ -278,30 +418,14 @@ class SpeechBrainDiarizer:  # pragma: no cover - requires the heavy native stack
         self._encoder = encoder_cls.from_hparams(
             source=ecapa_repo, run_opts=run_opts, **pinned_fetch_kwargs(ecapa_revision, fetch_config_cls)
         )
-        log.info("speechbrain diarizer ready on %s (pinned %s / %s)", device, vad_revision[:12], ecapa_revision[:12])
-
-    @staticmethod
-    def _windows(boundaries: Any) -> list[tuple[float, float]]:
-        """Slide a fixed window across each VAD region -> sub-segment spans.
-
-        VAD detects speech, not speaker turns, so each speech region may span
-        several speakers. Stepping a ``WINDOW_SEC`` window by ``HOP_SEC`` across
-        every region yields time-resolved spans the clustering can tell apart;
-        a trailing window shorter than ``MIN_WINDOW_SEC`` is dropped.
-        """
-        windows: list[tuple[float, float]] = []
-        for row in boundaries:
-            start = float(row[0])
-            end = float(row[1])
-            ws = start
-            while ws < end:
-                we = min(ws + WINDOW_SEC, end)
-                if we - ws >= MIN_WINDOW_SEC:
-                    windows.append((ws, we))
-                if we >= end:
-                    break
-                ws += HOP_SEC
-        return windows
+        self._precision = embedding_precision(self._settings, device)
+        log.info(
+            "speechbrain diarizer ready on %s/%s (pinned %s / %s)",
+            device,
+            self._precision,
+            vad_revision[:12],
+            ecapa_revision[:12],
+        )
 
     def detect_and_embed(
         self,
@@ -310,14 +434,17 @@ class SpeechBrainDiarizer:  # pragma: no cover - requires the heavy native stack
         on_progress: ProgressCb | None = None,
         should_cancel: CancelProbe | None = None,
     ) -> tuple[list[dict[str, Any]], list[list[float]]]:
-        """Run VAD, sub-segment each speech region, then embed each window.
+        """Run VAD, merge near-adjacent speech regions, then window + embed them.
 
         Returns ``(regions, embeddings)`` 1:1 in time order — exactly what
-        ``diarize.diarize_transcript`` consumes. Each VAD speech region is sliced
-        into overlapping fixed windows (see :meth:`_windows`) so the embeddings
+        ``diarize.diarize_transcript`` consumes. Speech regions split by a pause
+        of at most ``VAD_MERGE_GAP_SEC`` are merged first (see
+        :func:`merge_speech_regions`); each merged region is then sliced
+        into overlapping fixed windows (see :func:`sliding_windows`) so the embeddings
         are time-resolved and the clustering can separate speakers within one
-        continuous-speech region. Progress is reported across the embedding loop;
-        ``should_cancel`` is polled per window.
+        continuous-speech region. The windows are embedded in length-bucketed
+        mini-batches (see :func:`embedding_batches`), one ECAPA forward each;
+        progress is reported per batch and ``should_cancel`` polled between them.
         """
         import torch  # noqa: PLC0415
         import torchaudio  # noqa: PLC0415
@@ -337,39 +464,113 @@ class SpeechBrainDiarizer:  # pragma: no cover - requires the heavy native stack
         if waveform.shape[0] > 1:  # downmix to mono
             waveform = waveform.mean(dim=0, keepdim=True)
 
-        windows = self._windows(boundaries)
-        regions: list[dict[str, Any]] = []
-        embeddings: list[list[float]] = []
-        total = max(len(windows), 1)
-        for idx, (start, end) in enumerate(windows):
+        windows = sliding_windows(merge_speech_regions(boundaries))
+        spans = window_sample_spans(windows, sr, waveform.shape[1])
+        batches = embedding_batches(spans)
+        mono = waveform[0]
+        autocast = (
+            torch.autocast("cuda", dtype=torch.float16)
+            if self._precision == PRECISION_FP16
+            else contextlib.nullcontext()
+        )
+        vectors: list[list[float] | None] = [None] * len(spans)
+        total = max(len(spans), 1)
+        done = 0
+        for batch in batches:
             if should_cancel is not None and should_cancel():
                 break
-            a = int(start * sr)
-            b = int(end * sr)
-            chunk = waveform[:, a:b]
-            if chunk.shape[1] <= 0:
-                continue
-            with torch.no_grad():
-                emb = self._encoder.encode_batch(chunk)
-            vec = emb.squeeze().detach().cpu().tolist()
-            if isinstance(vec, float):  # 1-D degenerate guard
-                vec = [vec]
-            regions.append({"start": start, "end": end})
-            embeddings.append([float(x) for x in vec])
+            # Pad the batch to its longest window and pass SpeechBrain's native
+            # fractional ``wav_lens`` so the padding is masked out of the pooling.
+            chunks = [mono[spans[i][2] : spans[i][3]] for i in batch]
+            lengths = torch.tensor([c.shape[0] for c in chunks], dtype=torch.float32)
+            padded = torch.nn.utils.rnn.pad_sequence(chunks, batch_first=True)
+            with torch.no_grad(), autocast:
+                emb = self._encoder.encode_batch(padded, wav_lens=lengths / lengths.max())
+            rows = emb.float().reshape(len(batch), -1).detach().cpu().tolist()
+            for i, row in zip(batch, rows, strict=True):
+                vectors[i] = [float(x) for x in row]
+            done += len(batch)
             if on_progress is not None:
-                on_progress(5.0 + (idx + 1) / total * 75.0, f"embedding window {idx + 1}/{total}")
+                on_progress(5.0 + done / total * 75.0, f"embedding window {done}/{total}")
+        regions: list[dict[str, Any]] = []
+        embeddings: list[list[float]] = []
+        for (start, end, _a, _b), vec in zip(spans, vectors, strict=True):
+            if vec is not None:  # None only for batches skipped by a cancel
+                regions.append({"start": start, "end": end})
+                embeddings.append(vec)
         return regions, embeddings
 
 
+class SpeechBrainVadOnlyDiarizer(SpeechBrainDiarizer):  # pragma: no cover - requires the heavy native stack
+    """Single-speaker "diarization": SpeechBrain VAD only, no ECAPA, no clustering work.
+
+    For a known single-speaker source (a monologue, a one-person interview) the
+    embedding pass is pure cost — every window would land in one cluster anyway.
+    This loads just the VAD model and returns its speech regions labelled as one
+    speaker via :func:`single_speaker_regions`, so only the VAD asset is needed.
+    Selected with ``settings['diarizeBackend'] == 'vad'``.
+    """
+
+    def _ensure_models(self) -> None:
+        if self._vad is not None:
+            return
+        vad_cls, _encoder_cls = _import_speechbrain()
+        vad_repo, vad_revision = resolve_pinned_hf_source(VAD_ASSET_NAME, VAD_HF_REPO)
+        device = self._device()
+        self._vad = vad_cls.from_hparams(
+            source=vad_repo,
+            run_opts={"device": device},
+            **pinned_fetch_kwargs(vad_revision, _import_fetch_config()),
+        )
+        log.info("speechbrain VAD-only diarizer ready on %s (pinned %s)", device, vad_revision[:12])
+
+    def detect_and_embed(
+        self,
+        audio_path: str,
+        *,
+        on_progress: ProgressCb | None = None,
+        should_cancel: CancelProbe | None = None,
+    ) -> tuple[list[dict[str, Any]], list[list[float]]]:
+        """Run VAD and return its regions as a single speaker (no embedding pass)."""
+        self._ensure_models()
+        if on_progress is not None:
+            on_progress(5.0, "running VAD (single speaker)")
+        if should_cancel is not None and should_cancel():
+            return [], []
+        boundaries = self._vad.get_speech_segments(_fetch_safe_audio_path(audio_path))
+        if on_progress is not None:
+            on_progress(80.0, "speech regions detected")
+        return single_speaker_regions(boundaries)
+
+
+def vad_only_backend_factory(settings: dict[str, Any]) -> SpeechBrainVadOnlyDiarizer:
+    """Build the VAD-only backend (construction is cheap; the model loads on first use)."""
+    return SpeechBrainVadOnlyDiarizer(settings)
+
+
 __all__ = [
+    "EMBEDDING_PRECISION_KEY",
+    "EMBED_BATCH_SIZE",
     "HOP_SEC",
     "MIN_WINDOW_SEC",
+    "PRECISION_FP16",
+    "PRECISION_FP32",
+    "SINGLE_SPEAKER_EMBEDDING",
     "SUBWINDOW_CLUSTER_THRESHOLD",
     "TARGET_SR",
+    "VAD_MERGE_GAP_SEC",
     "WINDOW_SEC",
     "DiarizeBackendUnavailableError",
     "SpeechBrainDiarizer",
+    "SpeechBrainVadOnlyDiarizer",
     "UnpinnedModelRevisionError",
+    "embedding_batches",
+    "embedding_precision",
+    "merge_speech_regions",
     "pinned_fetch_kwargs",
     "resolve_pinned_hf_source",
+    "single_speaker_regions",
+    "sliding_windows",
+    "vad_only_backend_factory",
+    "window_sample_spans",
 ]
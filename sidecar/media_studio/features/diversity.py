@@ -73,8 +73,9 @@ def cosine_kernel(embeddings: np.ndarray) -> np.ndarray:
     safe = np.where(norms < _NORM_EPS, 1.0, norms)
     normed = mat / safe
     gram = normed @ normed.T
-    # Numerical hygiene: cosine values live in [-1, 1]; clamp tiny FP overshoot.
-    return np.clip(gram, -1.0, 1.0)
+    # Numerical hygiene: cosine values live in [-1, 1]; clamp tiny FP overshoot
+    # in place (no second (n, n) buffer).
+    return np.clip(gram, -1.0, 1.0, out=gram)
 
 
 # --------------------------------------------------------------------------- #
@@ -104,7 +105,7 @@ def dpp_greedy_map(kernel: np.ndarray, k: int) -> list[int]:
     # cis[j] holds the current Cholesky row for item j; di2[j] its marginal gain
     # d_j^2 = L_jj - || c_j ||^2 (Algorithm 1 of the paper).
     cis = np.zeros((budget, n), dtype=np.float64)
-    di2 = np.diagonal(mat).astype(np.float64).copy()
+    di2 = np.diagonal(mat).astype(np.float64)  # astype copies: the view is never written
     selected: list[int] = []
     # First pick = the largest-quality item (max diagonal).
     best = int(np.argmax(di2))
@@ -117,10 +118,13 @@ def dpp_greedy_map(kernel: np.ndarray, k: int) -> list[int]:
             break  # the chosen item already carries no gain -> set is saturated
         # Update every candidate's marginal gain given the newly-chosen ``prev``.
         sqrt_d = np.sqrt(d_prev)
-        # e_i = (L_{prev,i} - <c_prev, c_i>) / sqrt(d_prev)
-        eis = (mat[prev, :] - cis[:step, prev] @ cis[:step, :]) / sqrt_d
-        cis[step, :] = eis
-        di2 = di2 - np.square(eis)
+        # e_i = (L_{prev,i} - <c_prev, c_i>) / sqrt(d_prev), written straight into
+        # its Cholesky row; the gains update in place. Peak memory stays the
+        # (k, n) Cholesky rows — no per-step temporaries of length n survive.
+        eis = cis[step, :]
+        np.subtract(mat[prev, :], cis[:step, prev] @ cis[:step, :], out=eis)
+        eis /= sqrt_d
+        di2 -= np.square(eis)
         # Never re-pick an already-selected item.
         di2[selected] = -np.inf
         cand = int(np.argmax(di2))
@@ -165,23 +169,24 @@ def mmr_select(
     lam = float(np.clip(lambda_, 0.0, 1.0))
 
     selected: list[int] = []
-    remaining = list(range(n))
-    # Running max similarity of each item to the selected set (none selected yet).
-    max_sim = np.full(n, -np.inf, dtype=np.float64)
-
-    for _ in range(budget):
-        best_idx = -1
-        best_score = -np.inf
-        for i in remaining:
-            penalty = 0.0 if max_sim[i] == -np.inf else max_sim[i]
-            score = lam * rel[i] - (1.0 - lam) * penalty
-            if score > best_score:
-                best_score = score
-                best_idx = i
+    relevance_term = lam * rel
+    # Running max similarity of each item to the selected set; 0.0 (no penalty)
+    # until the first pick, exactly the empty-set case of the formula.
+    penalty = np.zeros(n, dtype=np.float64)
+    taken = np.zeros(n, dtype=bool)
+
+    for step in range(budget):
+        # One vectorized score over every item per step (no per-item Python
+        # loop); picked items are masked out and ``argmax`` returns the FIRST
+        # best, so ties still go to the lowest index.
+        scores = relevance_term - (1.0 - lam) * penalty
+        scores[taken] = -np.inf
+        best_idx = int(np.argmax(scores))
         selected.append(best_idx)
-        remaining.remove(best_idx)
-        # Fold the new pick into every remaining item's running max similarity.
-        max_sim = np.maximum(max_sim, sim[best_idx, :])
+        taken[best_idx] = True
+        # Fold the new pick into every item's running max similarity.
+        row = sim[best_idx, :]
+        penalty = row.copy() if step == 0 else np.maximum(penalty, row)
 
     return selected
 
@@ -237,7 +242,11 @@ def dedupe_candidates(
         # (an all-equal/zero relevance collapses to a pure-diversity kernel).
         q = np.asarray(relevance, dtype=np.float64)
         q = q - q.min() + 1.0
-        kernel = (q[:, None] * similarity) * q[None, :]
+        # Scale the (n, n) similarity in place — it is not used again — rather
+        # than allocating two more (n, n) products.
+        kernel = similarity
+        kernel *= q[:, None]
+        kernel *= q[None, :]
         order = dpp_greedy_map(kernel, budget)
     else:  # pragma: no cover - Method is a closed Literal; defensive guard only
         raise ValueError(f"unknown method {method!r} (expected 'dpp' or 'mmr')")
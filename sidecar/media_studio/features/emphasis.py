@@ -178,6 +178,8 @@ def resolve_emphasis(settings: Mapping[str, Any] | None) -> bool:
 _TOKEN_RE = re.compile(r"[^\W_]+(?:['’][^\W_]+)*", re.UNICODE)
 _DIGIT_RE = re.compile(r"\d")
 _LETTER_RE = re.compile(r"[^\W\d_]", re.UNICODE)
+# A maximal word run: ``\bstem\b`` matches exactly when some run equals ``stem``.
+_WORD_RE = re.compile(r"\w+")
 
 
 def _letters_only(token: str) -> str:
@@ -236,9 +238,10 @@ def pick_emoji(text: str) -> str:
     """
     if not text:
         return ""
-    lowered = text.lower()
+    # Case-fold + tokenize ONCE, then each stem is a set lookup (not a regex scan).
+    words = set(_WORD_RE.findall(text.lower()))
     for stem, emoji in EMOJI_MAP:
-        if re.search(rf"\b{re.escape(stem)}\b", lowered):
+        if stem in words:
             return emoji
     return ""
 
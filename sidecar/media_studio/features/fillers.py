@@ -110,8 +110,15 @@ def _phrase_lengths(*sets: frozenset) -> list[int]:
 
 
 def _valid_words(words: Sequence[WordLike]) -> list[dict[str, Any]]:
-    """Keep words with usable text + numeric, ordered timings."""
+    """Keep words with usable text + numeric, ordered timings.
+
+    ASR output is already in ``(start, end)`` order, so the kept words are
+    checked for that order as they are collected and only sorted on the rare
+    out-of-order input (the sort is stable, so skipping it is identical).
+    """
     out: list[dict[str, Any]] = []
+    ordered = True
+    prev_start = prev_end = float("-inf")
     for w in words or []:
         try:
             start = float(w.get("start"))  # type: ignore[arg-type]
@@ -121,8 +128,12 @@ def _valid_words(words: Sequence[WordLike]) -> list[dict[str, Any]]:
         text = str(w.get("text", "") or "")
         if not text.strip() or end <= start:
             continue
+        if start < prev_start or (start == prev_start and end < prev_end):
+            ordered = False
+        prev_start, prev_end = start, end
         out.append({"text": text, "start": start, "end": end})
-    out.sort(key=lambda w: (w["start"], w["end"]))
+    if not ordered:
+        out.sort(key=lambda w: (w["start"], w["end"]))
     return out
 
 
@@ -77,7 +77,7 @@ HOOK_CARD_MAX_SEC = 30.0
 HOOK_CARD_MIN_ORDER_WIDTH = 2  # zero-pad the order prefix to at least 01-NN
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class HookCardConfig:
     """Resolved hook-card export config (all already validated/clamped)."""
 
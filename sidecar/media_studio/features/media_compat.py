@@ -7,7 +7,7 @@ Methods (names FROZEN by A2):
 
 The verdict tree is **codec-driven, not container-driven** (PLAN-P2 U1):
 
-  1. ffprobe sniff (``-show_streams -show_format -of json``);
+  1. ffprobe sniff (JSON, only the entries :data:`PROBE_ENTRIES` names);
   2. every video/audio stream Chromium-playable AND the container directly
      playable                      -> ``playable`` (play the original);
   3. every stream playable but the container is not (e.g. h264-in-MKV)
@@ -87,14 +87,23 @@ def _require_str(params: dict[str, Any], key: str) -> str:
 # --------------------------------------------------------------------------- #
 # pure: probe argv + classification
 # --------------------------------------------------------------------------- #
+#: The ffprobe entries the sniff asks for — exactly what :func:`classify`,
+#: :func:`~media_studio.ffmpeg.ffprobe_duration` and the short-maker export's
+#: remux check (``pix_fmt``) read. ``-show_streams`` /
+#: ``-show_format`` would serialize every codec parameter, tag and side-data
+#: block of every stream only for this module to discard it; the JSON shape
+#: (``streams[]`` with a ``disposition`` object, ``format``) is unchanged.
+PROBE_ENTRIES = "stream=codec_type,codec_name,pix_fmt:stream_disposition=attached_pic:format=format_name,duration"
+
+
 def build_probe_streams_argv(in_path: str, settings: dict[str, Any] | None = None) -> list[str]:
     """argv for the ffprobe codec/container sniff (JSON streams + format)."""
     return [
         ffmpeg.ffprobe_path(settings),
         "-v",
         "error",
-        "-show_streams",
-        "-show_format",
+        "-show_entries",
+        PROBE_ENTRIES,
         "-of",
         "json",
         in_path,
@@ -39,6 +39,7 @@ from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any, Literal, Protocol
 
 from ..util import clamp, get_logger
+from ._window_grid import stride_windows
 
 if TYPE_CHECKING:  # numpy is in the venv, but keep the public surface import-light
     import numpy as np
@@ -192,13 +193,7 @@ def sample_windows(
         raise ValueError(f"win_sec and hop_sec must be positive, got {win_sec}, {hop_sec}")
     if d <= 0.0:
         return ((0.0, 0.0),)
-    windows: list[tuple[float, float]] = []
-    start = 0.0
-    while start < d:
-        end = min(start + win_sec, d)
-        windows.append((round(start, 3), round(end, 3)))
-        start += hop_sec
-    return tuple(windows)
+    return tuple((round(start, 3), round(end, 3)) for start, end in stride_windows(d, win_sec, hop_sec))
 
 
 def normalize_curve(values: Sequence[float]) -> list[float]:
@@ -38,7 +38,8 @@ from typing import Any, Protocol
 
 from ..util import clamp, get_logger
 from . import offline as _offline
-from .transcribe import GPU_FALLBACK_NOTICE
+from ._window_grid import stride_windows
+from .transcribe import GPU_FALLBACK_NOTICE, _attr, _segment_to_dict, _word_to_dict  # noqa: F401
 
 log = get_logger("media_studio.features.parakeet_asr")
 
@@ -173,13 +174,7 @@ def chunk_audio_spans(duration: float, chunk_sec: float = CHUNK_SEC) -> tuple[tu
     d = max(0.0, float(duration))
     if d <= 0.0:
         return ()
-    spans: list[tuple[float, float]] = []
-    start = 0.0
-    while start < d - 1e-9:
-        end = min(start + chunk_sec, d)
-        spans.append((round(start, 3), round(end, 3)))
-        start += chunk_sec
-    return tuple(spans)
+    return tuple((round(start, 3), round(end, 3)) for start, end in stride_windows(d, chunk_sec, chunk_sec, tail=1e-9))
 
 
 def _shift_word(word: Word, offset: float) -> Word:
@@ -231,43 +226,9 @@ def merge_chunk_transcripts(
     }
 
 
-def _attr(obj: Any, *names: str) -> Any:
-    """Read the first present attribute/key from ``names`` (object OR dict).
-
-    NeMo may yield namedtuple-like objects; tests pass plain dicts. Tolerates
-    both so the normalizers stay test-friendly (mirrors ``transcribe._attr``).
-    """
-    for name in names:
-        if isinstance(obj, dict):
-            if name in obj:
-                return obj[name]
-        elif hasattr(obj, name):
-            return getattr(obj, name)
-    return None
-
-
-def _word_to_dict(word: Any) -> Word:
-    """Normalize a backend word object/dict into a §3 ``Word``."""
-    text = _attr(word, "word", "text")
-    start = _attr(word, "start")
-    end = _attr(word, "end")
-    return {
-        "text": "" if text is None else str(text),
-        "start": float(start or 0.0),
-        "end": float(end or 0.0),
-    }
-
-
-def _segment_to_dict(seg: Any) -> Segment:
-    """Normalize a backend segment object/dict into a §3 ``Segment``."""
-    raw_words = _attr(seg, "words") or []
-    words: list[Word] = [_word_to_dict(w) for w in raw_words]
-    return {
-        "start": float(_attr(seg, "start") or 0.0),
-        "end": float(_attr(seg, "end") or 0.0),
-        "text": str(_attr(seg, "text") or ""),
-        "words": words,
-    }
+# NeMo yields the same namedtuple-like (or dict) segment/word shape as
+# faster-whisper, so the normalizers (``_attr`` / ``_word_to_dict`` /
+# ``_segment_to_dict``) are the whisper path's, imported above — not a copy.
 
 
 def _transcribe_chunk(
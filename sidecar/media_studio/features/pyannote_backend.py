@@ -27,7 +27,7 @@ Layering (mirrors ``diarize_backend.py``):
   none of which are in the test venv).
 * The LIGHT half — token resolution, asset registration, installed-state probing,
   the backend-factory selector, and the pure pyannote-annotation -> (regions,
-  embeddings) converter — is plain stdlib/dict logic, fully unit-tested with
+  embeddings) converters — is plain stdlib/dict logic, fully unit-tested with
   hand-built fakes (no model, no audio, no token).
 
 The Integrate phase wires this in by passing :func:`select_backend_factory` (or a
@@ -38,14 +38,14 @@ the two gated assets via :func:`register_pyannote_assets`.
 from __future__ import annotations
 
 import os
-from collections.abc import Callable, Mapping, Sequence
+from collections.abc import Callable, Iterable, Mapping, Sequence
 from typing import Any
 
 from ..assets import manifest
 from ..protocol import ErrorCode, RpcError
-from ..util import get_logger
+from ..util import clamp, get_logger
 from .diarize import CancelProbe, DiarizerBackend, ProgressCb
-from .diarize_backend import UnpinnedModelRevisionError, resolve_pinned_hf_source
+from .diarize_backend import UnpinnedModelRevisionError, resolve_pinned_hf_source, vad_only_backend_factory
 
 log = get_logger("media_studio.features.pyannote_backend")
 
@@ -76,10 +76,21 @@ HF_TOKEN_ENV_VARS: tuple[str, ...] = ("HF_TOKEN", "HUGGING_FACE_HUB_TOKEN")
 BACKEND_KEY = "diarizeBackend"
 PYANNOTE_BACKEND = "pyannote"
 SPEECHBRAIN_BACKEND = "speechbrain"
+#: SpeechBrain VAD only, every region labelled one speaker (no embedding pass).
+VAD_BACKEND = "vad"
 
 #: pyannote runs at 16 kHz mono (same as the speechbrain path).
 TARGET_SR = 16000
 
+#: Settings keys for the pipeline's segmentation / embedding inference batch
+#: sizes. Bigger batches amortize per-launch GPU overhead (64-128 on a roomy
+#: card); a tight-VRAM card can drop to 4. Unset -> pyannote 3.1's own default.
+SEGMENTATION_BATCH_KEY = "pyannoteSegmentationBatchSize"
+EMBEDDING_BATCH_KEY = "pyannoteEmbeddingBatchSize"
+DEFAULT_BATCH_SIZE = 32
+#: upper clamp for an explicit batch size (keeps the pipeline's VRAM bounded).
+MAX_BATCH_SIZE = 128
+
 
 class PyannoteConfigError(RpcError):
     """Typed refusal when pyannote is selected but cannot be configured.
@@ -182,29 +193,70 @@ def default_models_present(settings: dict[str, Any]) -> bool:
 # --------------------------------------------------------------------------- #
 # pure/light: pyannote Annotation -> (regions, embeddings) converter
 # --------------------------------------------------------------------------- #
-def regions_and_embeddings(
-    spans: Sequence[Mapping[str, Any]],
-    embeddings: Sequence[Sequence[float]],
+def collect_tracks(
+    tracks: Iterable[tuple[Any, Any, str]],
+    speaker_embeddings: Sequence[Sequence[float]],
+    *,
+    total: int,
+    on_progress: ProgressCb | None = None,
+    should_cancel: CancelProbe | None = None,
 ) -> tuple[list[dict[str, Any]], list[list[float]]]:
-    """Normalize the heavy backend's raw output into the diarize seam shape.
-
-    ``spans`` are ``{start, end}`` speech windows (one per pyannote segment) and
-    ``embeddings`` are their speaker-embedding vectors, 1:1 in time order. The
-    return is exactly what ``diarize.diarize_transcript`` consumes:
-    ``(regions, embeddings)`` with ``regions[i] = {"start": .., "end": ..}`` and
-    float-coerced vectors. Length mismatch is a programming error -> ``ValueError``
-    (kept pure so the heavy path stays a thin shim over this).
+    """Consume pyannote's ``itertracks(yield_label=True)`` stream in ONE pass.
+
+    Each ``(segment, track, label)`` row becomes a ``{start, end}`` region plus the
+    embedding of its speaker (``speaker_embeddings`` is per-speaker, indexed in
+    order of first appearance). The rows are normalized as they stream in, so an
+    hours-long annotation is never first copied into a track list and then again
+    into raw spans/vectors. ``total`` (the annotation's segment count) only scales
+    progress. A cancel stops early with the rows collected so far.
     """
-    if len(spans) != len(embeddings):
-        raise ValueError(f"spans/embeddings length mismatch: {len(spans)} spans vs {len(embeddings)} embeddings")
     regions: list[dict[str, Any]] = []
     vecs: list[list[float]] = []
-    for span, vec in zip(spans, embeddings, strict=True):
-        regions.append({"start": float(span.get("start", 0.0)), "end": float(span.get("end", 0.0))})
-        vecs.append([float(x) for x in vec])
+    total = max(total, 1)
+    speaker_order: dict[str, int] = {}
+    for idx, (segment, _track, label) in enumerate(tracks):
+        if should_cancel is not None and should_cancel():
+            break
+        row = speaker_order.setdefault(label, len(speaker_order))
+        regions.append({"start": float(segment.start), "end": float(segment.end)})
+        vecs.append([float(x) for x in speaker_embeddings[row]])
+        if on_progress is not None:
+            done = min(idx + 1, total)
+            on_progress(5.0 + done / total * 75.0, f"segment {done}/{total}")
     return regions, vecs
 
 
+def _batch_size(settings: Mapping[str, Any], key: str) -> int:
+    value = settings.get(key)
+    # bool is an int subclass — a stray True must not become a batch of 1.
+    if isinstance(value, int) and not isinstance(value, bool):
+        return int(clamp(value, 1, MAX_BATCH_SIZE))
+    return DEFAULT_BATCH_SIZE
+
+
+def pipeline_batch_sizes(settings: Mapping[str, Any] | None) -> tuple[int, int]:
+    """The ``(segmentation, embedding)`` batch sizes to run the pipeline with.
+
+    Read from :data:`SEGMENTATION_BATCH_KEY` / :data:`EMBEDDING_BATCH_KEY`. An
+    explicit integer is clamped to ``1..``:data:`MAX_BATCH_SIZE`; a missing or
+    non-integer value keeps :data:`DEFAULT_BATCH_SIZE`, so a bad setting never
+    breaks diarization.
+    """
+    settings = settings or {}
+    return _batch_size(settings, SEGMENTATION_BATCH_KEY), _batch_size(settings, EMBEDDING_BATCH_KEY)
+
+
+def in_memory_audio(waveform: Any, sample_rate: int) -> dict[str, Any]:
+    """The ``{"waveform", "sample_rate"}`` mapping pyannote accepts instead of a path.
+
+    Handing the pipeline an already-decoded ``(channel, time)`` tensor skips its
+    own per-call file read + decode. The tensor stays on the CPU: pyannote moves
+    each sliding-window chunk to its device itself, so a long file never has to
+    fit in VRAM whole.
+    """
+    return {"waveform": waveform, "sample_rate": int(sample_rate)}
+
+
 # --------------------------------------------------------------------------- #
 # the heavy backend (conforms to diarize.DiarizerBackend) — pragma'd
 # --------------------------------------------------------------------------- #
@@ -214,7 +266,7 @@ class PyannoteDiarizer:  # pragma: no cover - requires the heavy native stack +
     Constructed lazily per job; ``settings`` selects the device + ASR options. The
     ``pyannote.audio`` / ``torch`` imports live INSIDE :meth:`detect_and_embed`
     (run-time only), and the gated pipeline is loaded with the env HF token. The
-    raw pipeline output is funnelled through the pure :func:`regions_and_embeddings`
+    raw pipeline output is streamed through the pure :func:`collect_tracks`
     so the clustering in ``diarize.py`` (greedy cosine) drives the final labels —
     pyannote here supplies high-quality per-segment speaker embeddings, not its
     own clustering, keeping ONE labelling code path across both backends.
@@ -248,10 +300,14 @@ class PyannoteDiarizer:  # pragma: no cover - requires the heavy native stack +
 
         # WU-S5: "<repo>@<commit>" is pyannote's revision-pin syntax — the load
         # resolves the registry's immutable commit, never a floating branch/tag.
+        device = self._device()
         pipeline = Pipeline.from_pretrained(pinned_pipeline_checkpoint(), use_auth_token=self._token)
-        pipeline.to(torch.device(self._device()))
+        pipeline.to(torch.device(device))
+        seg_batch, emb_batch = pipeline_batch_sizes(self._settings)
+        pipeline.segmentation_batch_size = seg_batch
+        pipeline.embedding_batch_size = emb_batch
         self._pipeline = pipeline
-        log.info("pyannote diarizer ready on %s", self._device())
+        log.info("pyannote diarizer ready on %s", device)
 
     def detect_and_embed(
         self,
@@ -261,25 +317,23 @@ class PyannoteDiarizer:  # pragma: no cover - requires the heavy native stack +
         should_cancel: CancelProbe | None = None,
     ) -> tuple[list[dict[str, Any]], list[list[float]]]:
         """Run the pyannote pipeline; return ``(regions, embeddings)`` in time order."""
+        import torchaudio  # noqa: PLC0415
+
         self._ensure_pipeline()
         if on_progress is not None:
             on_progress(5.0, "running pyannote diarization")
-        diarization, raw_embeddings = self._pipeline(audio_path, return_embeddings=True)
-
-        spans: list[dict[str, Any]] = []
-        vecs: list[Sequence[float]] = []
-        tracks = list(diarization.itertracks(yield_label=True))
-        total = max(len(tracks), 1)
-        speaker_order: dict[str, int] = {}
-        for idx, (segment, _track, label) in enumerate(tracks):
-            if should_cancel is not None and should_cancel():
-                break
-            row = speaker_order.setdefault(label, len(speaker_order))
-            spans.append({"start": float(segment.start), "end": float(segment.end)})
-            vecs.append([float(x) for x in raw_embeddings[row]])
-            if on_progress is not None:
-                on_progress(5.0 + (idx + 1) / total * 75.0, f"segment {idx + 1}/{total}")
-        return regions_and_embeddings(spans, vecs)
+        # Decode once here and hand pyannote the CPU tensor instead of the path,
+        # so it skips its own file read; it moves chunks to the GPU as it goes.
+        waveform, sample_rate = torchaudio.load(audio_path)
+        audio = in_memory_audio(waveform, sample_rate)
+        diarization, raw_embeddings = self._pipeline(audio, return_embeddings=True)
+        return collect_tracks(
+            diarization.itertracks(yield_label=True),
+            raw_embeddings,
+            total=len(diarization),
+            on_progress=on_progress,
+            should_cancel=should_cancel,
+        )
 
 
 # --------------------------------------------------------------------------- #
@@ -294,17 +348,29 @@ def pyannote_backend_factory(settings: dict[str, Any]) -> DiarizerBackend:
     return PyannoteDiarizer(settings)
 
 
+#: Built-in factories for the non-default backends, keyed by backend name.
+#: ``select_backend_factory`` dispatches through this (plus the caller's
+#: speechbrain factory and any overrides) instead of an if-chain, so a new
+#: backend is one entry here rather than another branch.
+_DEFAULT_BACKEND_FACTORIES: dict[str, Callable[[dict[str, Any]], DiarizerBackend]] = {
+    PYANNOTE_BACKEND: pyannote_backend_factory,
+    VAD_BACKEND: vad_only_backend_factory,
+}
+
+
 def selected_backend_name(settings: Mapping[str, Any] | None) -> str:
     """The chosen diarize backend name from settings, defaulting to speechbrain.
 
-    Any value other than ``"pyannote"`` resolves to ``"speechbrain"`` so an
-    unknown/typo'd setting never silently breaks diarization — it just keeps the
-    safe default backend.
+    Any value other than ``"pyannote"`` or ``"vad"`` resolves to ``"speechbrain"``
+    so an unknown/typo'd setting never silently breaks diarization — it just
+    keeps the safe default backend.
     """
     settings = settings or {}
     value = settings.get(BACKEND_KEY)
-    if isinstance(value, str) and value.strip().lower() == PYANNOTE_BACKEND:
-        return PYANNOTE_BACKEND
+    if isinstance(value, str):
+        name = value.strip().lower()
+        if name in _DEFAULT_BACKEND_FACTORIES:
+            return name
     return SPEECHBRAIN_BACKEND
 
 
@@ -313,19 +379,26 @@ def select_backend_factory(
     *,
     speechbrain_factory: Callable[[dict[str, Any]], DiarizerBackend],
     pyannote_factory: Callable[[dict[str, Any]], DiarizerBackend] | None = None,
+    vad_factory: Callable[[dict[str, Any]], DiarizerBackend] | None = None,
 ) -> DiarizerBackend:
     """Pick + build the diarizer backend per ``settings['diarizeBackend']``.
 
-    The Integrate phase passes this (closed over the two factories) as
+    The Integrate phase passes this (closed over the factories) as
     ``diarize.register(backend_factory=...)``. When pyannote is selected, this
     validates the HF token via the pyannote factory (raising
-    :class:`PyannoteConfigError` if absent) BEFORE any heavy import; otherwise it
-    builds the default speechbrain backend, unchanged.
+    :class:`PyannoteConfigError` if absent) BEFORE any heavy import; ``"vad"``
+    builds the single-speaker VAD-only backend; otherwise it builds the default
+    speechbrain backend, unchanged.
     """
-    if selected_backend_name(settings) == PYANNOTE_BACKEND:
-        factory = pyannote_factory if pyannote_factory is not None else pyannote_backend_factory
-        return factory(settings)
-    return speechbrain_factory(settings)
+    factories: dict[str, Callable[[dict[str, Any]], DiarizerBackend]] = {
+        **_DEFAULT_BACKEND_FACTORIES,
+        SPEECHBRAIN_BACKEND: speechbrain_factory,
+    }
+    if pyannote_factory is not None:
+        factories[PYANNOTE_BACKEND] = pyannote_factory
+    if vad_factory is not None:
+        factories[VAD_BACKEND] = vad_factory
+    return factories[selected_backend_name(settings)](settings)
 
 
 # --------------------------------------------------------------------------- #
@@ -369,24 +442,31 @@ register_pyannote_assets()
 
 __all__ = [
     "BACKEND_KEY",
+    "DEFAULT_BATCH_SIZE",
+    "EMBEDDING_BATCH_KEY",
     "HF_TOKEN_ENV_VARS",
+    "MAX_BATCH_SIZE",
     "PIPELINE_ASSET_NAME",
     "PYANNOTE_BACKEND",
     "PYANNOTE_PIPELINE",
     "PYANNOTE_SEGMENTATION",
     "REQUIRED_ASSETS",
     "SEGMENTATION_ASSET_NAME",
+    "SEGMENTATION_BATCH_KEY",
     "SPEECHBRAIN_BACKEND",
     "TARGET_SR",
+    "VAD_BACKEND",
     "PyannoteConfigError",
     "PyannoteDiarizer",
     # Re-exported so a caller can catch the pin refusal without reaching into
     # diarize_backend (WU-S5: the shared resolver lives there).
     "UnpinnedModelRevisionError",
+    "collect_tracks",
     "default_models_present",
+    "in_memory_audio",
     "pinned_pipeline_checkpoint",
+    "pipeline_batch_sizes",
     "pyannote_backend_factory",
-    "regions_and_embeddings",
     "register_pyannote_assets",
     "require_hf_token",
     "resolve_hf_token",
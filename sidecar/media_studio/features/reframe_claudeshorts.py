@@ -58,7 +58,7 @@ import tempfile
 from collections.abc import Callable, Sequence
 from typing import Any
 
-from .. import ffmpeg
+from .. import encoders, ffmpeg
 from ..util import get_logger
 from . import aspect as _aspect
 
@@ -445,7 +445,9 @@ def build_reframe_argv(
     single-quoted for the filtergraph parser (its ``if(...)`` form contains
     commas); since this is argv (no shell), the quotes reach ffmpeg verbatim.
     ``-progress pipe:1 -nostats`` feeds :func:`media_studio.ffmpeg.run`'s
-    progress parsing; ``-y`` overwrites the output.
+    progress parsing; ``-y`` overwrites the output. With ``hardwareEncode`` on
+    and a hardware H.264 encoder listed (:func:`media_studio.encoders.hardware_video_args`)
+    the encode moves to it and decode gets ``-hwaccel auto``.
     """
     out_w, out_h = output_dimensions(aspect)
     x_expr = build_crop_x_expr(int(crop["x"]), keyframes)
@@ -453,21 +455,20 @@ def build_reframe_argv(
         f"crop={int(crop['w'])}:{int(crop['h'])}:'{x_expr}':{int(crop['y'])},"
         f"scale={out_w}:{out_h}:flags=lanczos,setsar=1"
     )
+    hw_video = encoders.hardware_video_args(settings)
+    video = hw_video if hw_video is not None else ["-c:v", "libx264", "-preset", "medium", "-crf", "18"]
+    decode = ["-hwaccel", "auto"] if hw_video is not None else []
     return [
         ffmpeg.ffmpeg_path(settings),
         "-hide_banner",
         "-nostdin",
         "-y",
+        *decode,
         "-i",
         in_path,
         "-vf",
         vf,
-        "-c:v",
-        "libx264",
-        "-preset",
-        "medium",
-        "-crf",
-        "18",
+        *video,
         "-pix_fmt",
         "yuv420p",
         "-c:a",
@@ -83,10 +83,17 @@ class RealMultiSpeakerBackend:  # pragma: no cover - requires the heavy native s
 
         shot_boundaries = self._stage_shots(media_path, fps)
         self.release()
-        diarize_per_frame = self._stage_diarize(media_path, total, fps)
-        self.release()
-        boxes, scores, vad = self._stage_visual(media_path, total, fps)
-        self.release()
+        # Stages 2 and 3 both need the audio as a 16 kHz mono wav: decode it once
+        # and hand the same file to each instead of re-running ffmpeg per stage.
+        wav_path = self._extract_wav(media_path)
+        try:
+            diarize_per_frame = self._stage_diarize(wav_path, total, fps)
+            self.release()
+            boxes, scores, vad = self._stage_visual(media_path, wav_path, total, fps)
+            self.release()
+        finally:
+            with contextlib.suppress(OSError):
+                os.remove(wav_path)
 
         return ShotAnalysis(
             width=width,
@@ -107,17 +114,16 @@ class RealMultiSpeakerBackend:  # pragma: no cover - requires the heavy native s
         cuts_sec = compute_scene_cuts(media_path, fps_hint=fps, settings=self._settings)
         return tuple(int(round(c * fps)) for c in cuts_sec)
 
-    def _stage_diarize(self, media_path: str, total: int, fps: float) -> tuple[str, ...]:
-        """STAGE 2 — speaker diarization -> per-frame active id.
+    @staticmethod
+    def _extract_wav(media_path: str) -> str:
+        """Decode ``media_path``'s audio to a temp 16 kHz mono WAV (caller removes it).
 
         The SpeechBrain VAD reads audio through libsndfile, which has no video
         demuxer, so a raw ``media_path`` (.mp4) raises "Format not recognised".
-        The video's audio is therefore first extracted to a 16 kHz mono WAV (same
-        timeline, so region seconds map straight onto the source-fps frame grid),
-        mirroring ``_lightasd_infer``'s audio extraction.
+        The video's audio is therefore extracted first (same timeline, so region
+        seconds map straight onto the source-fps frame grid), in exactly the
+        format ``_lightasd_infer`` reads for its per-track audio + VAD.
         """
-        from . import diarize  # noqa: PLC0415 - heavy seam
-
         fd, wav_path = tempfile.mkstemp(prefix="msreframe_diar_", suffix=".wav")
         os.close(fd)
         try:
@@ -127,15 +133,22 @@ class RealMultiSpeakerBackend:  # pragma: no cover - requires the heavy native s
                 stdout=subprocess.DEVNULL,
                 stderr=subprocess.DEVNULL,
             )
-            # Real diarize API: detect_and_embed -> (regions[{start,end}], embeddings)
-            # 1:1 in time order; greedy_cluster -> a cluster id per region;
-            # speaker_label -> "SPEAKER_NN". (There is no top-level diarize.diarize();
-            # this is the raw-media -> per-frame-speaker path, no transcript needed.)
-            backend = diarize._default_backend_factory(self._settings)
-            regions, embeddings = backend.detect_and_embed(wav_path)
-        finally:
+        except BaseException:
             with contextlib.suppress(OSError):
                 os.remove(wav_path)
+            raise
+        return wav_path
+
+    def _stage_diarize(self, wav_path: str, total: int, fps: float) -> tuple[str, ...]:
+        """STAGE 2 — speaker diarization of the extracted wav -> per-frame active id."""
+        from . import diarize  # noqa: PLC0415 - heavy seam
+
+        # Real diarize API: detect_and_embed -> (regions[{start,end}], embeddings)
+        # 1:1 in time order; greedy_cluster -> a cluster id per region;
+        # speaker_label -> "SPEAKER_NN". (There is no top-level diarize.diarize();
+        # this is the raw-media -> per-frame-speaker path, no transcript needed.)
+        backend = diarize._default_backend_factory(self._settings)
+        regions, embeddings = backend.detect_and_embed(wav_path)
         # The backend emits time-resolved SUB-WINDOW embeddings (≈2.5 s each), so
         # cluster at the sub-window-tuned floor rather than the long-utterance
         # default (which over-fragments these shorter windows).
@@ -151,7 +164,7 @@ class RealMultiSpeakerBackend:  # pragma: no cover - requires the heavy native s
                 per_frame[f] = speaker
         return tuple(per_frame)
 
-    def _stage_visual(self, media_path: str, total: int, fps: float) -> tuple[Any, Any, Any]:
+    def _stage_visual(self, media_path: str, wav_path: str, total: int, fps: float) -> tuple[Any, Any, Any]:
         """STAGE 3 — face boxes + Light-ASD visual scores + audio VAD per frame.
 
         Real YuNet (cv2.FaceDetectorYN) + LR-ASD inference (WU-L1): returns
@@ -162,7 +175,7 @@ class RealMultiSpeakerBackend:  # pragma: no cover - requires the heavy native s
         """
         from ._lightasd_infer import analyze_visual  # noqa: PLC0415 - heavy seam
 
-        return analyze_visual(media_path, total, fps, settings=self._settings)
+        return analyze_visual(media_path, total, fps, settings=self._settings, audio_wav=wav_path)
 
 
 __all__ = ["RealMultiSpeakerBackend"]
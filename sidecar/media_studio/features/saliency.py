@@ -38,6 +38,7 @@ from typing import TYPE_CHECKING, Any, Protocol
 
 from ..util import clamp, get_logger
 from . import offline as _offline
+from ._window_grid import stride_windows
 
 if TYPE_CHECKING:
     import numpy as np  # numpy IS in the venv; kept here so the module surface stays light.
@@ -117,12 +118,7 @@ def sample_windows(
     h = max(1e-6, float(hop_sec))
     if d <= 0.0:
         return ((0.0, 0.0),)
-    windows: list[tuple[float, float]] = []
-    start = 0.0
-    while start < d - 1e-9:
-        end = min(start + w, d)
-        windows.append((round(start, 6), round(end, 6)))
-        start += h
+    windows = [(round(start, 6), round(end, 6)) for start, end in stride_windows(d, w, h, tail=1e-9)]
     if not windows:  # pragma: no cover - d>0 with finite hop always yields >=1
         windows.append((0.0, d))
     return tuple(windows)
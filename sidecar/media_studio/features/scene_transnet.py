@@ -40,6 +40,7 @@ from typing import TYPE_CHECKING, Any, Protocol
 
 from ..util import get_logger
 from . import offline as _offline
+from ._window_grid import stride_windows
 
 if TYPE_CHECKING:
     import numpy as np
@@ -195,13 +196,7 @@ def sample_windows(
     d = max(0.0, float(duration))
     if d <= 0.0:
         return ()
-    windows: list[tuple[float, float]] = []
-    start = 0.0
-    while start < d - 1e-9:
-        end = min(start + win_sec, d)
-        windows.append((round(start, 3), round(end, 3)))
-        start += hop_sec
-    return tuple(windows)
+    return tuple((round(start, 3), round(end, 3)) for start, end in stride_windows(d, win_sec, hop_sec, tail=1e-9))
 
 
 def emit_scene_signals(cuts: Sequence[float], duration: float) -> SignalTrack:
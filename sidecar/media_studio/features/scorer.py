@@ -47,6 +47,7 @@ from collections.abc import Mapping, Sequence
 from typing import TYPE_CHECKING, Any, Protocol
 
 from ..util import clamp, get_logger
+from ._window_grid import stride_windows
 from .ranker import SIGNAL_FEATURES
 
 if TYPE_CHECKING:  # numpy IS in the venv; kept import-light, used only in fallbacks.
@@ -138,23 +139,49 @@ def present_channels(tracks: Mapping[str, _TrackLike]) -> tuple[str, ...]:
     return tuple(out)
 
 
-def _mean_in_window(track: _TrackLike, start: float, end: float) -> float | None:
-    """Mean of a track's signal values whose window overlaps ``[start, end)``.
+#: A track's signals as parallel float64 columns ``(starts, ends, values)``.
+_Columns = tuple["np.ndarray", "np.ndarray", "np.ndarray"]
+
+
+def _track_columns(track: _TrackLike) -> _Columns:
+    """A track's signals as ``(starts, ends, clamped values)`` columns (SoA).
+
+    Built ONCE per track per call so the per-window pooling reads three float64
+    arrays instead of re-walking the ``Signal`` objects (two attribute loads and a
+    float conversion each) for every window.
+    """
+    import numpy as np  # noqa: PLC0415 - numpy is a venv dep; kept out of import time
+
+    sigs = track.signals
+    n = len(sigs)
+    starts = np.fromiter((float(sig.start) for sig in sigs), dtype=np.float64, count=n)
+    ends = np.fromiter((float(sig.end) for sig in sigs), dtype=np.float64, count=n)
+    values = np.fromiter((float(sig.value) for sig in sigs), dtype=np.float64, count=n)
+    return starts, ends, np.clip(values, 0.0, 1.0, out=values)
+
+
+def _present_columns(tracks: Mapping[str, _TrackLike]) -> dict[str, _Columns]:
+    """:func:`_track_columns` for every PRESENT track, in frozen channel order."""
+    return {channel: _track_columns(tracks[channel]) for channel in present_channels(tracks)}
+
+
+def _pool_columns(columns: Mapping[str, _Columns], start: float, end: float) -> dict[str, float]:
+    """Per-channel mean of the signal values overlapping ``[start, end)``.
 
     A signal overlaps when its ``[sig.start, sig.end)`` intersects ``[start, end)``
     (an instantaneous window with ``sig.start == sig.end`` overlaps when it sits
-    inside the clip). Returns ``None`` when NO signal overlaps (the channel
-    contributes nothing for this clip — it is then omitted, not zeroed).
+    inside the clip). A channel with NO overlapping signal is omitted (it
+    contributes nothing for this window — omitted, not zeroed).
     """
-    values: list[float] = []
-    for sig in track.signals:
-        s, e = float(sig.start), float(sig.end)
-        overlaps = s < end and e > start if e > s else (start <= s < end)
-        if overlaps:
-            values.append(clamp(float(sig.value), 0.0, 1.0))
-    if not values:
-        return None
-    return sum(values) / float(len(values))
+    import numpy as np  # noqa: PLC0415 - numpy is a venv dep; kept out of import time
+
+    pooled: dict[str, float] = {}
+    for channel, (starts, ends, values) in columns.items():
+        hit = np.where(ends > starts, (starts < end) & (ends > start), (start <= starts) & (starts < end))
+        count = int(np.count_nonzero(hit))
+        if count:
+            pooled[channel] = float(values[hit].sum()) / count
+    return pooled
 
 
 def pool_signals_for_window(tracks: Mapping[str, _TrackLike], start: float, end: float) -> dict[str, float]:
@@ -165,13 +192,7 @@ def pool_signals_for_window(tracks: Mapping[str, _TrackLike], start: float, end:
     §-signal degrade rule applied at pooling time. The returned map keys are the
     surviving channel names; values are 0..1.
     """
-    pooled: dict[str, float] = {}
-    for channel in present_channels(tracks):
-        track = tracks[channel]
-        mean = _mean_in_window(track, start, end)
-        if mean is not None:
-            pooled[channel] = mean
-    return pooled
+    return _pool_columns(_present_columns(tracks), start, end)
 
 
 def clip_signal_map(tracks: Mapping[str, _TrackLike], start: float, end: float) -> dict[str, float]:
@@ -183,7 +204,11 @@ def clip_signal_map(tracks: Mapping[str, _TrackLike], start: float, end: float)
     channels that are PRESENT and have an overlapping signal appear — missing
     channels are omitted (the ranker zeroes them at featurization).
     """
-    pooled = pool_signals_for_window(tracks, start, end)
+    return _ranker_columns(pool_signals_for_window(tracks, start, end))
+
+
+def _ranker_columns(pooled: Mapping[str, float]) -> dict[str, float]:
+    """Restrict a pooled map to the ranker's frozen ``SIGNAL_FEATURES`` columns."""
     return {ch: pooled[ch] for ch in SIGNAL_FEATURES if ch in pooled}
 
 
@@ -225,14 +250,11 @@ def window_interest_curve(
     step = float(window_sec)
     if d <= 0.0 or step <= 0.0:
         return []
-    curve: list[float] = []
-    start = 0.0
-    while start < d:
-        end = min(start + step, d)
-        pooled = pool_signals_for_window(tracks, start, end)
-        curve.append(_weighted_present_mean(pooled, weights))
-        start += step
-    return curve
+    columns = _present_columns(tracks)
+    return [
+        _weighted_present_mean(_pool_columns(columns, start, end), weights)
+        for start, end in stride_windows(d, step, step)
+    ]
 
 
 # --------------------------------------------------------------------------- #
@@ -362,9 +384,12 @@ def fallback_embeddings(candidates: Sequence[Mapping[str, Any]], tracks: Mapping
     """
     import numpy as np  # noqa: PLC0415 - numpy is a venv dep; kept out of import time
 
+    columns = _present_columns(tracks)  # once for every candidate, not per clip
     rows: list[list[float]] = []
     for cand in candidates:
-        sig = clip_signal_map(tracks, float(cand.get("start", 0.0) or 0.0), float(cand.get("end", 0.0) or 0.0))
+        start = float(cand.get("start", 0.0) or 0.0)
+        end = float(cand.get("end", 0.0) or 0.0)
+        sig = _ranker_columns(_pool_columns(columns, start, end))
         rows.append([float(sig.get(ch, 0.0)) for ch in SIGNAL_FEATURES])
     if not rows:
         return np.zeros((0, len(SIGNAL_FEATURES)), dtype=np.float64)
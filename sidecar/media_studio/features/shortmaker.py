@@ -11,7 +11,7 @@ them as long-running :class:`~media_studio.jobs.Job` work:
                     source video; persist ``sourceStart`` on every clip
     REFRAME         (features.reframe)   verthor adapter -> 1080x1920 (9:16)
     CAPTION         (features.caption)   libass burn-in, cue times re-based
-    EXPORT          (libx264)            the batch of approved clips
+    EXPORT          (libx264 / remux)    the batch of approved clips
     MUX-AUDIO       (ffmpeg, optional)   when A2's optional ``audioTrackId`` is
                     given, map the chosen AudioTrack's [sourceStart, end) window
                     onto each exported clip (replacing the clip's own audio)
@@ -190,7 +190,15 @@ def _lazy_snap(candidates, transcript, *, controls=None, settings=None) -> tuple
 
 
 def _lazy_cut(in_path, out_path, start, end, *, settings=None) -> str:
-    """Frame-accurate ffmpeg carve of [start, end) (libx264, argv-list, no shell)."""
+    """Frame-accurate ffmpeg carve of [start, end) (libx264, argv-list, no shell).
+
+    ``-ss`` goes BEFORE ``-i``: the demuxer jumps to the keyframe preceding
+    ``start`` and, because the video is re-encoded, ffmpeg's default
+    ``-accurate_seek`` decodes and discards only that keyframe-to-``start``
+    run — still frame-accurate, but the cost scales with the clip instead of
+    with how deep into the source it starts. ``-t`` (not ``-to``) bounds the
+    output, since input-side seeking restarts output timestamps at zero.
+    """
     from .. import ffmpeg as _ffmpeg
 
     argv = [
@@ -198,13 +206,12 @@ def _lazy_cut(in_path, out_path, start, end, *, settings=None) -> str:
         "-hide_banner",
         "-nostdin",
         "-y",
-        # accurate seek: -ss/-to AFTER -i forces frame-accurate (decode-then-trim).
-        "-i",
-        in_path,
         "-ss",
         f"{float(start):.3f}",
-        "-to",
-        f"{float(end):.3f}",
+        "-i",
+        in_path,
+        "-t",
+        f"{max(0.0, float(end) - float(start)):.3f}",
         "-c:v",
         "libx264",
         "-c:a",
@@ -448,11 +455,81 @@ def _lazy_caption(
     )
 
 
-def _lazy_export(in_path, out_path, *, settings=None) -> str:
-    """Final libx264 encode of the captioned clip (argv-list, no shell)."""
+def export_can_remux(probe: dict[str, Any]) -> bool:
+    """Whether a probed clip is ALREADY the export deliverable (H.264 4:2:0 + AAC, MP4).
+
+    Every stage before EXPORT (reframe, zoom, the libass burn, the brand overlay)
+    writes libx264/yuv420p video and AAC audio into an MP4, so re-encoding it
+    again is one more full decode+encode that costs time and a generation of
+    quality. Anything else — another codec, 4:4:4, a non-MP4 container, an
+    unreadable probe (``{}``) — is NOT remuxable and takes the libx264 encode.
+    """
+    streams = probe.get("streams")
+    if not isinstance(streams, list) or not streams:
+        return False
+    has_video = False
+    for stream in streams:
+        if not isinstance(stream, dict):
+            return False
+        codec = str(stream.get("codec_name") or "").lower()
+        if stream.get("codec_type") == "video":
+            if (stream.get("disposition") or {}).get("attached_pic"):
+                continue
+            if codec != "h264" or str(stream.get("pix_fmt") or "").lower() != "yuv420p":
+                return False
+            has_video = True
+        elif stream.get("codec_type") == "audio" and codec != "aac":
+            return False
+    format_name = str((probe.get("format") or {}).get("format_name") or "").lower()
+    return has_video and "mp4" in {t.strip() for t in format_name.split(",")}
+
+
+def build_export_remux_argv(in_path: str, out_path: str, settings: dict[str, Any] | None = None) -> list[str]:
+    """argv that re-containers an already-deliverable clip (stream copy + faststart)."""
+    from .. import ffmpeg as _ffmpeg  # lazy: keeps module import-light
+
+    return [
+        _ffmpeg.ffmpeg_path(settings),
+        "-hide_banner",
+        "-nostdin",
+        "-y",
+        "-i",
+        in_path,
+        "-c",
+        "copy",
+        "-movflags",
+        "+faststart",
+        "-progress",
+        "pipe:1",
+        "-nostats",
+        out_path,
+    ]
+
+
+def _lazy_export(in_path, out_path, *, settings=None, probe=None) -> str:
+    """Final export of the captioned clip (argv-list, no shell).
+
+    By default every clip gets the libx264 encode (the CRF 23 deliverable).
+    With ``settings.exportRemux`` explicitly ``True``, a clip the earlier stages
+    already left as H.264/AAC MP4 (:func:`export_can_remux`) is stream-copied
+    instead — faster, but it keeps the upstream stage's rate control, so the
+    final bitrate can differ from the encode. ``probe``
+    (``media_compat.probe_media``-shaped) is injectable; a probe that cannot run
+    counts as "not remuxable".
+    """
     from .. import ffmpeg as _ffmpeg
+    from . import media_compat as _media_compat
 
-    argv = _ffmpeg.build_convert_argv(in_path, out_path, {"vcodec": "libx264", "acodec": "aac"}, settings)
+    probed: dict[str, Any] = {}
+    if (settings or {}).get("exportRemux") is True:
+        try:
+            probed = (probe or _media_compat.probe_media)(in_path, settings)
+        except Exception:  # noqa: BLE001 - no ffprobe -> take the encode path
+            probed = {}
+    if export_can_remux(probed):
+        argv = build_export_remux_argv(in_path, out_path, settings)
+    else:
+        argv = _ffmpeg.build_convert_argv(in_path, out_path, {"vcodec": "libx264", "acodec": "aac"}, settings)
     code = _ffmpeg.run(argv)
     if code != 0:  # pragma: no cover - prod seam
         raise RuntimeError(f"ffmpeg export failed (exit {code}) for {out_path}")
@@ -1120,7 +1197,8 @@ def _export_one(
         )
         export_input = branded_path
 
-    # EXPORT — final libx264 encode. WU SP2: the FINAL clip carries the
+    # EXPORT — final libx264 encode (an opt-in stream copy when the clip already
+    # is one, see _lazy_export). WU SP2: the FINAL clip carries the
     # rank-ordered ``NN-`` filename prefix (``final_stem``) so the exported set
     # sorts by virality rank; intermediates keep the plain working ``stem``.
     final_path = str(out_dir / f"{final_stem or stem}.mp4")
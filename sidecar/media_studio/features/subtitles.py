@@ -25,12 +25,15 @@ the (separately-owned) provider module: the provider is duck-typed via the
 
 from __future__ import annotations
 
+import contextlib
+import io
 import json
+import os
 import re
 import uuid
 from collections.abc import Callable, Sequence
 from pathlib import Path
-from typing import Any, Protocol
+from typing import Any, Protocol, TextIO
 
 # --------------------------------------------------------------------------- #
 # Types (dicts keyed exactly as CONTRACTS.md §3 — TypedDict-style aliases).
@@ -177,32 +180,41 @@ def _split_segment(
     omitted when the segment has none).
     """
     cues: list[Cue] = []
-    cur: list[dict[str, Any]] = []
+    # The open cue as its stripped word texts + its first start / last end, read
+    # from each word dict ONCE (the old loop re-read ``cur[0]`` and re-stripped
+    # every word on flush).
+    pieces: list[str] = []
+    cur_start = cur_end = 0.0
 
     def flush() -> None:
-        if not cur:
-            return
-        text = " ".join(str(w.get("text", "")).strip() for w in cur).strip()
+        text = " ".join(pieces).strip()
         if text:
-            cues.append(
-                make_cue(
-                    0,
-                    float(cur[0].get("start", 0.0)),
-                    float(cur[-1].get("end", 0.0)),
-                    text,
-                    speaker=speaker,
-                )
-            )
+            cues.append(make_cue(0, cur_start, cur_end, text, speaker=speaker))
 
+    # Running length of the open cue's stripped, space-joined text, plus the blank
+    # tokens trailing it (each widens the NEXT join by one space) — so measuring a
+    # tentative line is O(1) instead of re-joining every word already in it.
+    cur_chars = 0
+    cur_gap = 0
     for w in words:
-        tentative = cur + [w]
-        text = " ".join(str(x.get("text", "")).strip() for x in tentative).strip()
-        span = float(tentative[-1].get("end", 0.0)) - float(tentative[0].get("start", 0.0))
-        if cur and (len(text) > max_chars or span > max_duration):
+        get = w.get
+        piece = str(get("text", "")).strip()
+        end = float(get("end", 0.0))
+        if not piece:
+            chars, gap = cur_chars, cur_gap + (1 if cur_chars else 0)
+        else:
+            chars, gap = (cur_chars + cur_gap + 1 + len(piece) if cur_chars else len(piece)), 0
+        if pieces and (chars > max_chars or end - cur_start > max_duration):
             flush()
-            cur = [w]
+            pieces = [piece]
+            cur_start = float(get("start", 0.0))
+            cur_chars, cur_gap = len(piece), 0
         else:
-            cur = tentative
+            if not pieces:
+                cur_start = float(get("start", 0.0))
+            pieces.append(piece)
+            cur_chars, cur_gap = chars, gap
+        cur_end = end
     flush()
     return cues
 
@@ -462,35 +474,42 @@ def stack_bilingual(
 # --------------------------------------------------------------------------- #
 # timestamp helpers
 # --------------------------------------------------------------------------- #
-def _split_seconds(seconds: float) -> tuple[int, int, int, int]:
-    """Decompose seconds into (h, m, s, ms), clamping negatives to zero."""
-    total_ms = int(round(max(0.0, float(seconds)) * 1000))
-    ms = total_ms % 1000
+def _total_ms(seconds: float) -> int:
+    """``seconds`` as whole milliseconds (rounded), clamping negatives to zero."""
+    return int(round(max(0.0, float(seconds)) * 1000))
+
+
+def _format_clock(seconds: float, sep: str) -> str:
+    """``HH:MM:SS<sep>mmm`` from ONE rounded millisecond integer (SRT/VTT hot path).
+
+    ``sep`` is the decimal separator (``,`` for SRT, ``.`` for VTT), written
+    directly — there is no post-hoc ``.replace`` for the VTT form.
+    """
+    total_ms = _total_ms(seconds)
     total_s = total_ms // 1000
-    s = total_s % 60
-    total_m = total_s // 60
-    m = total_m % 60
-    h = total_m // 60
-    return h, m, s, ms
+    return f"{total_s // 3600:02d}:{total_s // 60 % 60:02d}:{total_s % 60:02d}{sep}{total_ms % 1000:03d}"
+
+
+def _format_span(start: float, end: float, sep: str) -> str:
+    """The ``<start> --> <end>`` SRT/VTT timing line, both clocks in one call."""
+    return f"{_format_clock(start, sep)} --> {_format_clock(end, sep)}"
 
 
 def format_timestamp_srt(seconds: float) -> str:
     """``HH:MM:SS,mmm`` — the SRT timestamp form (comma decimal separator)."""
-    h, m, s, ms = _split_seconds(seconds)
-    return f"{h:02d}:{m:02d}:{s:02d},{ms:03d}"
+    return _format_clock(seconds, ",")
 
 
 def format_timestamp_vtt(seconds: float) -> str:
     """``HH:MM:SS.mmm`` — the WebVTT timestamp form (dot decimal separator)."""
-    h, m, s, ms = _split_seconds(seconds)
-    return f"{h:02d}:{m:02d}:{s:02d}.{ms:03d}"
+    return _format_clock(seconds, ".")
 
 
 def format_timestamp_ass(seconds: float) -> str:
     """``H:MM:SS.cc`` — the ASS timestamp form (centiseconds, 1-digit hours)."""
-    h, m, s, ms = _split_seconds(seconds)
-    cs = ms // 10
-    return f"{h:d}:{m:02d}:{s:02d}.{cs:02d}"
+    total_ms = _total_ms(seconds)
+    total_s = total_ms // 1000
+    return f"{total_s // 3600:d}:{total_s // 60 % 60:02d}:{total_s % 60:02d}.{total_ms % 1000 // 10:02d}"
 
 
 _TS_RE = re.compile(r"(?P<h>\d+):(?P<m>\d{1,2}):(?P<s>\d{1,2})(?:[.,](?P<frac>\d{1,3}))?")
@@ -502,13 +521,16 @@ def parse_timestamp(text: str) -> float:
     Accepts comma or dot fractional separators and 2- or 3-digit fractions
     (ASS centiseconds vs SRT/VTT milliseconds). Raises ``ValueError`` on garbage.
     """
-    m = _TS_RE.search(text.strip())
-    if not m:
+    # ``search`` is unanchored, so surrounding whitespace (and any trailing SRT
+    # position / VTT cue settings) needs no strip; one ``groups()`` unpack reads
+    # every field (an absent fraction defaults to "").
+    m = _TS_RE.search(text)
+    if m is None:
         raise ValueError(f"unparseable timestamp: {text!r}")
-    h = int(m.group("h"))
-    mn = int(m.group("m"))
-    s = int(m.group("s"))
-    frac_raw = m.group("frac") or ""
+    h_raw, m_raw, s_raw, frac_raw = m.groups("")
+    h = int(h_raw)
+    mn = int(m_raw)
+    s = int(s_raw)
     if not frac_raw:
         frac = 0.0
     elif len(frac_raw) == 2:  # centiseconds (ASS)
@@ -521,42 +543,79 @@ def parse_timestamp(text: str) -> float:
 # --------------------------------------------------------------------------- #
 # SRT
 # --------------------------------------------------------------------------- #
+def write_srt(cues: Sequence[Cue], out: TextIO) -> None:
+    """Stream cues to ``out`` as SRT, one block per ``write`` (see :func:`to_srt`).
+
+    Blocks are numbered 1..N in input order (what :func:`reindex` would assign)
+    without materializing the reindexed cues or the whole document first, so an
+    hour-long track is written to disk without a second in-memory copy.
+    """
+    span = _format_span
+    for i, cue in enumerate(cues, start=1):
+        text = str(cue.get("text", "")).strip("\n")
+        sep = "\n" if i > 1 else ""
+        out.write(f"{sep}{i}\n{span(cue.get('start', 0.0), cue.get('end', 0.0), ',')}\n{text}\n")
+
+
 def to_srt(cues: Sequence[Cue]) -> str:
     """Serialize cues to SRT text (blank line between blocks, trailing newline)."""
-    blocks: list[str] = []
-    for i, cue in enumerate(reindex(cues), start=1):
-        start = format_timestamp_srt(cue["start"])
-        end = format_timestamp_srt(cue["end"])
-        text = str(cue["text"]).strip("\n")
-        blocks.append(f"{i}\n{start} --> {end}\n{text}")
-    return "\n\n".join(blocks) + ("\n" if blocks else "")
+    buf = io.StringIO()
+    write_srt(cues, buf)
+    return buf.getvalue()
+
+
+#: One SRT block: a blank-line-separated block whose optional numeric index line
+#: is followed by the ``-->`` timing line, then the body lines up to the next
+#: blank line — matched with ONE ``finditer`` sweep over the whole document (the
+#: same shape as :data:`_VTT_CUE_RE`). The usual ``HH:MM:SS,mmm --> HH:MM:SS,mmm``
+#: timing line is captured field by field so its seconds are computed directly;
+#: any other ``-->`` line falls through to :func:`parse_timestamp`.
+_SRT_CUE_RE = re.compile(
+    r"(?:\A|\n\s*\n)"
+    r"(?:[^\S\n]*\d+[^\S\n]*\n)?"  # optional numeric index line
+    r"(?P<timing>"
+    r"[^\S\n]*(?P<h1>\d+):(?P<m1>\d\d):(?P<s1>\d\d)[,.](?P<f1>\d{3})[^\S\n]*-->"
+    r"[^\S\n]*(?P<h2>\d+):(?P<m2>\d\d):(?P<s2>\d\d)[,.](?P<f2>\d{3})[^\n]*"
+    r"|[^\n]*-->[^\n]*)"
+    r"(?P<body>(?:\n(?![^\S\n]*\n)[^\n]*)*)"
+)
 
 
 def read_srt(text: str) -> list[Cue]:
-    """Parse SRT text into cues (tolerant of CRLF, BOM, and missing indices)."""
+    """Parse SRT text into cues (tolerant of CRLF, BOM, and missing indices).
+
+    Cues are numbered 1..N by position as they are built (the source index lines
+    are ignored), so a bulk import allocates each cue dict once instead of
+    building the list and then copying it through :func:`reindex`.
+    """
     body = text.lstrip("﻿").replace("\r\n", "\n").replace("\r", "\n")
     cues: list[Cue] = []
-    for block in re.split(r"\n\s*\n", body.strip()):
-        block = block.strip("\n")
-        if not block.strip():
-            continue
-        lines = block.split("\n")
-        # Optional numeric index line.
-        if lines and lines[0].strip().isdigit():
-            lines = lines[1:]
-        if not lines or "-->" not in lines[0]:
-            continue
-        start_raw, _, end_raw = lines[0].partition("-->")
-        start = parse_timestamp(start_raw)
-        end = parse_timestamp(end_raw)
-        body_text = "\n".join(lines[1:]).strip("\n")
-        cues.append(make_cue(0, start, end, body_text))
-    return reindex(cues)
+    for index, match in enumerate(_SRT_CUE_RE.finditer(body.strip()), start=1):
+        h1, m1, s1, f1, h2, m2, s2, f2 = match.group("h1", "m1", "s1", "f1", "h2", "m2", "s2", "f2")
+        if h1 is not None:
+            start = int(h1) * 3600 + int(m1) * 60 + int(s1) + int(f1) / 1000.0
+            end = int(h2) * 3600 + int(m2) * 60 + int(s2) + int(f2) / 1000.0
+        else:
+            start_raw, _, end_raw = match.group("timing").partition("-->")
+            start = parse_timestamp(start_raw)
+            end = parse_timestamp(end_raw)
+        cues.append(make_cue(index, start, end, match.group("body").strip("\n")))
+    return cues
 
 
 # --------------------------------------------------------------------------- #
 # WebVTT
 # --------------------------------------------------------------------------- #
+def write_vtt(cues: Sequence[Cue], out: TextIO) -> None:
+    """Stream cues to ``out`` as WebVTT, one cue per ``write`` (see :func:`to_vtt`)."""
+    span = _format_span
+    out.write("WEBVTT\n\n")
+    for i, cue in enumerate(cues):
+        text = str(cue.get("text", "")).strip("\n")
+        sep = "\n" if i else ""
+        out.write(f"{sep}{span(cue.get('start', 0.0), cue.get('end', 0.0), '.')}\n{text}\n")
+
+
 def to_vtt(cues: Sequence[Cue]) -> str:
     """Serialize cues to WebVTT text (``WEBVTT`` header + dot-separator times).
 
@@ -564,36 +623,35 @@ def to_vtt(cues: Sequence[Cue]) -> str:
     WebVTT spec requires (browsers / ffmpeg reject a header with no trailing
     blank line).
     """
-    parts: list[str] = []
-    for cue in reindex(cues):
-        start = format_timestamp_vtt(cue["start"])
-        end = format_timestamp_vtt(cue["end"])
-        text = str(cue["text"]).strip("\n")
-        parts.append(f"{start} --> {end}\n{text}")
-    return "WEBVTT\n\n" + "\n\n".join(parts) + ("\n" if parts else "")
+    buf = io.StringIO()
+    write_vtt(cues, buf)
+    return buf.getvalue()
+
+
+#: One WebVTT cue block: a blank-line-separated block (not a ``NOTE``) whose
+#: optional id line is followed by the ``-->`` timing line, then the body lines
+#: up to the next blank line. Matched with ONE ``finditer`` sweep over the whole
+#: document instead of splitting it into blocks and walking each in Python.
+_VTT_CUE_RE = re.compile(
+    r"(?:\A|\n\s*\n)(?!NOTE)"
+    r"(?:[ \t]*\S(?:(?!-->)[^\n])*\n)?"  # optional cue id (no "-->" in it)
+    r"(?P<timing>[^\n]*-->[^\n]*)"
+    r"(?P<body>(?:\n(?![^\S\n]*\n)[^\n]*)*)"
+)
 
 
 def read_vtt(text: str) -> list[Cue]:
     """Parse WebVTT text into cues (skips ``WEBVTT`` header, NOTE, and cue ids)."""
     body = text.lstrip("﻿").replace("\r\n", "\n").replace("\r", "\n")
-    body = re.sub(r"^WEBVTT[^\n]*\n?", "", body, count=1)
+    if body.startswith("WEBVTT"):
+        body = body.partition("\n")[2]  # drop the header line (no per-call regex)
     cues: list[Cue] = []
-    for block in re.split(r"\n\s*\n", body.strip()):
-        block = block.strip("\n")
-        if not block.strip() or block.startswith("NOTE"):
-            continue
-        lines = block.split("\n")
-        # A cue may carry an id line before the timing line.
-        if "-->" not in lines[0] and len(lines) > 1 and "-->" in lines[1]:
-            lines = lines[1:]
-        if "-->" not in lines[0]:
-            continue
-        timing = lines[0].split("-->")
+    for match in _VTT_CUE_RE.finditer(body.strip()):
+        timing = match.group("timing").split("-->")
         start = parse_timestamp(timing[0])
         # Strip any cue settings (e.g. "align:start") after the end timestamp.
-        end = parse_timestamp(timing[1].strip().split(" ")[0])
-        body_text = "\n".join(lines[1:]).strip("\n")
-        cues.append(make_cue(0, start, end, body_text))
+        end = parse_timestamp(timing[1].strip().partition(" ")[0])
+        cues.append(make_cue(0, start, end, match.group("body").strip("\n")))
     return reindex(cues)
 
 
@@ -616,6 +674,16 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
 """
 
 
+#: One-pass :func:`escape_ass_text` table. Braces become a brace-FREE, reversible
+#: escape: ``{`` -> ``\(`` and ``}`` -> ``\)``, so the output contains NO raw
+#: ``{``/``}`` and no ASS override block can be injected (CONTRACTS.md §4), while
+#: :func:`_unescape_ass_text` reverses it losslessly. A literal ``\`` doubles, so
+#: a literal ``\(`` encodes as ``\\(`` — collision-free. ``str.translate`` maps
+#: each source character once and never rescans its output, so the inserted
+#: backslashes are not doubled (``\r\n`` is folded to ``\n`` beforehand).
+_ASS_ESCAPE = str.maketrans({"\\": "\\\\", "{": "\\(", "}": "\\)", "\r": "\\N", "\n": "\\N"})
+
+
 def escape_ass_text(text: str) -> str:
     r"""Escape cue text for an ASS ``Dialogue`` field.
 
@@ -623,16 +691,7 @@ def escape_ass_text(text: str) -> str:
     are neutralized, newlines become the ASS ``\N`` line break, and commas are
     preserved (the Text field is the last field, so embedded commas are safe).
     """
-    out = str(text)
-    out = out.replace("\\", "\\\\")  # literal backslash first
-    # Neutralize braces to a brace-FREE, reversible escape: '{' -> '\(' and
-    # '}' -> '\)'. The output contains NO raw '{'/'}' so no ASS override block can
-    # be injected (CONTRACTS.md §4), and _unescape_ass_text reverses it losslessly.
-    # ('\' is escaped first, so a literal '(' / ')' is never confused with an
-    # escaped brace, and a literal '\(' encodes as '\\(' — collision-free.)
-    out = out.replace("{", "\\(").replace("}", "\\)")
-    out = out.replace("\r\n", "\n").replace("\r", "\n").replace("\n", "\\N")
-    return out
+    return str(text).replace("\r\n", "\n").translate(_ASS_ESCAPE)
 
 
 #: Reverse map for :func:`_unescape_ass_text` — each ``\<key>`` decodes to its
@@ -664,19 +723,24 @@ def _unescape_ass_text(text: str) -> str:
     return "".join(out)
 
 
+def write_ass(cues: Sequence[Cue], out: TextIO, *, width: int = 1080, height: int = 1920, fontsize: int = 54) -> None:
+    """Stream a complete ASS document to ``out``, one ``Dialogue:`` line per write."""
+    out.write(_ASS_HEADER.format(width=width, height=height, fontsize=fontsize) + "\n")
+    clock = format_timestamp_ass
+    for cue in cues:
+        text = escape_ass_text(cue.get("text", ""))
+        out.write(f"Dialogue: 0,{clock(cue.get('start', 0.0))},{clock(cue.get('end', 0.0))},Default,,0,0,0,,{text}\n")
+
+
 def to_ass(cues: Sequence[Cue], *, width: int = 1080, height: int = 1920, fontsize: int = 54) -> str:
     """Serialize cues to a complete ASS document sized ``width`` x ``height``.
 
     Cue text is escaped (:func:`escape_ass_text`) so no override block can be
     injected (CONTRACTS.md §4). Default canvas is the 9:16 short format.
     """
-    lines = [_ASS_HEADER.format(width=width, height=height, fontsize=fontsize)]
-    for cue in reindex(cues):
-        start = format_timestamp_ass(cue["start"])
-        end = format_timestamp_ass(cue["end"])
-        text = escape_ass_text(cue["text"])
-        lines.append(f"Dialogue: 0,{start},{end},Default,,0,0,0,,{text}")
-    return "\n".join(lines) + "\n"
+    buf = io.StringIO()
+    write_ass(cues, buf, width=width, height=height, fontsize=fontsize)
+    return buf.getvalue()
 
 
 def read_ass(text: str) -> list[Cue]:
@@ -743,6 +807,11 @@ _SERIALIZERS: dict[str, Callable[[Sequence[Cue]], str]] = {
     "vtt": to_vtt,
     "ass": to_ass,
 }
+_WRITERS: dict[str, Callable[[Sequence[Cue], TextIO], None]] = {
+    "srt": write_srt,
+    "vtt": write_vtt,
+    "ass": write_ass,
+}
 _PARSERS: dict[str, Callable[[str], list[Cue]]] = {
     "srt": read_srt,
     "vtt": read_vtt,
@@ -775,11 +844,22 @@ def export(track: SubtitleTrack, fmt: str, out_path: str | Path) -> str:
     """Write ``track`` to ``out_path`` as ``fmt`` and return the path (§2).
 
     The handler maps ``subtitles.export({trackId, format}) -> {path}`` onto this.
+    The cues are streamed (never joined into one string) into a temp sibling that
+    is ``os.replace``-d over ``out_path`` once complete, so a failed or interrupted
+    export never leaves a truncated file behind (or clobbers a previous export).
     """
     f = _normalize_format(fmt)
     path = Path(out_path)
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(serialize(track, f), encoding="utf-8")
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        with tmp.open("w", encoding="utf-8") as fh:
+            _WRITERS[f](track.get("cues") or [], fh)
+        os.replace(tmp, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            tmp.unlink()
+        raise
     return str(path)
 
 
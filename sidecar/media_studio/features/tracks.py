@@ -32,11 +32,13 @@ heavy-ML imports here, so the unit tests stay light.
 
 from __future__ import annotations
 
+import contextlib
+import io
 import os
 import subprocess
 from collections.abc import Callable, Sequence
 from pathlib import Path
-from typing import Any
+from typing import Any, TextIO
 
 from .. import ffmpeg
 from ..jobs import JobContext
@@ -188,6 +190,13 @@ def normalize_track(track: dict[str, Any]) -> SubtitleTrack:
 # --------------------------------------------------------------------------- #
 # ASS sidecar generation (libass) — escaping per CONTRACTS.md section 4
 # --------------------------------------------------------------------------- #
+
+#: :func:`ass_escape` as one ``str.translate`` pass (``\r\n`` folded first).
+#: translate never rescans its output, so the backslashes it inserts for braces
+#: and newlines are not themselves doubled.
+_ASS_ESCAPE = str.maketrans({"\\": "\\\\", "{": "\\{", "}": "\\}", "\r": "\\N", "\n": "\\N"})
+
+
 def ass_escape(text: str) -> str:
     r"""Escape cue text for safe embedding in an ASS dialogue line.
 
@@ -201,43 +210,38 @@ def ass_escape(text: str) -> str:
 
     The result is safe to drop into a ``Dialogue:`` line's text field.
     """
-    out = (text or "").replace("\\", "\\\\")
-    out = out.replace("{", "\\{").replace("}", "\\}")
-    out = out.replace("\r\n", "\n").replace("\r", "\n").replace("\n", "\\N")
-    return out
+    return (text or "").replace("\r\n", "\n").translate(_ASS_ESCAPE)
+
+
+#: ``H:MM:SS.cc`` from ``(h, m, s, cs)`` in one C-level ``str.format`` call
+#: (cheaper than an f-string's four per-field formats plus join).
+_ASS_CLOCK = "{:d}:{:02d}:{:02d}.{:02d}".format
 
 
 def _ass_timestamp(seconds: float) -> str:
-    """Format ``seconds`` as an ASS ``H:MM:SS.cc`` timestamp (centiseconds)."""
-    seconds = max(0.0, float(seconds))
-    centis_total = int(round(seconds * 100))
-    cs = centis_total % 100
-    total_s = centis_total // 100
-    s = total_s % 60
-    m = (total_s // 60) % 60
-    h = total_s // 3600
-    return f"{h:d}:{m:02d}:{s:02d}.{cs:02d}"
+    """Format ``seconds`` as an ASS ``H:MM:SS.cc`` timestamp (centiseconds).
 
+    Negatives AND NaN clamp to zero: ``max(0.0, nan)`` keeps the ``0.0`` (a NaN
+    compares false), so a cue with a corrupt end time is written, not raised on.
+    """
+    cs = round(max(0.0, float(seconds)) * 100)  # whole centiseconds
+    return _ASS_CLOCK(cs // 360000, cs // 6000 % 60, cs // 100 % 60, cs % 100)
 
-def build_ass_document(
+
+def write_ass_document(
     cues: Sequence[Cue],
+    out: TextIO,
     width: int = 1080,
     height: int = 1920,
     source_start: float = 0.0,
-) -> str:
-    """Render ``cues`` into a complete ASS subtitle document string.
+) -> None:
+    """Stream the :func:`build_ass_document` ASS document to ``out``.
 
-    - Sized for ``width`` x ``height`` (``PlayResX``/``PlayResY``), matching the
-      CaptionEngine sizing convention (section 4).
-    - Cue times are **re-based** by subtracting ``source_start`` (a clip's start
-      in the original video) so captions line up with the clip's local t=0
-      (section 3 ``Candidate.sourceStart`` / section 4).
-    - Every cue's text is run through :func:`ass_escape`.
-
-    Cues that fall entirely before the rebase point (end <= 0 after subtraction)
-    are dropped; a cue straddling t=0 is clamped to start at 0.
+    The header goes out in one ``write`` and each kept cue in one more, so a
+    file target never holds the whole document (or a second encoded copy of it)
+    in memory.
     """
-    header = (
+    out.write(
         "[Script Info]\n"
         "ScriptType: v4.00+\n"
         f"PlayResX: {int(width)}\n"
@@ -256,16 +260,38 @@ def build_ass_document(
         "Format: Layer, Start, End, Style, Name, MarginL, MarginR, "
         "MarginV, Effect, Text\n"
     )
-    lines: list[str] = [header]
+    offset = float(source_start)
     for cue in cues:
-        start = float(cue.get("start", 0.0)) - float(source_start)
-        end = float(cue.get("end", 0.0)) - float(source_start)
+        start = float(cue.get("start", 0.0)) - offset
+        end = float(cue.get("end", 0.0)) - offset
         if end <= 0:
             continue
         start = max(0.0, start)
         text = ass_escape(str(cue.get("text", "")))
-        lines.append(f"Dialogue: 0,{_ass_timestamp(start)},{_ass_timestamp(end)},Default,,0,0,0,,{text}\n")
-    return "".join(lines)
+        out.write(f"Dialogue: 0,{_ass_timestamp(start)},{_ass_timestamp(end)},Default,,0,0,0,,{text}\n")
+
+
+def build_ass_document(
+    cues: Sequence[Cue],
+    width: int = 1080,
+    height: int = 1920,
+    source_start: float = 0.0,
+) -> str:
+    """Render ``cues`` into a complete ASS subtitle document string.
+
+    - Sized for ``width`` x ``height`` (``PlayResX``/``PlayResY``), matching the
+      CaptionEngine sizing convention (section 4).
+    - Cue times are **re-based** by subtracting ``source_start`` (a clip's start
+      in the original video) so captions line up with the clip's local t=0
+      (section 3 ``Candidate.sourceStart`` / section 4).
+    - Every cue's text is run through :func:`ass_escape`.
+
+    Cues that fall entirely before the rebase point (end <= 0 after subtraction)
+    are dropped; a cue straddling t=0 is clamped to start at 0.
+    """
+    buf = io.StringIO()
+    write_ass_document(cues, buf, width=width, height=height, source_start=source_start)
+    return buf.getvalue()
 
 
 # --------------------------------------------------------------------------- #
@@ -447,11 +473,24 @@ def write_ass_sidecar(
     height: int = 1920,
     source_start: float = 0.0,
 ) -> str:
-    """Render ``cues`` to an ASS file at ``out_path`` and return its path."""
-    doc = build_ass_document(cues, width=width, height=height, source_start=source_start)
+    """Render ``cues`` to an ASS file at ``out_path`` and return its path.
+
+    The document is streamed cue by cue (:func:`write_ass_document`) rather than
+    built as one string and encoded whole, into a temp sibling that is
+    ``os.replace``-d over ``out_path`` once complete — a failed write never leaves
+    a truncated sidecar for the burn step to pick up.
+    """
     p = Path(out_path)
     p.parent.mkdir(parents=True, exist_ok=True)
-    p.write_text(doc, encoding="utf-8")
+    tmp = p.with_name(f"{p.name}.{os.getpid()}.tmp")
+    try:
+        with tmp.open("w", encoding="utf-8") as fh:
+            write_ass_document(cues, fh, width=width, height=height, source_start=source_start)
+        os.replace(tmp, p)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            tmp.unlink()
+        raise
     return str(p)
 
 
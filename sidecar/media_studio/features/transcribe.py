@@ -31,10 +31,13 @@ import os
 import sys
 from collections.abc import Callable
 from pathlib import Path
-from typing import Any, Protocol
+from typing import TYPE_CHECKING, Any, Protocol
 
 from ..util import clamp, get_logger
 
+if TYPE_CHECKING:  # pragma: no cover - typing-only import, never executed at runtime
+    from .transcript_cache import TranscriptCache
+
 log = get_logger("media_studio.features.transcribe")
 
 _cuda_dirs_registered = False
@@ -87,6 +90,30 @@ TRANSCRIBE_DEVICE_KEY = "transcribeDevice"
 TRANSCRIBE_MODEL_KEY = "transcribeModel"
 #: the sentinel meaning "decide automatically" for both knobs above.
 AUTO = "auto"
+#: the settings key overriding the CTranslate2 ``compute_type`` (``auto`` = the
+#: device default: ``float16`` on CUDA, ``int8`` on CPU).
+TRANSCRIBE_COMPUTE_KEY = "transcribeComputeType"
+#: the CTranslate2 weight/activation types an explicit override may name. Smaller
+#: types move fewer bytes per weight through the (bandwidth-bound) decoder.
+COMPUTE_TYPES: tuple[str, ...] = (
+    "int8",
+    "int8_float16",
+    "int8_bfloat16",
+    "int8_float32",
+    "float16",
+    "bfloat16",
+    "float32",
+)
+#: the settings key for faster-whisper's batched decoding (an int; absent or ``1`` =
+#: off). Opt-in: ``BatchedInferencePipeline`` VAD-chunks long audio and decodes the
+#: chunks in parallel (~2-3x the sequential throughput on a GPU), but it changes the
+#: transcript text and timing, so the default stays the sequential decoder.
+TRANSCRIBE_BATCH_KEY = "transcribeBatchSize"
+#: upper clamp for an explicit ``transcribeBatchSize`` (keeps VRAM bounded).
+MAX_BATCH_SIZE = 64
+#: the settings key opting the sequential decode into :data:`SEQUENTIAL_DECODE_OPTIONS`
+#: (a bool; off by default because it changes the transcript text and timing).
+TRANSCRIBE_SKIP_SILENCE_KEY = "transcribeSkipSilence"
 
 #: a CUDA-availability probe seam: ``() -> bool``. Injected in tests; the default
 #: (:func:`_default_cuda_probe`) consults torch lazily and degrades to ``False``.
@@ -103,6 +130,12 @@ CancelProbe = Callable[[], bool]
 ProgressCb = Callable[[float, str], None]
 # F3b: a one-shot notice sink invoked when a GPU load falls back to CPU.
 FallbackNotice = Callable[[str], None]
+# A shared-decode seam: (path) -> (mono float32 samples, sample rate). The caller
+# passes one (e.g. ``ctc_align.load_pcm_16k`` behind a per-job memo) when the same
+# audio is decoded again later in the job, so whisper reuses that buffer.
+PcmLoader = Callable[[str], "tuple[Any, int]"]
+# A load sink: (device, compute type) whisper actually loaded with (after any CPU fallback).
+LoadedCb = Callable[[str, str], None]
 
 #: F3b user-facing notice when the GPU is unavailable and we run on CPU instead.
 #: Surfaced as a ``job.progress`` message so the slowdown is LOUD, not silent.
@@ -234,8 +267,9 @@ def resolve_transcribe_target(
 ) -> tuple[str, str, str]:
     """Resolve ``(model, device, compute_type)`` from settings + auto-detection.
 
-    The two knobs (``transcribeDevice`` / ``transcribeModel``, both defaulting to
-    ``"auto"``) follow the tolerant pattern of :func:`selected_asr_engine`:
+    The knobs (``transcribeDevice`` / ``transcribeModel`` /
+    ``transcribeComputeType``, all defaulting to ``"auto"``) follow the tolerant
+    pattern of :func:`selected_asr_engine`:
 
       * ``transcribeDevice`` == ``"cuda"`` -> force GPU (``float16``) regardless of
         detection; == ``"cpu"`` -> force CPU (``int8``); anything else (``auto``,
@@ -243,6 +277,9 @@ def resolve_transcribe_target(
       * the model defaults to the device-appropriate auto model (large turbo on
         GPU, :data:`CPU_MODEL` on CPU) and is overridden only by an explicit,
         non-empty string ``transcribeModel``.
+      * the compute type defaults to the device's (``float16`` / ``int8``) and is
+        overridden only by a ``transcribeComputeType`` naming one of
+        :data:`COMPUTE_TYPES` (case-insensitive); anything else keeps the default.
 
     Returning the resolved triple lets the caller pass it straight into
     :func:`transcribe_file` (whose ``model``/``device``/``compute_type`` params
@@ -260,6 +297,10 @@ def resolve_transcribe_target(
     else:  # "auto" / unknown / non-string -> detect
         device, compute = detect_device(probe=probe)
 
+    compute_raw = settings.get(TRANSCRIBE_COMPUTE_KEY)
+    if isinstance(compute_raw, str) and compute_raw.strip().lower() in COMPUTE_TYPES:
+        compute = compute_raw.strip().lower()
+
     model = DEFAULT_MODEL if device == DEFAULT_DEVICE else CPU_MODEL
     model_raw = settings.get(TRANSCRIBE_MODEL_KEY)
     if isinstance(model_raw, str):
@@ -269,16 +310,79 @@ def resolve_transcribe_target(
     return model, device, compute
 
 
+def resolve_batch_size(settings: dict[str, Any] | None) -> int | None:
+    """The faster-whisper decode batch, or ``None`` for the sequential decoder.
+
+    Only an explicit integer ``transcribeBatchSize`` batches (clamped to
+    ``1..``:data:`MAX_BATCH_SIZE`; ``1`` means sequential). Absent, a non-integer,
+    or a ``bool`` keeps the sequential decode on every device — like
+    ``transcribeSkipSilence``, batching is opt-in because it changes the output.
+    """
+    settings = settings or {}
+    raw = settings.get(TRANSCRIBE_BATCH_KEY)
+    if not isinstance(raw, int) or isinstance(raw, bool):
+        return None
+    size = int(clamp(raw, 1, MAX_BATCH_SIZE))
+    return size if size > 1 else None
+
+
+#: Extra ``transcribe`` kwargs for the sequential (unbatched) decode when
+#: ``transcribeSkipSilence`` is on. The batched pipeline already runs Silero VAD
+#: and decodes each speech chunk on its own; with these the sequential decode
+#: skips silent stretches (lectures, podcasts, long pauses) instead of decoding
+#: them, and a hallucinated line cannot seed the next window's prompt. Opt-in:
+#: dropping the cross-window context changes the transcript, not just its speed.
+SEQUENTIAL_DECODE_OPTIONS: dict[str, Any] = {"vad_filter": True, "condition_on_previous_text": False}
+
+
+def resolve_skip_silence(settings: dict[str, Any] | None) -> bool:
+    """Whether the sequential decode uses :data:`SEQUENTIAL_DECODE_OPTIONS`.
+
+    Only an explicit ``True`` for ``transcribeSkipSilence`` turns it on; absent or
+    any other value keeps whisper's own decode defaults.
+    """
+    return (settings or {}).get(TRANSCRIBE_SKIP_SILENCE_KEY) is True
+
+
+def batched_pipeline(whisper_model: WhisperModel) -> WhisperModel | None:
+    """Wrap a loaded model in faster-whisper's ``BatchedInferencePipeline``.
+
+    Returns ``None`` when the installed faster-whisper predates the pipeline (or
+    is absent, as under the test fakes) so the caller keeps the sequential
+    ``transcribe``. The wrapper holds no weights of its own — it reuses the loaded
+    model — so building one per call is cheap.
+    """
+    try:
+        from faster_whisper import BatchedInferencePipeline  # noqa: PLC0415 - heavy seam, runtime only
+    except ImportError:
+        return None
+    return BatchedInferencePipeline(model=whisper_model)
+
+
+#: Sentinel for "attribute absent" (an attribute that is present but ``None``
+#: must NOT fall through to the next name, matching :func:`_attr`).
+_MISSING: Any = object()
+
+
 def _word_to_dict(word: Any) -> Word:
     """Normalize a faster-whisper word object/dict into a §3 ``Word``.
 
     faster-whisper words expose ``word`` (with a leading space), ``start``,
     ``end``. We map ``word`` -> ``text`` (preserving the text verbatim) and coerce
-    the times to floats.
+    the times to floats. This runs once per word of the transcript, so it
+    branches on the payload kind once instead of going through :func:`_attr`'s
+    per-field ``isinstance`` / ``hasattr`` + ``getattr`` double lookup.
     """
-    text = _attr(word, "word", "text")
-    start = _attr(word, "start")
-    end = _attr(word, "end")
+    if isinstance(word, dict):
+        text = word["word"] if "word" in word else word.get("text")
+        start = word.get("start")
+        end = word.get("end")
+    else:
+        text = getattr(word, "word", _MISSING)
+        if text is _MISSING:
+            text = getattr(word, "text", None)
+        start = getattr(word, "start", None)
+        end = getattr(word, "end", None)
     return {
         "text": "" if text is None else str(text),
         "start": float(start or 0.0),
@@ -288,13 +392,18 @@ def _word_to_dict(word: Any) -> Word:
 
 def _segment_to_dict(seg: Any) -> Segment:
     """Normalize a faster-whisper segment object/dict into a §3 ``Segment``."""
-    raw_words = _attr(seg, "words") or []
-    words: list[Word] = [_word_to_dict(w) for w in raw_words]
+    if isinstance(seg, dict):
+        raw_words, start, end, text = seg.get("words"), seg.get("start"), seg.get("end"), seg.get("text")
+    else:
+        raw_words = getattr(seg, "words", None)
+        start = getattr(seg, "start", None)
+        end = getattr(seg, "end", None)
+        text = getattr(seg, "text", None)
     return {
-        "start": float(_attr(seg, "start") or 0.0),
-        "end": float(_attr(seg, "end") or 0.0),
-        "text": str(_attr(seg, "text") or ""),
-        "words": words,
+        "start": float(start or 0.0),
+        "end": float(end or 0.0),
+        "text": str(text or ""),
+        "words": [_word_to_dict(w) for w in raw_words] if raw_words else [],
     }
 
 
@@ -313,6 +422,24 @@ def _attr(obj: Any, *names: str) -> Any:
     return None
 
 
+#: The sample rate faster-whisper expects of an in-memory audio array.
+WHISPER_SAMPLE_RATE = 16000
+
+
+def _whisper_input(audio_path: str, pcm_loader: PcmLoader | None) -> Any:
+    """The ``audio`` argument for ``transcribe``: shared samples, else the path."""
+    if pcm_loader is None:
+        return audio_path
+    try:
+        samples, sample_rate = pcm_loader(audio_path)
+    except Exception as exc:  # noqa: BLE001 - whisper can still decode the file itself
+        log.info("shared audio decode failed for %s (%s); whisper will decode it", audio_path, exc)
+        return audio_path
+    if int(sample_rate) != WHISPER_SAMPLE_RATE:
+        return audio_path
+    return samples
+
+
 def transcribe_file(
     audio_path: str,
     *,
@@ -321,8 +448,12 @@ def transcribe_file(
     model: str = DEFAULT_MODEL,
     device: str = DEFAULT_DEVICE,
     compute_type: str = DEFAULT_GPU_COMPUTE,
+    batch_size: int | None = None,
     on_progress: ProgressCb | None = None,
     should_cancel: CancelProbe | None = None,
+    pcm_loader: PcmLoader | None = None,
+    skip_silence: bool = False,
+    on_loaded: LoadedCb | None = None,
 ) -> Transcript:
     """Transcribe ``audio_path`` into a §3 :class:`Transcript`.
 
@@ -335,6 +466,22 @@ def transcribe_file(
     0..100 percentage. ``should_cancel`` is polled per segment so a cancelled job
     stops consuming the (lazy) segment generator promptly.
 
+    ``batch_size`` (see :func:`resolve_batch_size`) switches decoding to
+    faster-whisper's ``BatchedInferencePipeline`` over the same loaded model; it
+    is ignored (sequential decode) when the installed faster-whisper lacks the
+    pipeline. With ``skip_silence`` (see :func:`resolve_skip_silence`) the
+    sequential decode passes :data:`SEQUENTIAL_DECODE_OPTIONS` (VAD on, no
+    previous-text conditioning), matching what the pipeline does; otherwise it
+    keeps whisper's defaults. A known ``language`` is passed through, so whisper
+    skips its detection pass.
+
+    ``pcm_loader`` (see :data:`PcmLoader`) hands whisper pre-decoded 16 kHz mono
+    samples instead of the path; a loader that fails (or returns another rate)
+    falls back to whisper's own decode of ``audio_path``.
+
+    ``on_loaded`` (if given) receives the device and compute type the model was
+    actually loaded with — ``cpu``/``int8`` after a GPU fallback.
+
     CONTRACT-NOTE: faster-whisper's ``transcribe`` returns a *lazy generator* of
     segments; work only happens as we iterate. That is what makes per-segment
     progress + cooperative cancellation possible.
@@ -343,12 +490,27 @@ def transcribe_file(
     whisper_model, device_used = load_model_with_cpu_fallback(
         loader, model=model, device=device, compute_type=compute_type, on_fallback=notify
     )
-    log.info("transcribing %s on %s (lang=%s)", audio_path, device_used, language or "auto")
-
-    segments_iter, info = whisper_model.transcribe(
+    if on_loaded is not None:
+        on_loaded(device_used, compute_type if device_used == device else CPU_COMPUTE)
+    decoder: WhisperModel = whisper_model
+    options: dict[str, Any] = dict(SEQUENTIAL_DECODE_OPTIONS) if skip_silence else {}
+    if batch_size is not None:
+        batched = batched_pipeline(whisper_model)
+        if batched is not None:
+            decoder, options = batched, {"batch_size": batch_size}
+    log.info(
+        "transcribing %s on %s (lang=%s, batch=%s)",
         audio_path,
+        device_used,
+        language or "auto",
+        options.get("batch_size", "off"),
+    )
+
+    segments_iter, info = decoder.transcribe(
+        _whisper_input(audio_path, pcm_loader),
         language=language,
         word_timestamps=True,
+        **options,
     )
 
     duration = float(_attr(info, "duration") or 0.0)
@@ -435,6 +597,8 @@ def transcribe_with_engine(
     detect_probe: DeviceProbe | None = None,
     on_progress: ProgressCb | None = None,
     should_cancel: CancelProbe | None = None,
+    cache: TranscriptCache | None = None,
+    pcm_loader: PcmLoader | None = None,
 ) -> Transcript:
     """Transcribe via the settings-selected ASR engine; whisper-fallback on empty.
 
@@ -456,10 +620,39 @@ def transcribe_with_engine(
     :func:`resolve_transcribe_target` (settings knobs + CUDA auto-detection) so a
     non-GPU machine runs cpu/int8 with a CPU-appropriate model directly — instead
     of attempting cuda and relying on the exception fallback. ``detect_probe`` is
-    the injectable CUDA-availability seam.
+    the injectable CUDA-availability seam. ``transcribeBatchSize`` opts into
+    batched decoding (:func:`resolve_batch_size`); ``transcribeSkipSilence`` opts
+    the sequential decode into VAD (:func:`resolve_skip_silence`).
+
+    With a ``cache`` (:class:`~.transcript_cache.TranscriptCache`) a file already
+    transcribed under the same resolved config returns the stored transcript
+    without loading any model. A run is stored under the device / compute type
+    whisper actually loaded with, not the requested ones. Only completed runs are stored: a cancelled job
+    or a Parakeet degrade (which may succeed once its weights arrive) is not.
+
+    ``pcm_loader`` is forwarded to the whisper decode (:func:`transcribe_file`);
+    a cache hit never calls it.
     """
     model, device, compute_type = resolve_transcribe_target(settings, probe=detect_probe)
+    batch_size = resolve_batch_size(settings)
+    skip_silence = resolve_skip_silence(settings)
     engine = selected_asr_engine(settings)
+    config = {
+        "engine": engine,
+        "model": model,
+        "device": device,
+        "computeType": compute_type,
+        "batchSize": batch_size,
+        "skipSilence": skip_silence,
+        "language": language,
+    }
+    cache_key = None
+    if cache is not None:
+        cache_key = cache.key(audio_path, config)
+        cached = cache.get(cache_key) if cache_key is not None else None
+        if cached is not None:
+            log.info("transcript cache hit for %s", audio_path)
+            return cached
     if engine == PARAKEET_ENGINE:
         runner = parakeet_runner if parakeet_runner is not None else _default_parakeet_runner
         result = runner(
@@ -472,6 +665,7 @@ def transcribe_with_engine(
             should_cancel=should_cancel,
         )
         if result.get("segments"):
+            _store_completed(cache, cache_key, result, should_cancel)
             return result
         if should_cancel is not None and should_cancel():
             # Cancelled before the first chunk completed -> the empty transcript
@@ -481,16 +675,41 @@ def transcribe_with_engine(
             return result
         # Parakeet degraded (offline + weights missing) -> whisper fallback.
         log.info("parakeet produced no segments; falling back to whisper")
-    return transcribe_file(
+        cache_key = None
+    loaded: dict[str, str] = {}
+    result = transcribe_file(
         audio_path,
         loader=loader,
         language=language,
         model=model,
         device=device,
         compute_type=compute_type,
+        batch_size=batch_size,
         on_progress=on_progress,
         should_cancel=should_cancel,
+        pcm_loader=pcm_loader,
+        skip_silence=skip_silence,
+        on_loaded=lambda dev, ct: loaded.update(device=dev, computeType=ct),
     )
+    requested = {"device": device, "computeType": compute_type}
+    if cache is not None and cache_key is not None and loaded and loaded != requested:
+        # A GPU load fell back to CPU/int8: file the result under what actually
+        # ran, so a later run that does get the GPU is not served the CPU output.
+        cache_key = cache.key(audio_path, {**config, **loaded})
+    _store_completed(cache, cache_key, result, should_cancel)
+    return result
+
+
+def _store_completed(
+    cache: TranscriptCache | None,
+    key: str | None,
+    result: Transcript,
+    should_cancel: CancelProbe | None,
+) -> None:
+    """Store ``result`` under ``key`` unless caching is off or the job was cancelled."""
+    if cache is None or key is None or (should_cancel is not None and should_cancel()):
+        return
+    cache.put(key, result)
 
 
 # --------------------------------------------------------------------------- #
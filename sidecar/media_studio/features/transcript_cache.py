@@ -0,0 +1,165 @@
+"""Exact-match transcript cache keyed on media content + ASR config.
+
+Re-running ``transcribe.start`` on a file that was already transcribed with the
+same engine / model / device / compute type / batch / language repeats minutes of
+inference for a byte-identical result. :class:`TranscriptCache` short-circuits
+that: the key is the whole-file BLAKE3 content digest (the same
+:func:`~media_studio.relink.content_hash_of` the relink path pins) joined with the
+sha256 of the canonicalized config, so a renamed / moved copy still hits and any
+config change misses. Hashing a multi-GB file costs real time, so the digest is
+remembered per ``(realpath, mtime_ns, size)``: an untouched file is re-keyed from
+one ``stat`` and is only re-hashed after it changes.
+
+The store mirrors :class:`~media_studio.models.ai_cache.AiCache`: one JSON file per
+entry under an injected dir (``data_dir/transcript-cache``), written atomically
+(temp file + ``os.replace``). It keeps at most ``max_entries`` transcripts — a
+hit refreshes an entry's mtime, and the least recently used go first. The cache is purely
+an accelerator — a file that cannot be hashed (missing ``blake3``, unreadable
+media) yields NO key, and a corrupt / unreadable entry is a MISS, so it can never
+fail a transcription.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import os
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Any, Final
+
+from ..relink import HashFile, RelinkError, content_hash_of
+from ..util import get_logger
+
+log = get_logger("media_studio.features.transcript_cache")
+
+#: Sub-directory name under the app data dir holding the cached transcripts.
+DEFAULT_CACHE_DIRNAME: Final[str] = "transcript-cache"
+
+#: Transcripts kept in the store; the least recently used are evicted past it.
+MAX_ENTRIES: Final[int] = 200
+
+#: Sub-directory of the store holding the ``(realpath, mtime_ns, size) -> digest`` memos.
+_DIGEST_DIRNAME: Final[str] = "digests"
+
+
+class TranscriptCache:
+    """Content-hash cache for finished transcripts, backed by a JSON-per-entry dir.
+
+    ``hash_file`` is the whole-file hasher seam (default BLAKE3, streamed in
+    bounded chunks) so tests never read real media. The dir is created lazily on
+    the first :meth:`put` (or digest memo).
+    """
+
+    def __init__(
+        self,
+        *,
+        store_dir: str | os.PathLike[str],
+        hash_file: HashFile | None = None,
+        max_entries: int = MAX_ENTRIES,
+    ) -> None:
+        self._store_dir = Path(store_dir)
+        self._hash_file = hash_file
+        self._max_entries = max(1, int(max_entries))
+
+    def key(self, audio_path: str, config: Mapping[str, Any]) -> str | None:
+        """Return ``<content digest>-<config sha256>`` for ``audio_path``, or ``None``.
+
+        ``None`` means "do not cache this call": the media could not be hashed (a
+        vanished file, an I/O error, or no ``blake3`` package). Config dict order
+        is irrelevant; any changed value yields a different key.
+        """
+        try:
+            digest = self._content_digest(audio_path)
+        except (OSError, RelinkError) as exc:
+            log.info("transcript_cache: not caching %s (%s)", audio_path, exc)
+            return None
+        canonical = json.dumps(dict(config), sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+        config_digest = hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+        return f"{digest.partition(':')[2]}-{config_digest}"
+
+    def _content_digest(self, audio_path: str) -> str:
+        """The file's content digest, re-hashed only when its stat identity changed."""
+        real = os.path.realpath(audio_path)
+        st = os.stat(real)
+        identity = {"path": real, "mtimeNs": st.st_mtime_ns, "size": st.st_size}
+        memo = self._store_dir / _DIGEST_DIRNAME / f"{hashlib.sha256(real.encode('utf-8')).hexdigest()}.json"
+        try:
+            remembered = json.loads(memo.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            remembered = None
+        if isinstance(remembered, dict) and isinstance(remembered.get("digest"), str):
+            if {k: remembered.get(k) for k in identity} == identity:
+                return remembered["digest"]
+        digest = content_hash_of(real, hash_file=self._hash_file)
+        try:
+            self._write(memo, {**identity, "digest": digest})
+        except OSError as exc:
+            log.info("transcript_cache: could not remember the digest of %s (%s)", audio_path, exc)
+        return digest
+
+    def path_for(self, key: str) -> Path:
+        """Return the on-disk path backing ``key`` (one JSON file per entry)."""
+        return self._store_dir / f"{key}.json"
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        """Return the cached transcript for ``key``, or ``None`` on a miss.
+
+        A missing, unreadable, non-JSON, or non-object entry is a MISS. A hit
+        refreshes the entry's mtime (its recency for eviction).
+        """
+        path = self.path_for(key)
+        try:
+            raw = path.read_text(encoding="utf-8")
+        except OSError:
+            return None
+        try:
+            cached = json.loads(raw)
+        except json.JSONDecodeError:
+            log.warning("transcript_cache: discarding corrupt entry %s", key)
+            return None
+        if not isinstance(cached, dict):
+            return None
+        with contextlib.suppress(OSError):
+            os.utime(path)
+        return cached
+
+    def put(self, key: str, transcript: Mapping[str, Any]) -> None:
+        """Store ``transcript`` under ``key``, creating the dir.
+
+        A write failure (read-only / full disk) is logged and dropped — the
+        transcript the caller already holds is unaffected. Past ``max_entries``
+        the least recently used entries (and digest memos) are evicted.
+        """
+        try:
+            self._write(self.path_for(key), dict(transcript))
+        except OSError as exc:
+            log.warning("transcript_cache: could not store %s (%s)", key, exc)
+            return
+        self._evict(self._store_dir)
+        self._evict(self._store_dir / _DIGEST_DIRNAME)
+
+    @staticmethod
+    def _write(path: Path, payload: Mapping[str, Any]) -> None:
+        """Write ``payload`` as JSON via a temp sibling + ``os.replace`` (never half-written)."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        try:
+            tmp.write_text(json.dumps(dict(payload), ensure_ascii=False), encoding="utf-8")
+            os.replace(tmp, path)
+        except OSError:
+            with contextlib.suppress(OSError):
+                tmp.unlink()
+            raise
+
+    def _evict(self, directory: Path) -> None:
+        """Delete the oldest-mtime ``*.json`` files in ``directory`` past ``max_entries``."""
+        entries: list[tuple[int, Path]] = []
+        for path in directory.glob("*.json"):
+            with contextlib.suppress(OSError):
+                entries.append((path.stat().st_mtime_ns, path))
+        entries.sort()
+        for _, path in entries[: max(0, len(entries) - self._max_entries)]:
+            with contextlib.suppress(OSError):
+                path.unlink()
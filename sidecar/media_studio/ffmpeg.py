@@ -23,7 +23,7 @@ import os
 import shutil
 import subprocess
 import threading
-from collections import deque
+from collections import OrderedDict, deque
 from collections.abc import Callable, Mapping, Sequence
 from pathlib import Path
 from typing import Any
@@ -52,6 +52,11 @@ ProgressCb = Callable[[float, str], None]
 # probing is near-instant for a healthy local file; 60s is a generous ceiling.
 PROBE_TIMEOUT_SEC = 60.0
 
+# :func:`ffprobe_duration` memo size. One source is probed again by every op /
+# conversion / library refresh that touches it; the key carries the file's
+# mtime + size, so an overwritten file is simply a new entry.
+PROBE_CACHE_SIZE = 256
+
 # How often :func:`watch_cancel` polls cancellation, INDEPENDENTLY of whether the
 # child is still emitting output (same cadence as the proven
 # ``features/reframe.py::_await_verthor`` loop).
@@ -87,6 +92,30 @@ class FfmpegNotFound(RuntimeError):
     """Raised when neither a bundled nor a PATH ffmpeg/ffprobe could be found."""
 
 
+#: ``(name, PATH)`` -> the binary :func:`shutil.which` found there. Every argv
+#: builder resolves ffmpeg/ffprobe, and a PATH walk stats each entry; a hit is
+#: re-checked with ONE stat instead. Misses are not cached (a later install is seen).
+_which_cache: dict[tuple[str, str], str] = {}
+
+
+def _which(name: str) -> str | None:
+    key = (name, os.environ.get("PATH", ""))
+    cached = _which_cache.get(key)
+    if cached is not None and os.path.isfile(cached):
+        return cached
+    found = shutil.which(name)
+    if found:
+        _which_cache[key] = found
+    else:
+        _which_cache.pop(key, None)
+    return found
+
+
+def clear_binary_cache() -> None:
+    """Forget every memoized PATH lookup of :func:`resolve_binary`."""
+    _which_cache.clear()
+
+
 def resolve_binary(name: str, settings: Mapping[str, Any] | None = None) -> str:
     """Resolve an absolute path to ``name`` ("ffmpeg" or "ffprobe").
 
@@ -129,7 +158,7 @@ def resolve_binary(name: str, settings: Mapping[str, Any] | None = None) -> str:
         return str(bundled)
 
     # 4. PATH
-    found = shutil.which(name)
+    found = _which(name)
     if found:
         return found
 
@@ -239,6 +268,8 @@ def build_convert_argv(
     out_path: str,
     options: dict[str, Any] | None = None,
     settings: dict[str, Any] | None = None,
+    *,
+    threads: int | None = None,
 ) -> list[str]:
     """Build an ffmpeg argv list for a conversion described by ``options``.
 
@@ -247,9 +278,15 @@ def build_convert_argv(
 
     Adds ``-progress pipe:1 -nostats`` so :func:`run` can parse progress, and
     ``-y`` to overwrite the output. Unknown/absent options are simply omitted.
+    ``threads`` caps the encoder (``-threads``) and filter graph
+    (``-filter_threads``) for a caller running several ffmpegs side by side;
+    ``None`` leaves ffmpeg's own one-per-core default.
     """
     options = options or {}
-    argv: list[str] = [ffmpeg_path(settings), "-hide_banner", "-nostdin", "-y", "-i", in_path]
+    argv: list[str] = [ffmpeg_path(settings), "-hide_banner", "-nostdin", "-y"]
+    if threads is not None:
+        argv += ["-filter_threads", str(threads)]
+    argv += ["-i", in_path]
 
     if options.get("audioOnly"):
         argv += ["-vn"]
@@ -279,6 +316,9 @@ def build_convert_argv(
         if fps is not None:
             argv += ["-r", str(fps)]
 
+    if threads is not None:
+        argv += ["-threads", str(threads)]
+
     # progress + nostats so stdout carries only the -progress key=value stream
     argv += ["-progress", "pipe:1", "-nostats", out_path]
     return argv
@@ -539,6 +579,26 @@ def _terminate(proc: Any) -> None:
             proc.kill()
 
 
+#: ``(realpath, st_mtime_ns, st_size) -> duration`` for :func:`ffprobe_duration`.
+_duration_cache: OrderedDict[tuple[str, int, int], float] = OrderedDict()
+_duration_lock = threading.Lock()
+
+
+def _duration_key(path: str) -> tuple[str, int, int] | None:
+    """The memo key for ``path`` — ``None`` (no caching) when it can't be stat'd."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (path, st.st_mtime_ns, st.st_size)
+
+
+def clear_probe_cache() -> None:
+    """Forget every memoized :func:`ffprobe_duration` result."""
+    with _duration_lock:
+        _duration_cache.clear()
+
+
 def ffprobe_duration(
     in_path: str,
     settings: dict[str, Any] | None = None,
@@ -552,7 +612,7 @@ def ffprobe_duration(
     not wedge the job; downstream callers treat 0.0 as "unknown" and degrade).
 
     The duration is read through the shared ``media_compat.probe_media`` ffprobe
-    ``-show_streams -show_format -of json`` seam and its ``format.duration`` — the
+    JSON seam (``media_compat.PROBE_ENTRIES``) and its ``format.duration`` — the
     SAME value the old bespoke ``-show_entries format=duration`` probe returned —
     instead of building and spawning a second ffprobe argv here. That keeps a
     single canonical ffprobe subprocess sink (the reviewed baseline seam) rather
@@ -561,6 +621,10 @@ def ffprobe_duration(
     ffprobe flag), and the probe stays bounded by :data:`PROBE_TIMEOUT_SEC` via
     the injected runner. The seam uses an argv list with no shell, so there is no
     command injection.
+
+    A known (positive) duration is memoized per ``(realpath, mtime, size)``, so
+    re-probing an unchanged file costs a ``stat`` instead of an ffprobe spawn; a
+    rewritten file changes the key. An unknown (0.0) result is never memoized.
     """
     # media_compat imports this module, so a top-level import would be circular;
     # by the time this runs both modules are fully initialised (local import).
@@ -576,14 +640,28 @@ def ffprobe_duration(
 
     # ensure_within canonicalises the (RPC/settings-derived) path to a realpath'd
     # ABSOLUTE path (single-arg call never raises, so behaviour is unchanged).
+    safe_path = ensure_within(in_path)
+    key = _duration_key(safe_path)
+    if key is not None:
+        with _duration_lock:
+            cached = _duration_cache.get(key)
+            if cached is not None:
+                _duration_cache.move_to_end(key)
+                return cached
     try:
-        probe = media_compat.probe_media(ensure_within(in_path), settings, runner=bounded_runner)
+        probe = media_compat.probe_media(safe_path, settings, runner=bounded_runner)
     except subprocess.TimeoutExpired:
         # clean_for_log neutralises CR/LF/NUL in the user-derived path (the
         # py/log-injection barrier CodeQL recognises).
         log.warning("ffprobe timed out after %.0fs probing %s", PROBE_TIMEOUT_SEC, clean_for_log(in_path))
         return 0.0
     try:
-        return float((probe.get("format") or {}).get("duration") or 0.0)
+        duration = float((probe.get("format") or {}).get("duration") or 0.0)
     except (ValueError, TypeError):
         return 0.0
+    if key is not None and duration > 0.0:
+        with _duration_lock:
+            _duration_cache[key] = duration
+            while len(_duration_cache) > PROBE_CACHE_SIZE:
+                _duration_cache.popitem(last=False)
+    return duration
@@ -83,17 +83,22 @@ _FEATURE_CAPABILITIES: tuple[FeatureSpec, ...] = (
 )
 
 
+#: The de-duplicated capability asset names, in first-seen order. Frozen once at
+#: import (the feature table above is itself a module constant), so every
+#: ``readiness.summary`` poll reuses it instead of re-walking the table.
+_CAPABILITY_ASSET_NAMES: tuple[str, ...] = tuple(
+    dict.fromkeys(name for spec in _FEATURE_CAPABILITIES for name in spec.assets)
+)
+
+
 def capability_asset_names() -> list[str]:
     """The de-duplicated capability asset names, in first-seen order.
 
     The single probe set ``readiness.summary`` resolves installed-state for (the
-    :meth:`Services._installed_asset_names` seam).
+    :meth:`Services._installed_asset_names` seam). A fresh list over the frozen
+    :data:`_CAPABILITY_ASSET_NAMES`, so a caller can never mutate the shared set.
     """
-    seen: dict[str, None] = {}
-    for spec in _FEATURE_CAPABILITIES:
-        for name in spec.assets:
-            seen.setdefault(name, None)
-    return list(seen)
+    return list(_CAPABILITY_ASSET_NAMES)
 
 
 def _ensurable_missing(spec: FeatureSpec, installed: set[str]) -> list[str]:
@@ -259,6 +259,7 @@ class Services:
     convert_start = media_ops.convert_start
     convert_batch = media_ops.convert_batch
     transcribe_start = media_ops.transcribe_start
+    _transcript_cache = media_ops._transcript_cache
     _transcribe_and_persist = media_ops._transcribe_and_persist
     _diarize_backend_factory = media_ops._diarize_backend_factory
     _diarize_models_present = media_ops._diarize_models_present
@@ -293,6 +294,7 @@ class Services:
     candidate_id = staticmethod(shortmaker_ops.candidate_id)
     _get_provider = ai_ops._get_provider
     _ai_cache = ai_ops._ai_cache
+    _translation_cache = ai_ops._translation_cache
     _ai_pool = ai_ops._ai_pool
     _spend_ledger = ai_ops._spend_ledger
     _estimate_job_cents = ai_ops._estimate_job_cents
@@ -65,6 +65,23 @@ def _ai_cache(self: Services) -> Any:
     return AiCache(store_dir=store_dir)
 
 
+def _translation_cache(self: Services) -> Any:
+    """The persistent subtitle-translation cache, under the data dir.
+
+    Honors ``settings.translationCacheDir`` (absolute path) when set, else
+    ``data_dir/translation-cache``; ``settings.translationCache = false`` returns
+    ``None`` (the translator then only de-duplicates within its own lifetime).
+    """
+    from ..models.translation_cache import DEFAULT_CACHE_DIRNAME, TranslationCache  # local: import-light
+
+    settings = self.settings.get()
+    if settings.get("translationCache") is False:
+        return None
+    configured = settings.get("translationCacheDir")
+    store_dir = Path(configured) if configured else self.data_dir / DEFAULT_CACHE_DIRNAME
+    return TranslationCache(store_dir=store_dir)
+
+
 def _ai_pool(self: Services) -> Any:
     """Build the rotation pool (WU-pool) from settings for budget/route reads.
 
@@ -440,7 +457,9 @@ def _get_translator(self: Services) -> Any | None:
     # _text_consented_settings so cue text can never rotate onto a non-text-consented
     # cloud provider (mirrors _translator_for_function / _provider_for_function).
     return _translation_mod.get_translator(
-        self._text_consented_settings(self.settings.get_raw()), runner=self._get_model_runner()
+        self._text_consented_settings(self.settings.get_raw()),
+        runner=self._get_model_runner(),
+        cache=self._translation_cache(),
     )
 
 
@@ -10,6 +10,8 @@ in services.py). Behaviour + the RPC surface are byte-identical to pre-split.
 
 from __future__ import annotations
 
+import functools
+from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 from .. import library as _library
@@ -395,6 +397,23 @@ def transcribe_start(self: Services, params: dict[str, Any], ctx: RpcContext) ->
     return {"jobId": job.id}
 
 
+def _transcript_cache(self: Services) -> Any:
+    """The exact-match transcript cache, under the data dir.
+
+    Honors ``settings.transcriptCacheDir`` (absolute path) when set, else
+    ``data_dir/transcript-cache``; ``settings.transcriptCache = false`` turns it
+    off (``None``) so every job re-runs the ASR.
+    """
+    from ..features.transcript_cache import DEFAULT_CACHE_DIRNAME, TranscriptCache  # noqa: PLC0415
+
+    settings = self.settings.get()
+    if settings.get("transcriptCache") is False:
+        return None
+    configured = settings.get("transcriptCacheDir")
+    store_dir = Path(configured) if configured else self.data_dir / DEFAULT_CACHE_DIRNAME
+    return TranscriptCache(store_dir=store_dir)
+
+
 def _transcribe_and_persist(
     self: Services,
     video_id: str,
@@ -422,6 +441,14 @@ def _transcribe_and_persist(
     loader = self._whisper_loader or _transcribe.FasterWhisperLoader()
     settings = self.settings.get()
     probe = self._ffprobe_duration or _self_ffprobe()
+    # When the ctc alignment pass will follow, decode the audio to 16 kHz PCM at
+    # most once for the job: whisper and the aligner share the one buffer, which
+    # is dropped with this frame (no process-wide copy of an hour of samples).
+    pcm_loader = None
+    if align_words or settings.get("karaoke"):
+        from ..features import ctc_align as _ctc_align  # local import-light seam
+
+        pcm_loader = functools.lru_cache(maxsize=1)(_ctc_align.load_pcm_16k)
     transcript = _transcribe.transcribe_with_engine(
         audio_path,
         loader=loader,
@@ -430,8 +457,12 @@ def _transcribe_and_persist(
         duration_probe=probe,
         on_progress=lambda pct, msg: job_ctx.progress(pct, msg),
         should_cancel=lambda: job_ctx.cancelled,
+        cache=self._transcript_cache(),
+        pcm_loader=pcm_loader,
+    )
+    transcript = self._maybe_align_words(
+        transcript, audio_path, settings, job_ctx, align_words=align_words, audio_loader=pcm_loader
     )
-    transcript = self._maybe_align_words(transcript, audio_path, settings, job_ctx, align_words=align_words)
     if not job_ctx.cancelled:
         # Persist the transcript onto the project + flip the library flag.
         project = self._load_or_create_project(video_id)
@@ -465,14 +496,17 @@ def _diarize_models_present(self: Services, settings: dict[str, Any]) -> bool:
     """Phase-8: probe the installed-state of whichever diarize backend is selected.
 
     Pyannote checks its two gated repos; speechbrain checks the VAD + ECAPA
-    assets. Drives the offline gate so a missing-model download is refused for
-    the right backend.
+    assets; the VAD-only backend checks just the VAD. Drives the offline gate so
+    a missing-model download is refused for the right backend.
     """
     from ..features import diarize as _diarize  # local: import-light
     from ..features import pyannote_backend as _pyannote  # local: import-light
 
-    if _pyannote.selected_backend_name(settings) == _pyannote.PYANNOTE_BACKEND:
+    backend = _pyannote.selected_backend_name(settings)
+    if backend == _pyannote.PYANNOTE_BACKEND:
         return _pyannote.default_models_present(settings)
+    if backend == _pyannote.VAD_BACKEND:
+        return _diarize.default_models_present(settings, required=_diarize.VAD_ONLY_ASSETS)
     return _diarize.default_models_present(settings)
 
 
@@ -484,6 +518,7 @@ def _maybe_align_words(
     job_ctx: Any,
     *,
     align_words: bool = False,
+    audio_loader: Any = None,
 ) -> dict[str, Any]:
     """WU6 wiring: refine word timings via ctc-forced-aligner when requested.
 
@@ -498,7 +533,8 @@ def _maybe_align_words(
     would still run). ``ctc_align.align_words`` is degrade-safe (returns the
     input unchanged when the model is unavailable offline or any backend step
     fails), and its ALIGN_SKIPPED notice now reaches the UI via ``on_progress``.
-    No-op (input returned unchanged) when neither trigger is set.
+    No-op (input returned unchanged) when neither trigger is set. ``audio_loader``
+    is the job's shared 16 kHz decode (``None`` -> the aligner decodes itself).
     """
     if not (align_words or settings.get("karaoke")):
         return transcript
@@ -510,6 +546,7 @@ def _maybe_align_words(
         transcript,
         audio_path,
         settings=settings,
+        audio_loader=audio_loader,
         on_progress=lambda pct, msg: job_ctx.progress(pct, msg),
         should_cancel=lambda: job_ctx.cancelled,
     )
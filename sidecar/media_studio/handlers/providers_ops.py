@@ -594,6 +594,7 @@ def _translator_for_function(self: Services, function: str) -> Any:
         runner=self._get_model_runner(),
         prefer=prefer,
         ensure=self._llama_ensure(),
+        cache=self._translation_cache(),
     )
 
 
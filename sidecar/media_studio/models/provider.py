@@ -32,7 +32,9 @@ from __future__ import annotations
 import abc
 import functools
 import json
+import threading
 import urllib.error
+import urllib.parse
 import urllib.request
 from collections.abc import Callable, Sequence
 from dataclasses import dataclass
@@ -638,6 +640,11 @@ class RotatingProvider(Provider):
     local backstop is always last, so an offline run still works once every cloud
     key is exhausted. Per-key usage ``{used, max, unit, resetAt}`` is tracked from
     optimistic decrement + parsed ``X-RateLimit-*`` headers (for the usage UI).
+
+    Safe to share across threads (the translator runs cue groups concurrently):
+    slot usage/cooldown state is read and written under one lock, and calls to
+    the llama.cpp backstop are serialized — its server decodes one request at a
+    time (no ``--parallel`` in the launch argv), so concurrent callers queue.
     """
 
     def __init__(
@@ -669,6 +676,8 @@ class RotatingProvider(Provider):
             for key in keys:
                 self._slots.append(_LiveKey(spec=spec, key=key, transport=transport))
         self._rotation_cbs: list[Callable[[RotationEvent], None]] = []
+        self._state_lock = threading.Lock()
+        self._backstop_lock = threading.Lock()
 
     # -- public hooks --------------------------------------------------------
     def on_rotation(self, callback: Callable[[RotationEvent], None]) -> None:
@@ -701,17 +710,18 @@ class RotatingProvider(Provider):
 
     def usage(self) -> list[dict[str, Any]]:
         """Per-key usage rows ``{provider, key(redacted), used, max, unit, resetAt}``."""
-        return [
-            {
-                "provider": slot.spec.provider,
-                "key": slot.redacted_key,
-                "used": slot.used,
-                "max": slot.max,
-                "unit": slot.spec.unit,
-                "resetAt": slot.reset_at,
-            }
-            for slot in self._slots
-        ]
+        with self._state_lock:
+            return [
+                {
+                    "provider": slot.spec.provider,
+                    "key": slot.redacted_key,
+                    "used": slot.used,
+                    "max": slot.max,
+                    "unit": slot.spec.unit,
+                    "resetAt": slot.reset_at,
+                }
+                for slot in self._slots
+            ]
 
     # -- the Provider.chat seam ---------------------------------------------
     def chat(
@@ -732,25 +742,13 @@ class RotatingProvider(Provider):
         failures: list[str] = []
         active: _LiveKey | None = None
         for slot in self._slots:
-            now = self._now()
-            if not slot.eligible(now=now, capability=capability):
+            with self._state_lock:
+                eligible = slot.eligible(now=self._now(), capability=capability)
+            if not eligible:
                 continue
-            # WU-B2: lazily ensure the llama backstop is up BEFORE its first chat
-            # (never for a cloud key or a detected Ollama/LM-Studio slot). A slow
-            # start raises ProviderError -> handled exactly like a chat failure
-            # (cool + rotate), so the pool advances instead of hanging.
-            if self._ensure is not None and slot.spec.provider == LOCAL_PROVIDER_ID:
-                try:
-                    self._ensure()
-                except ProviderError as exc:
-                    self._on_failure(slot, exc, failures)
-                    if active is not None:
-                        self._emit_rotation(active, slot, str(exc))
-                    active = slot
-                    continue
             try:
-                content, response = slot.provider.chat_full(
-                    messages, temperature=temperature, max_tokens=max_tokens, **kwargs
+                content, response = self._chat_slot(
+                    slot, messages, temperature=temperature, max_tokens=max_tokens, **kwargs
                 )
             except ProviderError as exc:
                 self._on_failure(slot, exc, failures)
@@ -766,22 +764,39 @@ class RotatingProvider(Provider):
         raise ProviderError(self._exhausted_message(capability, failures))
 
     # -- internals ----------------------------------------------------------
+    def _chat_slot(self, slot: _LiveKey, messages: Sequence[Message], **kwargs: Any) -> tuple[str, dict[str, Any]]:
+        """One ``chat_full`` on ``slot``; the llama backstop is ensured + serialized.
+
+        WU-B2: the llama backstop is lazily ensured BEFORE its chat (never for a
+        cloud key or a detected Ollama/LM-Studio slot). A slow start raises
+        ProviderError -> handled exactly like a chat failure (cool + rotate), so
+        the pool advances instead of hanging.
+        """
+        if slot.spec.provider != LOCAL_PROVIDER_ID:
+            return slot.provider.chat_full(messages, **kwargs)
+        with self._backstop_lock:
+            if self._ensure is not None:
+                self._ensure()
+            return slot.provider.chat_full(messages, **kwargs)
+
     def _on_success(self, slot: _LiveKey, response: dict[str, Any]) -> None:
         """Record an optimistic use + any authoritative ``X-RateLimit-*`` headers."""
-        slot.used += 1
         limit, remaining = _parse_rate_limit_headers(response)
-        if limit is not None:
-            slot.max = limit
-            if remaining is not None:
-                slot.used = max(0, limit - remaining)
+        with self._state_lock:
+            slot.used += 1
+            if limit is not None:
+                slot.max = limit
+                if remaining is not None:
+                    slot.used = max(0, limit - remaining)
 
     def _on_failure(self, slot: _LiveKey, exc: ProviderError, failures: list[str]) -> None:
         """Cool the failed key for its window and record a SCRUBBED failure line."""
         message = scrub_error_body(str(exc), [slot.key] if slot.key else [])
         retry_after = _retry_after_seconds(message)
         window = retry_after if retry_after is not None else self._cooldown
-        slot.cooled_until = self._now() + window
-        slot.reset_at = slot.cooled_until
+        with self._state_lock:
+            slot.cooled_until = self._now() + window
+            slot.reset_at = slot.cooled_until
         failures.append(f"{slot.spec.provider} ({slot.redacted_key}): {message}")
 
     def _emit_rotation(self, from_slot: _LiveKey, to_slot: _LiveKey, reason: str) -> None:
@@ -799,6 +814,37 @@ class RotatingProvider(Provider):
         return f"provider pool exhausted ({capability}): {detail}"
 
 
+def is_local_provider(provider: Any) -> bool:
+    """True when every chat through ``provider`` is served by a LOCAL server.
+
+    A bare :class:`LocalServerProvider`, or a :class:`RotatingProvider` whose
+    pool holds only local entries (the ``prefer == LOCAL_PROVIDER_ID`` route).
+    Callers use it to keep local work serial and one text per call.
+    """
+    if isinstance(provider, LocalServerProvider):
+        return True
+    if isinstance(provider, RotatingProvider):
+        return all(spec.local for spec in provider.entries)
+    return False
+
+
+def provider_identity(provider: Any) -> tuple[str, str]:
+    """``(provider id, model)`` naming who produces ``provider``'s replies.
+
+    A pool is named by all of its entries (any of them may answer), a cloud
+    endpoint by its host. Used to key caches of model output, so switching
+    model or pool never reuses another model's reply.
+    """
+    if isinstance(provider, RotatingProvider):
+        specs = provider.entries
+        return "+".join(spec.provider for spec in specs), "+".join(spec.model for spec in specs)
+    if isinstance(provider, LocalServerProvider):
+        return LOCAL_PROVIDER_ID, provider.model
+    if isinstance(provider, _OpenAICompatProvider):
+        return urllib.parse.urlsplit(provider.base_url).netloc, provider.model
+    return type(provider).__name__, str(getattr(provider, "model", "") or "")
+
+
 def build_pool_provider(
     settings: dict[str, Any] | None,
     *,
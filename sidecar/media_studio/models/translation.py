@@ -43,8 +43,12 @@ NO new RPC methods are registered here (A2's method names are frozen;
 
 from __future__ import annotations
 
+import functools
 import os
+import re
+from collections import deque
 from collections.abc import Callable, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
@@ -53,6 +57,7 @@ from ..features import languages as _languages
 from ..pathsafe import ensure_within
 from ..util import get_logger
 from . import provider as provider_mod
+from .translation_cache import TranslationCache
 
 log = get_logger("media_studio.models.translation")
 
@@ -120,6 +125,26 @@ ROUTING_TABLE: dict[str, str] = {
 #: local TranslateGemma coverage does not include (survey §3).
 DEFAULT_TIER: str = TIER_HOSTED
 
+# --------------------------------------------------------------------------- #
+# Batching — several cues per chat round-trip
+# --------------------------------------------------------------------------- #
+#: Settings key overriding how many cues share one chat call (``1`` = per cue).
+TRANSLATE_BATCH_KEY: str = "translateBatchSize"
+#: Default cues per call on the hosted tier, where every call is a network
+#: round-trip; the local tiers stay per cue (TranslateGemma's chat template is
+#: built around a single source text, and a loopback call is cheap).
+DEFAULT_HOSTED_BATCH_SIZE: int = 20
+#: Upper bound on an explicit batch size (keeps one reply well inside context).
+MAX_BATCH_SIZE: int = 50
+#: Settings key overriding how many cue groups are in flight at once.
+TRANSLATE_CONCURRENCY_KEY: str = "translateConcurrency"
+#: Default in-flight groups on the hosted tier (network-bound: overlapping the
+#: round-trips is the win); the local tiers stay serial because one llama.cpp
+#: server decodes one request per slot and the launch argv sets no ``--parallel``.
+DEFAULT_HOSTED_CONCURRENCY: int = 4
+#: Upper bound on an explicit concurrency (keeps a key pool's rate limits sane).
+MAX_CONCURRENCY: int = 16
+
 
 def normalize_lang(lang: str) -> str:
     """Normalize a language tag to a bare lowercase primary subtag.
@@ -183,21 +208,88 @@ _MT_SYSTEM = (
 # document for llama-cli/server use.
 
 
-def build_messages(text: str, target_lang: str, source_lang: str | None = None) -> list[dict[str, str]]:
-    """Build the 2-message chat for one cue translation."""
-    system = _MT_SYSTEM.format(target=target_lang)
+@functools.lru_cache(maxsize=64)
+def _system_prompt(template: str, target_lang: str, source_lang: str | None) -> str:
+    """``template`` filled for one language pair.
+
+    Every line / group of a track shares the pair, so the prompt is formatted
+    once per pair rather than once per chat.
+    """
+    system = template.format(target=target_lang)
     if source_lang:
         system += f" The source language is {source_lang}."
+    return system
+
+
+def build_messages(text: str, target_lang: str, source_lang: str | None = None) -> list[dict[str, str]]:
+    """Build the 2-message chat for one cue translation."""
     return [
-        {"role": "system", "content": system},
+        {"role": "system", "content": _system_prompt(_MT_SYSTEM, target_lang, source_lang)},
         {"role": "user", "content": text},
     ]
 
 
+_MT_BATCH_SYSTEM = (
+    "You are a professional subtitle translator. The user sends a numbered list "
+    "of subtitle lines. Translate each line into {target} and reply with ONLY "
+    "the same numbered list — one entry per input number, in order, formatted "
+    '"<n>. <translation>" — no notes, no explanation. Keep each entry concise '
+    "enough to read as a subtitle."
+)
+
+#: One numbered reply entry: ``"<n>. text"`` (or ``"<n>) text"``) at line start.
+_NUMBERED_RE = re.compile(r"^\s*(\d+)[.)]\s?(.*)$")
+
+
+def build_batch_messages(
+    texts: Sequence[str],
+    target_lang: str,
+    source_lang: str | None = None,
+) -> list[dict[str, str]]:
+    """Build the 2-message chat translating ``texts`` as one numbered list."""
+    numbered = "\n".join(f"{n}. {text}" for n, text in enumerate(texts, 1))
+    return [
+        {"role": "system", "content": _system_prompt(_MT_BATCH_SYSTEM, target_lang, source_lang)},
+        {"role": "user", "content": numbered},
+    ]
+
+
+def parse_numbered_reply(reply: str, count: int) -> list[str] | None:
+    """Split a numbered-list reply into exactly ``count`` stripped entries.
+
+    Lines that do not start a new number continue the previous entry (a two-line
+    subtitle). Returns ``None`` — the caller retries per cue — unless the
+    numbers run exactly ``1..count`` in order with no empty entry.
+    """
+    entries: list[list[str]] = []
+    for line in str(reply).strip().splitlines():
+        match = _NUMBERED_RE.match(line)
+        if match is not None and int(match.group(1)) == len(entries) + 1:
+            entries.append([match.group(2)])
+        elif entries:
+            entries[-1].append(line)
+        else:
+            return None
+    if len(entries) != count:
+        return None
+    out = ["\n".join(parts).strip() for parts in entries]
+    return None if any(not text for text in out) else out
+
+
 def _is_blank(text: str) -> bool:
     return not text or not text.strip()
 
 
+def _batchable(text: str) -> bool:
+    """Whether ``text`` can ride in a numbered batch without blurring the numbering.
+
+    A multi-line cue or one that opens with a digit (``"2. eggs"``, ``"1) go"``)
+    could read as extra list entries and shift every later translation onto the
+    wrong cue while the entry count still matches, so such cues go on their own.
+    """
+    return "\n" not in text and "\r" not in text and not text.lstrip()[:1].isdigit()
+
+
 def _make_cue(index: int, start: float, end: float, text: str) -> Cue:
     """A §3 Cue dict (field names frozen; mirrors features.subtitles.make_cue)."""
     return {"index": int(index), "start": float(start), "end": float(end), "text": text}
@@ -222,6 +314,9 @@ class TieredTranslator:
                           honoring ``settings.localBaseUrl``).
       * ``hosted_provider_factory`` — builds the tier3 provider (default:
                           CloudProvider iff ``settings.cloudApiKey`` is set).
+      * ``cache``       — the :class:`~.translation_cache.TranslationCache`
+                          consulted before any chat (default: a memory-only one,
+                          so a repeated line is translated once per translator).
 
     CONTRACT-NOTE: tier3 availability is keyed on a non-empty
     ``settings.cloudApiKey`` alone (§2 names it optional); ``useCloud`` governs
@@ -239,6 +334,7 @@ class TieredTranslator:
         routing: dict[str, str] | None = None,
         tier2_gpu_layers: int = TIER2_GPU_LAYERS,
         ensure: Callable[[], None] | None = None,
+        cache: TranslationCache | None = None,
     ) -> None:
         self._runner = runner
         self._settings = dict(settings or {})
@@ -252,6 +348,7 @@ class TieredTranslator:
         # keeps the legacy behaviour (no probe). The engine layer that owns the
         # ModelRunner builds and injects it (this module stays runner-agnostic).
         self._ensure = ensure
+        self._cache = cache if cache is not None else TranslationCache()
 
     # -- routing ------------------------------------------------------------
     def route(self, target_lang: str) -> str:
@@ -282,17 +379,22 @@ class TieredTranslator:
         when ``cancelled()`` turns true the loop stops and the cues translated
         so far are returned. Raises :class:`TranslationError` when every tier
         fails — the job body lets that surface via job.done (A6 lesson 3).
+        Lines already in the cache are not re-sent; the cache is flushed on the
+        way out, so even a failed tier's completed lines are kept.
         """
         cue_list = list(cues or [])
         if not cue_list:
             return []
         failures: list[str] = []
-        for tier in self.chain_for(target_lang):
-            try:
-                return self._translate_with_tier(tier, cue_list, target_lang, source_lang, progress, cancelled)
-            except Exception as exc:  # noqa: BLE001 - each tier failure feeds the chain
-                log.warning("translation %s failed for %r: %s", tier, target_lang, exc)
-                failures.append(f"{tier}: {exc}")
+        try:
+            for tier in self.chain_for(target_lang):
+                try:
+                    return self._translate_with_tier(tier, cue_list, target_lang, source_lang, progress, cancelled)
+                except Exception as exc:  # noqa: BLE001 - each tier failure feeds the chain
+                    log.warning("translation %s failed for %r: %s", tier, target_lang, exc)
+                    failures.append(f"{tier}: {exc}")
+        finally:
+            self._cache.flush()
         raise TranslationError(f"all translation tiers failed for {target_lang!r} ({'; '.join(failures)})")
 
     def translate_track(
@@ -375,29 +477,191 @@ class TieredTranslator:
         progress: Callable[[int, str], None] | None,
         cancelled: Callable[[], bool] | None,
     ) -> list[Cue]:
-        """Translate the whole batch on ONE tier (raises on any failure)."""
+        """Translate the whole batch on ONE tier (raises on any failure).
+
+        Cues go to the provider :meth:`batch_size` at a time (one chat call per
+        group), with up to :meth:`concurrency` groups in flight on a thread pool.
+        Groups are collected in order, so progress and cancellation are reported
+        per group exactly as in the serial case; once ``cancelled()`` turns true no
+        further group is sent and the ones already in flight are kept.
+        """
         provider = self._tier_provider(tier)
         label = self._tier_label(tier)
+        step = self.batch_size(tier, provider)
+        workers = self.concurrency(tier, provider)
+        identity = self._cache_identity(tier, provider)
         total = len(cues)
+        groups = [cues[k : k + step] for k in range(0, total, step)]
+
+        def _run(group: list[Cue]) -> list[str]:
+            texts = [str(cue.get("text", "")) for cue in group]
+            return self._translate_cached(tier, provider, texts, target_lang, source_lang, identity=identity)
+
         out: list[Cue] = []
-        for i, cue in enumerate(cues):
-            if cancelled is not None and cancelled():
-                break
-            text = str(cue.get("text", ""))
-            new_text = text if _is_blank(text) else self._chat_one(provider, text, target_lang, source_lang)
-            out.append(
-                _make_cue(
-                    int(cue.get("index", i + 1)),
-                    float(cue.get("start", 0.0)),
-                    float(cue.get("end", 0.0)),
-                    new_text,
+
+        def _collect(group: list[Cue], new_texts: list[str]) -> None:
+            done = len(out)
+            for offset, (cue, new_text) in enumerate(zip(group, new_texts, strict=True)):
+                out.append(
+                    _make_cue(
+                        int(cue.get("index", done + offset + 1)),
+                        float(cue.get("start", 0.0)),
+                        float(cue.get("end", 0.0)),
+                        new_text,
+                    )
                 )
-            )
-            if progress is not None and total:
+            if progress is not None:
                 progress(
-                    int(round((i + 1) / total * 100)),
-                    f"{label}: translated {i + 1}/{total}",
+                    int(round(len(out) / total * 100)),
+                    f"{label}: translated {len(out)}/{total}",
                 )
+
+        if workers <= 1 or len(groups) <= 1:
+            for group in groups:
+                if cancelled is not None and cancelled():
+                    break
+                _collect(group, _run(group))
+            return out
+
+        queued = iter(groups)
+        in_flight: deque[tuple[list[Cue], Future[list[str]]]] = deque()
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="translate") as pool:
+            try:
+                while True:
+                    while len(in_flight) < workers and not (cancelled is not None and cancelled()):
+                        group = next(queued, None)
+                        if group is None:
+                            break
+                        in_flight.append((group, pool.submit(_run, group)))
+                    if not in_flight:
+                        break
+                    group, future = in_flight.popleft()
+                    _collect(group, future.result())
+            except BaseException:
+                # A failed group fails the tier: drop whatever has not started.
+                for _, future in in_flight:
+                    future.cancel()
+                raise
+        return out
+
+    @staticmethod
+    def _runs_locally(tier: str, provider: Any = None) -> bool:
+        """True when ``tier`` is served on this machine (a local tier, or a hosted
+        tier whose resolved ``provider`` is a local-only pool, e.g. ``prefer=local``)."""
+        return tier != TIER_HOSTED or provider_mod.is_local_provider(provider)
+
+    def concurrency(self, tier: str, provider: Any = None) -> int:
+        """Cue groups in flight at once on ``tier`` (resolved to ``provider``).
+
+        Local work is always one group at a time: a local llama.cpp server decodes
+        one request at a time, so parallel groups only queue behind each other and
+        compete for the same VRAM. For a real hosted provider an explicit integer
+        ``settings.translateConcurrency`` is clamped to ``1..MAX_CONCURRENCY``;
+        otherwise :data:`DEFAULT_HOSTED_CONCURRENCY` groups run at once.
+        """
+        if self._runs_locally(tier, provider):
+            return 1
+        raw = self._settings.get(TRANSLATE_CONCURRENCY_KEY)
+        if isinstance(raw, int) and not isinstance(raw, bool):
+            return max(1, min(MAX_CONCURRENCY, raw))
+        return DEFAULT_HOSTED_CONCURRENCY
+
+    def batch_size(self, tier: str, provider: Any = None) -> int:
+        """Cues per chat call on ``tier`` (resolved to ``provider``).
+
+        Local work always goes one cue per call: the small local models do not
+        reliably keep a numbered multi-line reply aligned. For a real hosted
+        provider an explicit integer ``settings.translateBatchSize`` is clamped to
+        ``1..MAX_BATCH_SIZE``; otherwise :data:`DEFAULT_HOSTED_BATCH_SIZE` cues.
+        """
+        if self._runs_locally(tier, provider):
+            return 1
+        raw = self._settings.get(TRANSLATE_BATCH_KEY)
+        if isinstance(raw, int) and not isinstance(raw, bool):
+            return max(1, min(MAX_BATCH_SIZE, raw))
+        return DEFAULT_HOSTED_BATCH_SIZE
+
+    def _translate_cached(
+        self,
+        tier: str,
+        provider: Any,
+        texts: list[str],
+        target_lang: str,
+        source_lang: str | None,
+        *,
+        identity: tuple[str, str] = ("", ""),
+    ) -> list[str]:
+        """Translate ``texts`` on ``tier``, sending each distinct uncached line once.
+
+        Blank lines pass through; cache hits are filled in place; the remaining
+        lines are de-duplicated before :meth:`_translate_texts` and every new
+        translation is recorded in the cache under ``identity`` (the
+        :meth:`_cache_identity` of the provider).
+        """
+        provider_id, model = identity
+        out = list(texts)
+        misses: dict[str, list[int]] = {}
+        for k, text in enumerate(texts):
+            if _is_blank(text):
+                continue
+            hit = self._cache.get(tier, source_lang, target_lang, text, provider=provider_id, model=model)
+            if hit is None:
+                misses.setdefault(text, []).append(k)
+            else:
+                out[k] = hit
+        if misses:
+            unique = list(misses)
+            for text, new_text in zip(
+                unique, self._translate_texts(provider, unique, target_lang, source_lang), strict=True
+            ):
+                self._cache.put(tier, source_lang, target_lang, text, new_text, provider=provider_id, model=model)
+                for k in misses[text]:
+                    out[k] = new_text
+        return out
+
+    def _cache_identity(self, tier: str, provider: Any) -> tuple[str, str]:
+        """``(provider id, model)`` the cache files ``tier``'s translations under.
+
+        A local tier's server answers to a generic model name, so the GGUF it
+        is serving stands in for the model.
+        """
+        provider_id, model = provider_mod.provider_identity(provider)
+        if tier != TIER_HOSTED:
+            gguf = self.tier_gguf_path(tier)
+            if gguf:
+                model = Path(gguf).name
+        return provider_id, model
+
+    def _translate_texts(
+        self,
+        provider: Any,
+        texts: list[str],
+        target_lang: str,
+        source_lang: str | None,
+    ) -> list[str]:
+        """Translate ``texts`` (blanks pass through) in one call when possible.
+
+        Two or more non-blank single-line cues (:func:`_batchable`) go out as one
+        numbered list; a reply that does not parse back into exactly that many
+        entries is retried per line, so a model that ignores the format costs
+        one extra call, never a wrong cue. Multi-line or digit-led cues are
+        always translated on their own.
+        """
+        out = list(texts)
+        pending = [k for k, text in enumerate(texts) if not _is_blank(text)]
+        batch = [k for k in pending if _batchable(texts[k])]
+        if len(batch) > 1:
+            reply = provider.chat(build_batch_messages([texts[k] for k in batch], target_lang, source_lang))
+            parsed = parse_numbered_reply(str(reply), len(batch))
+            if parsed is not None:
+                for k, new_text in zip(batch, parsed, strict=True):
+                    out[k] = new_text
+                done = set(batch)
+                pending = [k for k in pending if k not in done]
+            else:
+                log.info("batched translation reply did not parse; retrying %d line(s) singly", len(batch))
+        for k in pending:
+            out[k] = self._chat_one(provider, texts[k], target_lang, source_lang)
         return out
 
     def _tier_provider(self, tier: str) -> Any:
@@ -541,6 +805,7 @@ def get_translator(
     transport: Any | None = None,
     prefer: str | None = None,
     ensure: Callable[[], None] | None = None,
+    cache: TranslationCache | None = None,
     **seams: Any,
 ) -> TieredTranslator:
     """Factory the wiring layer calls (mirrors ``provider.get_provider``).
@@ -551,10 +816,12 @@ def get_translator(
     the hosted factory so the tier3 pool tries that provider first
     (``LOCAL_PROVIDER_ID`` -> a local-only hosted pool). An explicit
     ``hosted_provider_factory`` in ``seams`` still wins (tests / overrides).
+    ``cache`` is the persistent :class:`~.translation_cache.TranslationCache` the
+    wiring layer builds under the data dir (``None`` -> memory-only).
     """
     if "hosted_provider_factory" not in seams:
         seams["hosted_provider_factory"] = _default_hosted_factory(settings, transport=transport, prefer=prefer)
-    return TieredTranslator(runner=runner, settings=settings, ensure=ensure, **seams)
+    return TieredTranslator(runner=runner, settings=settings, ensure=ensure, cache=cache, **seams)
 
 
 # --------------------------------------------------------------------------- #
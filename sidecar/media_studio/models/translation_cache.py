@@ -0,0 +1,194 @@
+"""Exact-match subtitle translation cache (per tier + language pair).
+
+Dialogue tracks repeat short lines ("Yes.", "Thank you.", speaker names) dozens
+of times, and re-translating a track into the same language repeats every call.
+:class:`TranslationCache` answers an identical ``(tier, source, target, text)``
+from local storage so :class:`~media_studio.models.translation.TieredTranslator`
+only sends the lines it has never translated. The key also carries the provider
+id and model that produced the translation, so switching model (or pool) never
+serves another model's output.
+
+Entries are grouped into one shard per ``(tier, provider, model, source,
+target)`` — a JSON object
+``{source text: translation}`` — because a per-line file (the
+:class:`~media_studio.models.ai_cache.AiCache` layout) would mean thousands of
+tiny files per track. Shards live in memory once touched; with a ``store_dir``
+they are loaded lazily from ``<sha256 of the key>.json`` and written back by
+:meth:`flush`. Without one the cache is memory-only (one translator's lifetime).
+A shard keeps at most :data:`MAX_SHARD_ENTRIES` lines (least recently used go
+first), which also bounds what a flush rewrites. A flush merges with the shard
+on disk (so two jobs sharing the store keep each other's lines) and replaces it
+atomically (temp file + ``os.replace``).
+
+Like the other caches this is purely an accelerator: a corrupt / unreadable shard
+is an empty one and a failed write is logged and dropped.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Final
+
+from ..util import get_logger
+
+log = get_logger("media_studio.models.translation_cache")
+
+#: Sub-directory name under the app data dir holding the translation shards.
+DEFAULT_CACHE_DIRNAME: Final[str] = "translation-cache"
+
+#: Lines kept per shard; the least recently used are dropped past it.
+MAX_SHARD_ENTRIES: Final[int] = 5000
+
+#: ``(tier, provider, model, source_lang or "", target_lang)`` — one shard.
+ShardKey = tuple[str, str, str, str, str]
+
+
+class TranslationCache:
+    """Source-text -> translation cache, sharded by tier, model and language pair.
+
+    ``store_dir`` is optional: ``None`` keeps everything in memory. The dir is
+    created lazily on the first :meth:`flush` that has something to write.
+    Safe to share across the translator's worker threads: shard loading and
+    writes happen under one lock.
+    """
+
+    def __init__(
+        self,
+        *,
+        store_dir: str | os.PathLike[str] | None = None,
+        max_entries: int = MAX_SHARD_ENTRIES,
+    ) -> None:
+        self._store_dir = Path(store_dir) if store_dir is not None else None
+        self._max_entries = max(1, int(max_entries))
+        self._shards: dict[ShardKey, dict[str, str]] = {}
+        self._dirty: set[ShardKey] = set()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def shard_key(
+        tier: str, source_lang: str | None, target_lang: str, *, provider: str = "", model: str = ""
+    ) -> ShardKey:
+        """The shard ``(tier, provider, model, source, target)`` key; a missing source is ``""``."""
+        return (str(tier), str(provider), str(model), str(source_lang or ""), str(target_lang))
+
+    def path_for(self, shard: ShardKey) -> Path | None:
+        """Return the file backing ``shard`` (``None`` when memory-only).
+
+        The name is a digest of the pair so a free-form language tag can never
+        steer the path outside the store dir.
+        """
+        if self._store_dir is None:
+            return None
+        return self._store_dir / self._shard_filename(shard)
+
+    @staticmethod
+    def _shard_filename(shard: ShardKey) -> str:
+        digest = hashlib.sha256(json.dumps(list(shard), ensure_ascii=False).encode("utf-8")).hexdigest()
+        return f"{digest}.json"
+
+    def _shard(self, shard: ShardKey) -> dict[str, str]:
+        entries = self._shards.get(shard)
+        if entries is None:
+            entries = self._shards[shard] = self._load(shard)
+        return entries
+
+    def _load(self, shard: ShardKey) -> dict[str, str]:
+        path = self.path_for(shard)
+        if path is None:
+            return {}
+        try:
+            raw = path.read_text(encoding="utf-8")
+        except OSError:
+            return {}
+        try:
+            loaded = json.loads(raw)
+        except json.JSONDecodeError:
+            log.warning("translation_cache: discarding corrupt shard %s", path.name)
+            return {}
+        if not isinstance(loaded, dict):
+            return {}
+        return {k: v for k, v in loaded.items() if isinstance(k, str) and isinstance(v, str)}
+
+    def _trim(self, entries: dict[str, str]) -> None:
+        """Drop the oldest lines (dict order = least recently used first) past the cap."""
+        while len(entries) > self._max_entries:
+            del entries[next(iter(entries))]
+
+    def get(
+        self,
+        tier: str,
+        source_lang: str | None,
+        target_lang: str,
+        text: str,
+        *,
+        provider: str = "",
+        model: str = "",
+    ) -> str | None:
+        """Return the cached translation of ``text``, or ``None`` on a miss."""
+        shard = self.shard_key(tier, source_lang, target_lang, provider=provider, model=model)
+        with self._lock:
+            entries = self._shard(shard)
+            hit = entries.pop(text, None)
+            if hit is not None:
+                entries[text] = hit  # most recently used -> last out
+            return hit
+
+    def put(
+        self,
+        tier: str,
+        source_lang: str | None,
+        target_lang: str,
+        text: str,
+        translation: str,
+        *,
+        provider: str = "",
+        model: str = "",
+    ) -> None:
+        """Record ``translation`` for ``text`` (persisted on the next :meth:`flush`)."""
+        shard = self.shard_key(tier, source_lang, target_lang, provider=provider, model=model)
+        with self._lock:
+            entries = self._shard(shard)
+            if entries.get(text) != translation:
+                entries.pop(text, None)
+                entries[text] = translation
+                self._trim(entries)
+                self._dirty.add(shard)
+
+    def flush(self) -> None:
+        """Write every shard changed since the last flush (no-op when memory-only).
+
+        Each shard is merged over its current on-disk copy first (our lines win
+        and count as the most recent), so a concurrent job flushing the same
+        shard loses nothing it wrote before us, then written to a temp sibling
+        and ``os.replace``d so a reader never sees a half-written file. A write
+        failure (read-only / full disk) is logged and dropped; the shard stays in
+        memory and dirty, so a later flush retries it.
+        """
+        with self._lock:
+            if self._store_dir is None:
+                self._dirty.clear()
+                return
+            for shard in sorted(self._dirty):
+                path = self._store_dir / self._shard_filename(shard)
+                merged = self._load(shard)
+                for text in self._shards[shard]:
+                    merged.pop(text, None)
+                merged.update(self._shards[shard])
+                self._trim(merged)
+                tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+                try:
+                    self._store_dir.mkdir(parents=True, exist_ok=True)
+                    tmp.write_text(json.dumps(merged, ensure_ascii=False), encoding="utf-8")
+                    os.replace(tmp, path)
+                except OSError as exc:
+                    log.warning("translation_cache: could not store %s (%s)", path.name, exc)
+                    with contextlib.suppress(OSError):
+                        tmp.unlink()
+                    continue
+                self._shards[shard] = merged
+                self._dirty.discard(shard)
@@ -0,0 +1,91 @@
+"""Shared ffmpeg/ffprobe discovery for the real-media tests.
+
+Every real-render test module used to resolve ``ffmpeg`` and ``ffprobe`` off
+``PATH`` on its own (``shutil.which`` walks and stats every PATH entry). The
+lookup is done ONCE per session here and shared, so the skip-if-absent guards
+and the sample-clip fixture all read the same cached answer. The render/probe
+helpers several modules used to copy-paste live here too.
+"""
+
+from __future__ import annotations
+
+import functools
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+
+
+@functools.cache
+def ffmpeg_paths() -> tuple[str | None, str | None]:
+    """Return the resolved ``(ffmpeg, ffprobe)`` paths (``None`` when absent)."""
+    return shutil.which("ffmpeg"), shutil.which("ffprobe")
+
+
+def have_ffmpeg() -> bool:
+    """True iff BOTH ffmpeg and ffprobe are on PATH."""
+    ffmpeg, ffprobe = ffmpeg_paths()
+    return ffmpeg is not None and ffprobe is not None
+
+
+def require_ffmpeg() -> tuple[str, str]:
+    """Return ``(ffmpeg, ffprobe)`` or skip the calling test when either is absent."""
+    ffmpeg, ffprobe = ffmpeg_paths()
+    if ffmpeg is None or ffprobe is None:
+        pytest.skip("ffmpeg/ffprobe not installed")
+    return ffmpeg, ffprobe
+
+
+def run_ffmpeg(args: list[str]) -> None:
+    """Run ``ffmpeg -y -loglevel error <args>``, asserting a clean exit."""
+    ffmpeg, _ = require_ffmpeg()
+    res = subprocess.run([ffmpeg, "-y", "-loglevel", "error", *args], capture_output=True, text=True)  # noqa: S603
+    assert res.returncode == 0, f"ffmpeg failed: {res.stderr}"
+
+
+def make_landscape_mp4(path: Path, *, seconds: int = 6) -> None:
+    """A real 16:9 1280x720 mp4: moving testsrc + a tone (ffprobe-valid)."""
+    run_ffmpeg(
+        [
+            "-f",
+            "lavfi",
+            "-i",
+            f"testsrc=size=1280x720:rate=24:duration={seconds}",
+            "-f",
+            "lavfi",
+            "-i",
+            f"sine=frequency=440:duration={seconds}",
+            "-c:v",
+            "libx264",
+            "-pix_fmt",
+            "yuv420p",
+            "-c:a",
+            "aac",
+            "-shortest",
+            str(path),
+        ]
+    )
+
+
+def probe_video_duration(path: Path | str) -> float:
+    """Return the playable duration of ``path`` (a ffprobe-valid file with video)."""
+    _, ffprobe = require_ffmpeg()
+    out = subprocess.run(  # noqa: S603 - fixed argv, no shell, test-only probe
+        [
+            ffprobe,
+            "-v",
+            "error",
+            "-select_streams",
+            "v:0",
+            "-show_entries",
+            "format=duration",
+            "-of",
+            "csv=p=0",
+            str(path),
+        ],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout.strip()
+    return float(out)
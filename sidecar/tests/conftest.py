@@ -6,16 +6,21 @@ imported. No faster-whisper / scenedetect / httpx import happens here.
 
 from __future__ import annotations
 
+import functools
 import io
 import json
+import shutil
+from collections.abc import Callable
+from pathlib import Path
 from typing import Any
 
 import pytest
 from hypothesis import HealthCheck, settings
-from media_studio import protocol
+from media_studio import ffmpeg, protocol
 from media_studio.jobs import JobRegistry
 
 from tests import _hermetic
+from tests._ffmpeg import require_ffmpeg, run_ffmpeg
 
 # --- Hermetic egress guard (ALWAYS ON) -------------------------------------
 # Installed at MODULE scope, not in a fixture, so it is armed before any test
@@ -95,6 +100,14 @@ def _restore_methods():
         protocol.METHODS.update(saved)
 
 
+@pytest.fixture(autouse=True)
+def _fresh_binary_lookup():
+    """Drop memoized PATH lookups so a test's ``shutil.which`` patch is honoured."""
+    ffmpeg.clear_binary_cache()
+    yield
+    ffmpeg.clear_binary_cache()
+
+
 class FakeStreams:
     """Drives an RpcServer with in-memory text streams (no real stdio)."""
 
@@ -127,3 +140,61 @@ def make_streams():
         return FakeStreams(lines)
 
     return _factory
+
+
+# --- Real-ffmpeg sample clips (session-scoped, rendered once) ---------------
+# The integration tests that prove a REAL render all need the same tiny lavfi
+# testsrc+sine mp4. Forking ffmpeg + a libx264/aac encode per test is the bulk of
+# their wall time, so the clip is rendered ONCE per unique ``seconds`` per session
+# into a session temp dir; each test copies the cached file where it needs it
+# (tests edit/overwrite their media, so the cached original is never handed out).
+
+
+def _render_sample_clip(path: Path, seconds: float) -> None:
+    """Render a tiny real testsrc clip (video + 440 Hz tone) to ``path``.
+
+    Goes through :func:`tests._ffmpeg.run_ffmpeg`, so it uses the session's
+    resolved ffmpeg (never a bare ``"ffmpeg"`` re-looked-up on PATH) and a failed
+    render asserts with ffmpeg's stderr.
+    """
+    run_ffmpeg(
+        [
+            "-f",
+            "lavfi",
+            "-i",
+            f"testsrc=size=320x240:rate=15:duration={seconds}",
+            "-f",
+            "lavfi",
+            "-i",
+            f"sine=frequency=440:duration={seconds}",
+            "-shortest",
+            "-c:v",
+            "libx264",
+            "-c:a",
+            "aac",
+            "-t",
+            str(seconds),
+            str(path),
+        ]
+    )
+
+
+@pytest.fixture(scope="session")
+def sample_clip_factory(tmp_path_factory: pytest.TempPathFactory) -> Callable[..., Path]:
+    """Factory: ``make(dest, seconds=1.5)`` copies a cached real sample to ``dest``.
+
+    Skips the calling test when ffmpeg is not installed."""
+    cache_dir = tmp_path_factory.mktemp("sample-clips")
+
+    @functools.cache
+    def _cached(seconds: float) -> Path:
+        path = cache_dir / f"sample-{seconds}s.mp4"
+        _render_sample_clip(path, seconds)
+        return path
+
+    def _make(dest: Path, *, seconds: float = 1.5) -> Path:
+        require_ffmpeg()
+        shutil.copyfile(_cached(seconds), dest)
+        return dest
+
+    return _make
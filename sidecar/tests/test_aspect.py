@@ -123,3 +123,12 @@ def test_output_dimensions_generic_odd_derived_edge_is_rounded_even():
     assert h == 1920
     assert w == 1068
     assert w % 2 == 0
+
+
+def test_output_dimensions_is_memoized_per_aspect_and_still_rejects_garbage():
+    aspect.output_dimensions.cache_clear()
+    assert aspect.output_dimensions("4:5") == aspect.output_dimensions("4:5")
+    assert aspect.output_dimensions.cache_info().hits == 1
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            aspect.output_dimensions("nope")
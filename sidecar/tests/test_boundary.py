@@ -534,6 +534,8 @@ class TestDetectionSeam:
         # the path with a space stays a single argv element
         assert "/a b/v.mp4" in argv
         assert any("silencedetect" in a for a in argv)
+        # no per-frame stats line: stderr stays bounded to the analysis output
+        assert "-nostats" in argv
 
     def test_detect_silences_parses_mocked_ffmpeg_stderr(self) -> None:
         calls: list[list[str]] = []
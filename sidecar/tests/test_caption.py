@@ -27,6 +27,7 @@ from media_studio.features.caption import (
     build_softmux_argv,
     escape_ass_text,
     format_ass_timestamp,
+    format_ass_timestamps,
     rebase_cue_time,
     render_cue_text,
     wrap_hook_title,
@@ -113,6 +114,17 @@ def test_escape_none_and_non_str():
     assert escape_ass_text(123) == "123"  # type: ignore[arg-type]
 
 
+@pytest.mark.parametrize(
+    "text",
+    ["", "plain", "\\{\r\n}\r\r\n\n\\N", "a\\\\b{{}}\n\r", "\r\n\r\n", "}\\\r"],
+)
+def test_escape_matches_ordered_replace_chain(text):
+    """The single translate pass equals the old backslash-first replace chain."""
+    ref = text.replace("\\", "\\\\").replace("{", r"\{").replace("}", r"\}")
+    ref = ref.replace("\r\n", "\n").replace("\r", "\n").replace("\n", r"\N")
+    assert escape_ass_text(text) == ref
+
+
 # --------------------------------------------------------------------------- #
 # format_ass_timestamp
 # --------------------------------------------------------------------------- #
@@ -135,6 +147,14 @@ def test_timestamp_negative_clamped():
     assert format_ass_timestamp(None) == "0:00:00.00"  # type: ignore[arg-type]
 
 
+def test_timestamps_batch_matches_scalar():
+    # Half-centisecond ties, carries, hour wrap and a clamped negative.
+    values = [0.0, 0.005, 0.015, 0.125, 1.239, 1.999, 59.995, 3599.995, 36000.0, -2.0]
+    values += [i * 0.0137 for i in range(2000)]
+    assert format_ass_timestamps(values) == [format_ass_timestamp(v) for v in values]
+    assert format_ass_timestamps([]) == []
+
+
 # --------------------------------------------------------------------------- #
 # rebase_cue_time
 # --------------------------------------------------------------------------- #
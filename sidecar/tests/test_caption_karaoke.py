@@ -10,6 +10,8 @@ line + branch coverage of ``caption_karaoke.py``.
 
 from __future__ import annotations
 
+import random
+
 import pytest
 from media_studio.features import caption_karaoke as ck
 from media_studio.features import caption_override as co
@@ -147,6 +149,15 @@ class TestGroupIntoLines:
     def test_empty(self) -> None:
         assert ck.group_into_lines([]) == []
 
+    def test_lines_are_independent_lists_for_any_sequence(self) -> None:
+        words = [{"text": f"w{i}"} for i in range(6)]
+        for source in (words, tuple(words)):
+            lines = ck.group_into_lines(source, max_per_line=4)
+            assert lines == [words[:4], words[4:]]
+            assert all(type(line) is list for line in lines)
+        lines[0].append({"text": "x"})
+        assert len(words) == 6
+
 
 # --------------------------------------------------------------------------- #
 # build_line_text — exact inline tags for the active word
@@ -163,6 +174,15 @@ class TestBuildLineText:
         text = ck.build_line_text(line, active_index=0, active_color="&H0000FFFF&", uppercase=False)
         assert "abc" in text and "ABC" not in text
 
+    def test_repeated_words_are_escaped_once(self) -> None:
+        ck._escape_word.cache_clear()
+        line = [{"text": "yeah"}, {"text": "Yeah"}, {"text": "yeah"}, {"text": "{no}"}]
+        text = ck.build_line_text(line, active_index=3, active_color="&H0000FFFF&")
+        assert text.startswith("YEAH YEAH YEAH {\\1c&H0000FFFF&")
+        assert "\\{NO\\}" in text
+        info = ck._escape_word.cache_info()
+        assert (info.hits, info.misses) == (1, 3)  # "yeah" repeats; case-distinct raws do not
+
     def test_escapes_injection_in_active_and_plain_words(self) -> None:
         line = [{"text": "a{b}"}, {"text": "c\\d"}]
         text = ck.build_line_text(line, active_index=0, active_color="&H0000FFFF&")
@@ -252,3 +272,37 @@ class TestBuildKaraokeAss:
         # the 5th word is alone on its own line (group of 1): no sibling context.
         # absolute word index 4 -> 4 % 2 == 0 -> yellow.
         assert dialogue[4].endswith("{\\1c&H0000FFFF&\\t(0,120,\\fscx115\\fscy115)}W4{\\r}")
+
+    def test_events_match_per_word_rebase_reference(self) -> None:
+        """The column re-base + batch formatting equals the per-word scalar loop."""
+        from media_studio.features.caption import format_ass_timestamp, rebase_cue_time
+
+        rng = random.Random(7)
+        words = []
+        for i in range(200):
+            start = rng.uniform(0.0, 40.0)
+            end = start + rng.choice([0.0, -0.3, rng.uniform(0.0, 1.5)])
+            words.append({"text": f"w{i}", "start": start, "end": end})
+        words.append({"text": "nan", "start": float("nan"), "end": 30.0})
+        cue = {"start": 0.0, "end": 40.0, "text": "", "words": words}
+        source_start = 12.345
+        doc = ck.build_karaoke_ass([cue], source_start=source_start)
+        got = [ln for ln in doc.splitlines() if ln.startswith("Dialogue:")]
+
+        flat = ck.words_from_cue(cue)
+        expected = []
+        index = 0
+        for line in ck.group_into_lines(flat):
+            for active_index, word in enumerate(line):
+                color = ck.active_color_for_index(index, ck.KARAOKE_ACTIVE_INLINE)
+                index += 1
+                start = rebase_cue_time(word["start"], source_start)
+                end = rebase_cue_time(word["end"], source_start)
+                if end <= start:
+                    continue
+                text = ck.build_line_text(line, active_index, color)
+                expected.append(
+                    f"Dialogue: 0,{format_ass_timestamp(start)},{format_ass_timestamp(end)},Default,,0,0,0,,{text}"
+                )
+        assert got == expected
+        assert 0 < len(got) < len(flat)
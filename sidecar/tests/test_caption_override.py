@@ -52,6 +52,12 @@ class TestHexToAssColor:
     def test_non_string_returns_none(self, bad: object) -> None:
         assert co.hex_to_ass_color(bad) is None
 
+    def test_repeat_conversion_is_served_from_cache(self) -> None:
+        co._hex_str_to_ass_color.cache_clear()
+        first = co.hex_to_ass_color("#1A2B3C")
+        assert co.hex_to_ass_color("#1A2B3C") == first == "&H003C2B1A&"
+        assert co._hex_str_to_ass_color.cache_info().hits == 1
+
 
 # --------------------------------------------------------------------------- #
 # apply_override — base (empty/None) reproduces the V1 style exactly
@@ -75,6 +81,12 @@ class TestApplyOverrideBase:
         assert r.active_color is None
         assert r.spoken_color is None
 
+    def test_resolved_style_is_slotted_and_frozen(self) -> None:
+        r = co.apply_override(None)
+        assert not hasattr(r, "__dict__")
+        with pytest.raises(AttributeError):
+            r.font_name = "Impact"  # type: ignore[misc]
+
 
 # --------------------------------------------------------------------------- #
 # apply_override — fontFamily allowlist
@@ -9,6 +9,7 @@ factories are smoke-tested.
 
 from __future__ import annotations
 
+import re
 from typing import Any
 
 import pytest
@@ -106,6 +107,21 @@ class TestWrapTwoLines:
         out = cp.wrap_two_lines("supercalifragilistic", max_cpl=5)
         assert out == "supercalifragilistic"
 
+    @pytest.mark.parametrize("max_cpl", [1, 5, 11, 12, 13, 42])
+    @pytest.mark.parametrize("max_lines", [1, 2, 3])
+    def test_running_length_matches_string_rebuild_reference(self, max_cpl, max_lines):
+        text = "the quick  brown fox jumps over a lazy dog while supercalifragilistic words wait"
+        lines, current = [], ""
+        for word in text.split():
+            candidate = f"{current} {word}".strip()
+            if current and len(candidate) > max_cpl and len(lines) < max_lines - 1:
+                lines.append(current)
+                current = word
+            else:
+                current = candidate
+        lines.append(current)
+        assert cp.wrap_two_lines(text, max_cpl=max_cpl, max_lines=max_lines) == "\n".join(lines)
+
 
 # --------------------------------------------------------------------------- #
 # enforce_cps_cpl
@@ -260,6 +276,40 @@ class TestApplyEmphasisSpans:
         cp.apply_emphasis_spans(cue, ["hello"])
         assert "emphasis" not in cue
 
+    def test_keywords_match_whole_words_case_insensitively(self):
+        out = cp.apply_emphasis_spans(_cue(1, 0.0, 1.0, "Rust and rusty RUST"), ["rust"])
+        assert [(s["start"], s["end"]) for s in out["emphasis"]] == [(0, 4), (15, 19)]
+
+    def test_keyword_pattern_is_reused_for_the_same_keyword_set(self):
+        first = cp._keyword_pattern(["Quick", "fox"])
+        # Same set after normalization (case, padding, order, duplicates) -> same object.
+        assert cp._keyword_pattern([" fox ", "quick", "FOX"]) is first
+        assert cp._keyword_pattern(["fox"]) is not first
+
+    @pytest.mark.parametrize(
+        ("text", "keywords"),
+        [
+            ("new york city is new", ["new york", "new", "york city"]),
+            ("the quick brown fox jumps", ["fox", "quick", "QUICK ", "brown fox"]),
+            ("get FREE stuff for free", ["free", "stuff"]),
+            ("c++ and c# are languages", ["c++", "languages"]),
+            ("nothing matches here", ["absent", "missing"]),
+            ("aa bb bb bb", ["bb bb", "aa bb"]),  # a self-overlapping keyword matches once
+        ],
+    )
+    def test_cached_patterns_match_per_keyword_reference(self, text, keywords):
+        spans = list(cp._emphasis.find_emphasis_spans(text))
+        for kw in keywords:
+            kw_norm = kw.strip().lower()
+            for match in re.finditer(rf"\b{re.escape(kw_norm)}\b", text.lower()):
+                spans.append({"start": match.start(), "end": match.end(), "kind": "keyword"})
+        expected = cp._emphasis.normalize_spans(spans, len(text))
+        assert cp.apply_emphasis_spans(_cue(1, 0.0, 1.0, text), keywords)["emphasis"] == expected
+
+    def test_self_overlapping_keyword_never_adds_spans(self):
+        out = cp.apply_emphasis_spans(_cue(1, 0.0, 1.0, "aa bb bb bb"), ["bb bb", "aa bb"])
+        assert [(s["start"], s["end"]) for s in out["emphasis"]] == [(0, 5)]
+
 
 # --------------------------------------------------------------------------- #
 # mask_profanity
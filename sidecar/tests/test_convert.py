@@ -9,6 +9,7 @@ that contain spaces and the audio-extract path.
 
 from __future__ import annotations
 
+import threading
 from pathlib import Path
 from typing import Any
 
@@ -349,6 +350,158 @@ def test_convert_batch_resolves_video_ids(bins):
     assert [Path(p) for p in paths] == [Path("/lib/a.mp4"), Path("/lib/b.mkv")]
 
 
+@pytest.mark.parametrize(
+    ("settings", "n_items", "expected"),
+    [
+        ({}, 5, 1),  # opt-in: serial unless convertConcurrency is set
+        ({}, 1, 1),  # never more workers than items
+        ({"convertConcurrency": 1}, 5, 1),
+        ({"convertConcurrency": 0}, 5, 1),  # clamped up to 1
+        ({"convertConcurrency": 99}, 20, convert.MAX_CONVERT_CONCURRENCY),
+        ({"convertConcurrency": True}, 5, convert.DEFAULT_CONVERT_CONCURRENCY),  # bool is not a count
+        ({"convertConcurrency": "4"}, 5, convert.DEFAULT_CONVERT_CONCURRENCY),
+    ],
+)
+def test_resolve_concurrency(settings, n_items, expected):
+    assert convert.resolve_concurrency(settings, n_items) == expected
+
+
+def test_convert_batch_overlaps_items_and_keeps_path_order(bins):
+    # Both conversions must be in flight at once for the barrier to release.
+    barrier = threading.Barrier(2, timeout=5)
+    inner = _RunRecorder(code=0)
+
+    def run(argv, **kwargs):
+        barrier.wait()
+        return inner(argv, **kwargs)
+
+    paths = convert.convert_batch(
+        [
+            {"path": "/a/one.mov", "options": {"container": "mp4"}},
+            {"path": "/a/two.mov", "options": {"container": "mkv"}},
+        ],
+        settings={**bins, "convertConcurrency": 2},
+        run=run,
+        probe=_probe(1.0),
+    )
+    assert [Path(p) for p in paths] == [Path("/a/one.mp4"), Path("/a/two.mkv")]
+
+
+def test_concurrent_batch_with_a_shared_output_runs_in_turn(bins):
+    lock = threading.Lock()
+    in_flight: list[int] = [0]
+    peak: list[int] = [0]
+    inner = _RunRecorder(code=0)
+
+    def run(argv, **kwargs):
+        with lock:
+            in_flight[0] += 1
+            peak[0] = max(peak[0], in_flight[0])
+        threading.Event().wait(0.05)
+        with lock:
+            in_flight[0] -= 1
+        return inner(argv, **kwargs)
+
+    paths = convert.convert_batch(
+        [
+            {"path": "/a/one.mov", "options": {"container": "mp4"}},
+            {"path": "/a/two.mov", "options": {}, "out": "/a/one.mp4"},  # same file as item 0
+            {"path": "/a/three.mov", "options": {}},
+        ],
+        settings={**bins, "convertConcurrency": 3},
+        run=run,
+        probe=_probe(1.0),
+    )
+    assert peak[0] == 1
+    assert [Path(p) for p in paths] == [Path("/a/one.mp4"), Path("/a/one.mp4"), Path("/a/three.mp4")]
+
+
+def test_cancelled_concurrent_batch_returns_the_completed_prefix(bins):
+    cancelled = threading.Event()
+    # The cancel lands while "one" and "two" are both in flight; they finish, the rest never start.
+    both_running = threading.Barrier(2, action=cancelled.set, timeout=5)
+
+    def run(argv, **kwargs):
+        both_running.wait()
+        return 0
+
+    paths = convert.convert_batch(
+        [{"path": f"/a/{name}.mov", "options": {}} for name in ("one", "two", "three", "four")],
+        settings={**bins, "convertConcurrency": 2},
+        should_cancel=cancelled.is_set,
+        run=run,
+        probe=_probe(1.0),
+    )
+    assert [Path(p) for p in paths] == [Path("/a/one.mp4"), Path("/a/two.mp4")]  # paths[k] is items[k]'s output
+
+
+@pytest.mark.parametrize(("cpus", "workers", "expected"), [(8, 2, 4), (8, 3, 2), (2, 4, 1), (None, 2, 1)])
+def test_threads_per_process_splits_the_cores(monkeypatch, cpus, workers, expected):
+    monkeypatch.setattr(convert.os, "cpu_count", lambda: cpus)
+    assert convert.threads_per_process(workers) == expected
+
+
+def test_concurrent_batch_pins_threads_per_ffmpeg(bins, monkeypatch):
+    monkeypatch.setattr(convert.os, "cpu_count", lambda: 8)
+    run = _RunRecorder(code=0)
+    convert.convert_batch(
+        [{"path": f"/a/{k}.mov", "options": {}} for k in range(2)],
+        settings={**bins, "convertConcurrency": 2},
+        run=run,
+        probe=_probe(1.0),
+    )
+    for call in run.calls:
+        assert call["argv"][call["argv"].index("-threads") + 1] == "4"
+
+
+def test_serial_batch_leaves_ffmpeg_threading_alone(bins):
+    run = _RunRecorder(code=0)
+    convert.convert_batch(
+        [{"path": "/a/one.mov", "options": {}}],
+        settings=bins,
+        run=run,
+        probe=_probe(1.0),
+    )
+    assert "-threads" not in run.calls[0]["argv"]
+
+
+def test_concurrent_batch_progress_is_monotonic(bins):
+    run = _RunRecorder(code=0, progress_pcts=[20.0, 60.0])
+    seen: list[float] = []
+    convert.convert_batch(
+        [{"path": f"/a/{k}.mov", "options": {}} for k in range(4)],
+        settings={**bins, "convertConcurrency": 3},
+        on_progress=lambda p, m: seen.append(p),
+        run=run,
+        probe=_probe(1.0),
+    )
+    assert seen == sorted(seen)
+    assert seen[-1] == 100.0
+
+
+def test_concurrent_batch_failure_stops_unstarted_items_and_raises(bins):
+    started: list[str] = []
+    both_running = threading.Barrier(2, timeout=5)
+
+    def run(argv, **kwargs):
+        started.append(Path(argv[-1]).name)
+        both_running.wait()
+        if argv[-1].endswith("one.mp4"):
+            return 1
+        # Hold "two" so its worker can't pick up a third item before "one" fails.
+        threading.Event().wait(0.2)
+        return 0
+
+    with pytest.raises(RuntimeError, match="one.mov"):
+        convert.convert_batch(
+            [{"path": f"/a/{name}.mov", "options": {"container": "mp4"}} for name in ("one", "two", "three", "four")],
+            settings={**bins, "convertConcurrency": 2},
+            run=run,
+            probe=_probe(1.0),
+        )
+    assert sorted(started) == ["one.mp4", "two.mp4"]
+
+
 # --------------------------------------------------------------------------- #
 # job handlers + integration with JobRegistry
 # --------------------------------------------------------------------------- #
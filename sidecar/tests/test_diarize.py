@@ -68,6 +68,43 @@ class TestGreedyCluster:
         embs = [[1.0, 0.0], [0.0, 1.0], [1.0, 0.0]]
         assert diarize.greedy_cluster(embs, threshold=0.4) == [0, 1, 0]
 
+    def test_length_mismatch_raises(self):
+        with pytest.raises(ValueError, match="length mismatch"):
+            diarize.greedy_cluster([[1.0, 0.0], [1.0]])
+
+    def test_zero_vector_scores_zero_against_every_centroid(self):
+        # 0.0 similarity everywhere: joins the FIRST cluster only if the threshold allows.
+        assert diarize.greedy_cluster([[1.0, 0.0], [0.0, 0.0]], threshold=0.0) == [0, 0]
+        assert diarize.greedy_cluster([[1.0, 0.0], [0.0, 0.0]], threshold=0.5) == [0, 1]
+
+    def test_exactly_opposite_never_joins_even_at_minimum_threshold(self):
+        # A -1.0 best similarity never beats the -1.0 floor -> a new cluster opens.
+        assert diarize.greedy_cluster([[1.0, 0.0], [-1.0, 0.0]], threshold=-1.0) == [0, 1]
+
+    def test_matches_the_pairwise_centroid_loop(self):
+        import random
+
+        rng = random.Random(7)
+        embs = [[rng.uniform(-1, 1) for _ in range(8)] for _ in range(60)]
+        # Oracle: the plain per-centroid cosine loop (mean centroids, first best wins).
+        expected: list[int] = []
+        members: list[list[list[float]]] = []
+        for vec in embs:
+            best_idx, best_sim = -1, -1.0
+            for idx, group in enumerate(members):
+                centroid = [sum(col) / len(group) for col in zip(*group, strict=True)]
+                sim = diarize.cosine_similarity(vec, centroid)
+                if sim > best_sim:
+                    best_idx, best_sim = idx, sim
+            if best_idx < 0 or best_sim < 0.2:
+                members.append([vec])
+                expected.append(len(members) - 1)
+            else:
+                members[best_idx].append(vec)
+                expected.append(best_idx)
+        assert diarize.greedy_cluster(embs, threshold=0.2) == expected
+        assert len(set(expected)) > 1
+
 
 # --------------------------------------------------------------------------- #
 # pure: speaker_label / roster
@@ -104,10 +141,58 @@ class TestAssign:
         out = diarize.assign_speakers_to_segments(segs, regions, [0, 1])
         assert out[0]["speaker"] == "SPEAKER_01"  # the nearer region
 
+    def test_several_unmatched_segments_each_take_their_nearest(self):
+        segs = [{"start": 10.0, "end": 11.0}, {"start": 2.0, "end": 2.5}, {"start": 3.8, "end": 3.9}]
+        regions = [{"start": 0.0, "end": 1.0}, {"start": 8.0, "end": 9.0}, {"start": 3.0, "end": 3.5}]
+        out = diarize.assign_speakers_to_segments(segs, regions, [0, 1, 2])
+        assert [s["speaker"] for s in out] == ["SPEAKER_01", "SPEAKER_02", "SPEAKER_02"]
+
+    def test_nearest_fallback_is_identical_across_broadcast_blocks(self, monkeypatch):
+        segs = [{"start": 10.0, "end": 11.0}, {"start": 2.0, "end": 2.5}, {"start": 3.8, "end": 3.9}]
+        regions = [{"start": 0.0, "end": 1.0}, {"start": 8.0, "end": 9.0}, {"start": 3.0, "end": 3.5}]
+        monkeypatch.setattr(diarize, "_NEAREST_BLOCK", 2)  # 3 unmatched rows -> two blocks
+        out = diarize.assign_speakers_to_segments(segs, regions, [0, 1, 2])
+        assert [s["speaker"] for s in out] == ["SPEAKER_01", "SPEAKER_02", "SPEAKER_02"]
+
+    def test_nearest_fallback_tie_keeps_input_order(self):
+        segs = [{"start": 4.0, "end": 6.0}]  # mid 5.0 is 1 s from both regions
+        regions = [{"start": 6.0, "end": 7.0}, {"start": 3.0, "end": 4.0}]
+        out = diarize.assign_speakers_to_segments(segs, regions, [0, 1])
+        assert out[0]["speaker"] == "SPEAKER_00"
+
     def test_no_regions_leaves_blank(self):
         out = diarize.assign_speakers_to_segments([{"start": 0.0, "end": 1.0}], [], [])
         assert out[0]["speaker"] == ""
 
+    def test_regions_without_labels_leave_blank_copies(self):
+        segs = [{"start": 0.0, "end": 1.0, "text": "a"}]
+        out = diarize.assign_speakers_to_segments(segs, [{"start": 0.0, "end": 1.0}], [])
+        assert out == [{"start": 0.0, "end": 1.0, "text": "a", "speaker": ""}]
+        assert out[0] is not segs[0]
+
+    def test_unsorted_inputs_keep_segment_order(self):
+        # The sweep visits both lists in start order but must emit in INPUT order.
+        segs = [{"start": 5.0, "end": 6.0, "text": "b"}, {"start": 0.0, "end": 1.0, "text": "a"}]
+        regions = [{"start": 4.5, "end": 6.5}, {"start": 0.0, "end": 2.0}]
+        out = diarize.assign_speakers_to_segments(segs, regions, [1, 0])
+        assert [s["text"] for s in out] == ["b", "a"]
+        assert [s["speaker"] for s in out] == ["SPEAKER_01", "SPEAKER_00"]
+
+    def test_equal_overlap_tie_goes_to_earliest_input_region(self):
+        segs = [{"start": 1.0, "end": 3.0}]
+        # Both overlap by 1.0 s; the later-starting region comes FIRST in input order.
+        regions = [{"start": 2.0, "end": 4.0}, {"start": 0.0, "end": 2.0}]
+        out = diarize.assign_speakers_to_segments(segs, regions, [0, 1])
+        assert out[0]["speaker"] == "SPEAKER_00"
+
+    def test_long_region_still_seen_after_short_ones_end(self):
+        # A long early region must not be skipped by the cursor once a shorter
+        # region that started after it has already ended.
+        segs = [{"start": 0.0, "end": 0.5}, {"start": 8.0, "end": 9.0}]
+        regions = [{"start": 0.0, "end": 10.0}, {"start": 0.2, "end": 0.4}]
+        out = diarize.assign_speakers_to_segments(segs, regions, [0, 1])
+        assert [s["speaker"] for s in out] == ["SPEAKER_00", "SPEAKER_00"]
+
 
 # --------------------------------------------------------------------------- #
 # pure: diarize_transcript end-to-end
@@ -397,6 +482,16 @@ class TestRenameSpeakers:
         assert out["speakers"] == ["SPEAKER_00", "SPEAKER_01"]
         assert out["segments"][0]["speaker"] == "SPEAKER_00"
 
+    def test_every_segment_is_a_fresh_copy(self):
+        t = _diarized_transcript()
+        t["segments"].append({"start": 7.0, "end": 8.0, "text": "x"})  # no speaker key
+        out = diarize.rename_speakers(t, {"SPEAKER_00": "Alex"})
+        for before, after in zip(t["segments"], out["segments"], strict=True):
+            assert after is not before  # unchanged labels too: never aliased
+        out["segments"][1]["text"] = "edited"
+        out["segments"][2]["text"] = "edited"
+        assert t["segments"][1]["text"] == "bye" and t["segments"][2]["text"] == "x"
+
     def test_segment_without_speaker_key_untouched(self):
         t = {
             "segments": [{"start": 0.0, "end": 1.0, "text": "x"}],
@@ -535,6 +630,19 @@ def test_default_models_present_true_when_all_installed(monkeypatch):
     assert diarize.default_models_present({}) is True
 
 
+def test_default_models_present_vad_only_needs_just_the_vad(monkeypatch):
+    from media_studio.assets import manager as _manager
+
+    monkeypatch.setattr(
+        _manager.AssetManager,
+        "installed_path",
+        lambda self, entry: "/cache/vad" if entry.name == diarize.VAD_ASSET_NAME else None,
+    )
+    diarize.register_diarize_assets()
+    assert diarize.default_models_present({}) is False  # ECAPA still missing
+    assert diarize.default_models_present({}, required=diarize.VAD_ONLY_ASSETS) is True
+
+
 def test_default_backend_factory_builds_speechbrain_diarizer():
     # The lazy factory imports diarize_backend and returns a SpeechBrainDiarizer
     # WITHOUT touching speechbrain/torch (those imports live inside its methods).
@@ -567,6 +675,143 @@ def test_diarize_backend_module_imports_light():
     assert inst is not None
 
 
+def test_single_speaker_regions_label_every_region_as_one_speaker():
+    from media_studio.features import diarize_backend as db
+
+    regions, embeddings = db.single_speaker_regions([[0.0, 1.5], [2.0, 2.0], [3.0, 7.25]])
+    assert regions == [{"start": 0.0, "end": 1.5}, {"start": 3.0, "end": 7.25}]  # zero-length dropped
+    assert embeddings == [[1.0], [1.0]]
+    # Fed through the unchanged pure pipeline, every segment gets SPEAKER_00.
+    transcript = {"segments": [{"start": 0.2, "end": 1.0}, {"start": 4.0, "end": 5.0}]}
+    labelled = diarize.diarize_transcript(transcript, regions, embeddings)
+    assert [s["speaker"] for s in labelled["segments"]] == ["SPEAKER_00", "SPEAKER_00"]
+    assert labelled["speakers"] == ["SPEAKER_00"]
+
+
+def test_single_speaker_regions_empty_vad_output():
+    from media_studio.features import diarize_backend as db
+
+    assert db.single_speaker_regions([]) == ([], [])
+
+
+def _reference_windows(boundaries):
+    # The original per-window loop, kept as the oracle for the hoisted version.
+    from media_studio.features import diarize_backend as db
+
+    out = []
+    for start, end in boundaries:
+        ws = float(start)
+        while ws < end:
+            we = min(ws + db.WINDOW_SEC, end)
+            if we - ws >= db.MIN_WINDOW_SEC:
+                out.append((ws, we))
+            if we >= end:
+                break
+            ws += db.HOP_SEC
+    return out
+
+
+def test_sliding_windows_steps_full_windows_and_keeps_long_enough_tail():
+    from media_studio.features import diarize_backend as db
+
+    # 0..5 s: full windows at 0 and 1.25, then the 2.5..5.0 window ends exactly
+    # at the region end (kept, full length); 10..10.3 is too short to embed.
+    assert db.sliding_windows([[0.0, 5.0], [10.0, 10.3]]) == [(0.0, 2.5), (1.25, 3.75), (2.5, 5.0)]
+    assert db.sliding_windows([[0.0, 1.0]]) == [(0.0, 1.0)]  # short region = one clipped window
+    assert db.sliding_windows([[3.0, 3.0], [4.0, 2.0]]) == []  # empty / inverted rows
+    assert db.sliding_windows([]) == []
+
+
+@pytest.mark.parametrize(
+    "rows",
+    [
+        [(0.0, 2.5)],
+        [(0.0, 3.0), (3.1, 3.55), (4.0, 4.5)],
+        [(0.7, 12.34), (20.0, 20.49), (30.0, 31.75)],
+        [(5.0, 125.0)],
+    ],
+)
+def test_sliding_windows_matches_the_per_window_loop(rows):
+    from media_studio.features import diarize_backend as db
+
+    assert db.sliding_windows(rows) == _reference_windows(rows)
+
+
+def test_merge_speech_regions_bridges_short_pauses_only():
+    from media_studio.features import diarize_backend as db
+
+    rows = [[4.0, 5.0], [0.0, 1.0], [1.2, 1.4], [1.5, 3.0], [3.0, 3.0], [6.0, 5.5]]
+    # 0..1 + 1.2..1.4 + 1.5..3.0 are <= 0.3 s apart -> one turn; 4..5 stays apart;
+    # the empty and inverted rows are dropped; input order does not matter.
+    assert db.merge_speech_regions(rows) == [(0.0, 3.0), (4.0, 5.0)]
+    assert db.merge_speech_regions([[0.0, 2.0], [0.5, 1.0]]) == [(0.0, 2.0)]  # contained
+    assert db.merge_speech_regions([[0.0, 1.0], [1.2, 2.0]], max_gap=0.1) == [(0.0, 1.0), (1.2, 2.0)]
+    assert db.merge_speech_regions([]) == []
+
+
+def test_merged_regions_need_fewer_windows_than_breath_split_fragments():
+    from media_studio.features import diarize_backend as db
+
+    # One 6 s turn split by four 0.2 s breaths: five clipped tails vs one slide.
+    rows = [(i * 1.2, i * 1.2 + 1.0) for i in range(5)]
+    assert len(db.sliding_windows(rows)) == 5
+    assert db.sliding_windows(db.merge_speech_regions(rows)) == [(0.0, 2.5), (1.25, 3.75), (2.5, 5.0), (3.75, 5.8)]
+
+
+def test_window_sample_spans_clip_to_the_waveform_and_drop_empty_slices():
+    from media_studio.features import diarize_backend as db
+
+    windows = [(0.0, 2.5), (1.25, 3.75), (9.9, 10.5), (12.0, 13.0)]
+    spans = db.window_sample_spans(windows, 16000, 160_000)  # a 10 s waveform
+    assert spans == [
+        (0.0, 2.5, 0, 40_000),
+        (1.25, 3.75, 20_000, 60_000),
+        (9.9, 10.5, 158_400, 160_000),  # clipped to the waveform end
+    ]  # 12..13 s lies past the end -> dropped
+
+
+def test_embedding_batches_bucket_by_length_and_cover_every_span():
+    from media_studio.features import diarize_backend as db
+
+    spans = [(0.0, 0.0, 0, 10), (0.0, 0.0, 0, 3), (0.0, 0.0, 0, 10), (0.0, 0.0, 0, 3), (0.0, 0.0, 0, 10)]
+    # Short windows batch together; equal lengths keep their time order.
+    assert db.embedding_batches(spans, batch_size=2) == [[1, 3], [0, 2], [4]]
+    assert db.embedding_batches(spans) == [[1, 3, 0, 2, 4]]
+    assert db.embedding_batches([]) == []
+
+
+def test_embedding_batches_rejects_a_non_positive_batch_size():
+    from media_studio.features import diarize_backend as db
+
+    with pytest.raises(ValueError, match="batch_size"):
+        db.embedding_batches([(0.0, 1.0, 0, 1)], batch_size=0)
+
+
+@pytest.mark.parametrize(
+    ("settings", "device", "expected"),
+    [
+        (None, "cuda", "fp32"),  # default stays fp32 (the tuned threshold's regime)
+        ({"diarizeEmbeddingPrecision": " FP16 "}, "cuda", "fp16"),
+        ({"diarizeEmbeddingPrecision": "fp16"}, "cuda:1", "fp16"),
+        ({"diarizeEmbeddingPrecision": "fp16"}, "cpu", "fp32"),  # no CPU half autocast
+        ({"diarizeEmbeddingPrecision": "bf16"}, "cuda", "fp32"),
+        ({"diarizeEmbeddingPrecision": 16}, "cuda", "fp32"),
+    ],
+)
+def test_embedding_precision(settings, device, expected):
+    from media_studio.features import diarize_backend as db
+
+    assert db.embedding_precision(settings, device) == expected
+
+
+def test_vad_only_backend_factory_builds_without_loading_models():
+    from media_studio.features import diarize_backend as db
+
+    backend = db.vad_only_backend_factory({"device": "cpu"})
+    assert isinstance(backend, db.SpeechBrainVadOnlyDiarizer)
+    assert isinstance(backend, db.SpeechBrainDiarizer)
+
+
 # --------------------------------------------------------------------------- #
 # diarize_backend: FAIL LOUD (typed) when speechbrain is unavailable
 # (v1.2.0 NO-SILENT-FALLBACK — a raw ModuleNotFoundError must NOT escape).
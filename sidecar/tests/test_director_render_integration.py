@@ -15,8 +15,8 @@ clip, two ops) so it adds only a couple of seconds to the suite.
 
 from __future__ import annotations
 
-import shutil
 import subprocess
+from collections.abc import Callable
 from pathlib import Path
 
 import pytest
@@ -26,9 +26,11 @@ from media_studio.features.edit_validate import Understanding, validate_and_reje
 from media_studio.features.project_copy import ProjectCopy
 from media_studio.models.edit_plan import EditOp, EditPlan
 
+from tests._ffmpeg import have_ffmpeg, probe_video_duration
+
 pytestmark = pytest.mark.integration
 
-_HAVE_FFMPEG = shutil.which("ffmpeg") is not None and shutil.which("ffprobe") is not None
+_HAVE_FFMPEG = have_ffmpeg()
 _SKIP = pytest.mark.skipif(not _HAVE_FFMPEG, reason="ffmpeg/ffprobe not installed")
 
 
@@ -72,59 +74,6 @@ _SKIP_DRAWTEXT = pytest.mark.skipif(not _HAVE_DRAWTEXT, reason="ffmpeg drawtext/
 _CUES = [{"index": 1, "start": 0.2, "end": 1.0, "text": "real burn"}]
 
 
-def _make_sample(path: Path, *, seconds: float = 1.5) -> None:
-    """Render a tiny real testsrc clip (video + audio) for the engines to edit."""
-    subprocess.run(  # noqa: S603 - fixed argv, no shell, test-only sample generation
-        [
-            "ffmpeg",
-            "-hide_banner",
-            "-loglevel",
-            "error",
-            "-y",
-            "-f",
-            "lavfi",
-            "-i",
-            f"testsrc=size=320x240:rate=15:duration={seconds}",
-            "-f",
-            "lavfi",
-            "-i",
-            f"sine=frequency=440:duration={seconds}",
-            "-shortest",
-            "-c:v",
-            "libx264",
-            "-c:a",
-            "aac",
-            "-t",
-            str(seconds),
-            str(path),
-        ],
-        check=True,
-        capture_output=True,
-    )
-
-
-def _ffprobe_ok(path: Path) -> float:
-    """Return the playable duration of ``path`` (a ffprobe-valid mp4 with video)."""
-    out = subprocess.run(  # noqa: S603 - fixed argv, no shell
-        [
-            "ffprobe",
-            "-v",
-            "error",
-            "-select_streams",
-            "v:0",
-            "-show_entries",
-            "format=duration",
-            "-of",
-            "csv=p=0",
-            str(path),
-        ],
-        check=True,
-        capture_output=True,
-        text=True,
-    ).stdout.strip()
-    return float(out)
-
-
 def _dims(path: Path) -> tuple[int, int]:
     """Return the (width, height) of ``path``'s first video stream."""
     out = subprocess.run(  # noqa: S603 - fixed argv, no shell
@@ -158,12 +107,10 @@ def _project_copy(tmp_path: Path, src: Path, *, tracks: list | None = None) -> P
 
 
 @pytest.fixture(scope="module")
-def sample(tmp_path_factory: pytest.TempPathFactory) -> Path:
+def sample(tmp_path_factory: pytest.TempPathFactory, sample_clip_factory: Callable[..., Path]) -> Path:
     if not _HAVE_FFMPEG:  # pragma: no cover - skipped wholesale when ffmpeg absent
         pytest.skip("ffmpeg not installed")
-    path = tmp_path_factory.mktemp("director-sample") / "sample.mp4"
-    _make_sample(path)
-    return path
+    return sample_clip_factory(tmp_path_factory.mktemp("director-sample") / "sample.mp4")
 
 
 @_SKIP
@@ -178,9 +125,9 @@ def test_trim_renders_real_valid_mp4_and_undo_round_trips(sample: Path, tmp_path
     assert result.ops_status[0].status == "applied"  # NOT failed (the old bug)
     rendered = Path(pc.data["video"]["path"])
     assert rendered != Path(source_before)  # re-pointed at a NEW file
-    assert _ffprobe_ok(rendered) > 0  # a real, playable edited mp4
+    assert probe_video_duration(rendered) > 0  # a real, playable edited mp4
     # The source clip was never mutated (apply writes only the COPY).
-    assert _ffprobe_ok(Path(source_before)) > 0
+    assert probe_video_duration(Path(source_before)) > 0
 
     # undo: re-apply the recorded inverse -> the COPY points back at the source.
     undo = apply_plan(result.inverse_plan, project_copy=pc, engines=engines)
@@ -200,7 +147,7 @@ def test_caption_burns_real_subtitles(sample: Path, tmp_path: Path) -> None:
     assert result.ops_status[0].status == "applied"
     burned = Path(pc.data["video"]["path"])
     assert burned != Path(source_before)
-    assert _ffprobe_ok(burned) > 0  # ffprobe-valid burned-in mp4
+    assert probe_video_duration(burned) > 0  # ffprobe-valid burned-in mp4
 
     undo = apply_plan(result.inverse_plan, project_copy=pc, engines=engines)
     assert undo.ops_status[0].status == "applied"
@@ -226,7 +173,7 @@ def test_reframe_renders_real_target_dimensions(sample: Path, tmp_path: Path) ->
     rendered = Path(pc.data["video"]["path"])
     assert rendered != Path(source_before)
     assert _dims(rendered) == (1080, 1920)  # NON-no-op: vertical target dims
-    assert _ffprobe_ok(rendered) > 0
+    assert probe_video_duration(rendered) > 0
 
     undo = apply_plan(result.inverse_plan, project_copy=pc, engines=engines)
     assert undo.ops_status[0].status == "applied"
@@ -237,7 +184,7 @@ def test_reframe_renders_real_target_dimensions(sample: Path, tmp_path: Path) ->
 def test_retime_renders_shorter_duration(sample: Path, tmp_path: Path) -> None:
     pc = _project_copy(tmp_path, sample)
     source_before = pc.data["video"]["path"]
-    src_dur = _ffprobe_ok(Path(source_before))
+    src_dur = probe_video_duration(Path(source_before))
     op = EditOp(id="rt1", kind="retime", span=(0, 1500), params={"factor": 2.0})
 
     result, engines = _apply_one(pc, op)
@@ -246,7 +193,7 @@ def test_retime_renders_shorter_duration(sample: Path, tmp_path: Path) -> None:
     rendered = Path(pc.data["video"]["path"])
     assert rendered != Path(source_before)
     # 2x speed-up -> roughly half the duration (NON-no-op): clearly shorter.
-    assert _ffprobe_ok(rendered) < src_dur * 0.75
+    assert probe_video_duration(rendered) < src_dur * 0.75
 
     undo = apply_plan(result.inverse_plan, project_copy=pc, engines=engines)
     assert undo.ops_status[0].status == "applied"
@@ -257,7 +204,7 @@ def test_retime_renders_shorter_duration(sample: Path, tmp_path: Path) -> None:
 def test_remove_fillers_renders_shorter_duration(sample: Path, tmp_path: Path) -> None:
     pc = _project_copy(tmp_path, sample)
     source_before = pc.data["video"]["path"]
-    src_dur = _ffprobe_ok(Path(source_before))
+    src_dur = probe_video_duration(Path(source_before))
     # Excise the middle 0.5s of the 1.5s clip.
     op = EditOp(id="rmf1", kind="removeFillers", span=(500, 1000))
 
@@ -266,7 +213,7 @@ def test_remove_fillers_renders_shorter_duration(sample: Path, tmp_path: Path) -
     assert result.ops_status[0].status == "applied"
     rendered = Path(pc.data["video"]["path"])
     assert rendered != Path(source_before)
-    assert _ffprobe_ok(rendered) < src_dur  # NON-no-op: a span was cut out
+    assert probe_video_duration(rendered) < src_dur  # NON-no-op: a span was cut out
 
     undo = apply_plan(result.inverse_plan, project_copy=pc, engines=engines)
     assert undo.ops_status[0].status == "applied"
@@ -284,7 +231,7 @@ def test_zoom_pan_renders_valid_motion(sample: Path, tmp_path: Path) -> None:
     assert result.ops_status[0].status == "applied"
     rendered = Path(pc.data["video"]["path"])
     assert rendered != Path(source_before)
-    assert _ffprobe_ok(rendered) > 0  # ffprobe-valid re-rasterised mp4
+    assert probe_video_duration(rendered) > 0  # ffprobe-valid re-rasterised mp4
 
     undo = apply_plan(result.inverse_plan, project_copy=pc, engines=engines)
     assert undo.ops_status[0].status == "applied"
@@ -303,7 +250,7 @@ def test_drawtext_ops_render_valid_mp4(kind: str, sample: Path, tmp_path: Path)
     assert result.ops_status[0].status == "applied"
     rendered = Path(pc.data["video"]["path"])
     assert rendered != Path(source_before)
-    assert _ffprobe_ok(rendered) > 0  # ffprobe-valid drawtext-burned mp4
+    assert probe_video_duration(rendered) > 0  # ffprobe-valid drawtext-burned mp4
 
     undo = apply_plan(result.inverse_plan, project_copy=pc, engines=engines)
     assert undo.ops_status[0].status == "applied"
@@ -334,7 +281,7 @@ def test_drawtext_op_survives_validation_then_applies(kind: str, sample: Path, t
     assert result.ops_status[0].status == "applied"  # rendered, not a no-op
     rendered = Path(pc.data["video"]["path"])
     assert rendered != Path(source_before)
-    assert _ffprobe_ok(rendered) > 0
+    assert probe_video_duration(rendered) > 0
 
     undo = apply_plan(result.inverse_plan, project_copy=pc, engines=engines)
     assert undo.ops_status[0].status == "applied"
@@ -353,7 +300,7 @@ def test_translate_caption_burns_translated_track(sample: Path, tmp_path: Path)
     assert result.ops_status[0].status == "applied"
     rendered = Path(pc.data["video"]["path"])
     assert rendered != Path(source_before)
-    assert _ffprobe_ok(rendered) > 0
+    assert probe_video_duration(rendered) > 0
 
     undo = apply_plan(result.inverse_plan, project_copy=pc, engines=engines)
     assert undo.ops_status[0].status == "applied"
@@ -371,7 +318,7 @@ def test_export_renders_valid_delivery_mp4(sample: Path, tmp_path: Path) -> None
     assert result.ops_status[0].status == "applied"
     rendered = Path(pc.data["video"]["path"])
     assert rendered != Path(source_before)
-    assert _ffprobe_ok(rendered) > 0  # ffprobe-valid re-encoded delivery
+    assert probe_video_duration(rendered) > 0  # ffprobe-valid re-encoded delivery
 
     undo = apply_plan(result.inverse_plan, project_copy=pc, engines=engines)
     assert undo.ops_status[0].status == "applied"
@@ -395,4 +342,4 @@ def test_deferred_kinds_degrade_gracefully(kind: str, sample: Path, tmp_path: Pa
     assert "no engine for kind" in (result.ops_status[0].status_reason or "")
     # Source untouched + COPY still points at the original (rolled back).
     assert Path(pc.data["video"]["path"]) == Path(source_before)
-    assert _ffprobe_ok(Path(source_before)) > 0
+    assert probe_video_duration(Path(source_before)) > 0
@@ -178,6 +178,26 @@ def test_mmr_k_clamped_above_n() -> None:
     assert sorted(chosen) == [0, 1, 2]
 
 
+def test_mmr_matches_the_per_item_reference_loop() -> None:
+    rng = np.random.default_rng(3)
+    rel = rng.uniform(0.0, 1.0, 40)
+    emb = rng.normal(size=(40, 6))
+    sim = diversity.cosine_kernel(emb)  # includes negative similarities
+    # Oracle: the textbook per-item scan (first best wins on ties).
+    expected: list[int] = []
+    for _ in range(12):
+        best, best_score = -1, -np.inf
+        for i in range(40):
+            if i in expected:
+                continue
+            penalty = max((sim[i, j] for j in expected), default=0.0)
+            score = 0.6 * rel[i] - 0.4 * penalty
+            if score > best_score:
+                best, best_score = i, score
+        expected.append(best)
+    assert mmr_select(rel, sim, k=12, lambda_=0.6) == expected
+
+
 def test_mmr_rejects_mismatched_similarity_shape() -> None:
     with pytest.raises(ValueError, match="similarity must be"):
         mmr_select([0.1, 0.2, 0.3], np.eye(2), k=1)
@@ -28,8 +28,6 @@ Run: ``python -m pytest sidecar/tests/test_e2e_ai2_director_text_consent.py``.
 
 from __future__ import annotations
 
-import shutil
-import subprocess
 from pathlib import Path
 from typing import Any
 
@@ -40,10 +38,10 @@ from media_studio.handlers import Services
 from media_studio.jobs import JobRegistry
 from media_studio.protocol import RpcContext
 
+from tests._ffmpeg import ffmpeg_paths, make_landscape_mp4
 from tests.e2e_ai2_mock_model import MockModelServer
 
-_FFMPEG = shutil.which("ffmpeg")
-_FFPROBE = shutil.which("ffprobe")
+_FFMPEG, _FFPROBE = ffmpeg_paths()
 pytestmark = pytest.mark.skipif(
     not (_FFMPEG and _FFPROBE),
     reason="ffmpeg/ffprobe required for the E2E director TEXT-consent real-media flow",
@@ -82,40 +80,6 @@ class Rpc:
         return done[-1][2]
 
 
-# --------------------------------------------------------------------------- #
-# real-media fixture (real ffmpeg)
-# --------------------------------------------------------------------------- #
-def _make_sample_mp4(path: Path, *, seconds: int = 6) -> None:
-    """A real 16:9 1280x720 mp4: moving testsrc + a tone (ffprobe-valid)."""
-    res = subprocess.run(
-        [
-            _FFMPEG,
-            "-y",
-            "-loglevel",
-            "error",
-            "-f",
-            "lavfi",
-            "-i",
-            f"testsrc=size=1280x720:rate=24:duration={seconds}",
-            "-f",
-            "lavfi",
-            "-i",
-            f"sine=frequency=440:duration={seconds}",
-            "-c:v",
-            "libx264",
-            "-pix_fmt",
-            "yuv420p",
-            "-c:a",
-            "aac",
-            "-shortest",
-            str(path),
-        ],
-        capture_output=True,
-        text=True,
-    )
-    assert res.returncode == 0, f"ffmpeg failed: {res.stderr}"
-
-
 # --------------------------------------------------------------------------- #
 # settings + project helpers
 # --------------------------------------------------------------------------- #
@@ -196,7 +160,7 @@ def test_director_plan_refuses_when_text_consent_revoked(tmp_path: Path) -> None
     endpoint is never reached.
     """
     media = tmp_path / "talk.mp4"
-    _make_sample_mp4(media)
+    make_landscape_mp4(media)
     with MockModelServer() as server:
         svc, rpc = _wire(tmp_path)
         rpc.call("providers.upsert", {"provider": _provider_entry(server.base_url)})
@@ -224,7 +188,7 @@ def test_director_plan_never_egresses_to_a_non_consented_provider_in_a_mixed_poo
     built, so the transcript can only ever reach the consented provider.
     """
     media = tmp_path / "talk.mp4"
-    _make_sample_mp4(media)
+    make_landscape_mp4(media)
     with MockModelServer() as no_srv, MockModelServer() as yes_srv:
         svc, rpc = _wire(tmp_path)
         rpc.call("providers.upsert", {"provider": _provider_entry(no_srv.base_url, pid="no")})
@@ -270,7 +234,7 @@ def test_director_plan_egresses_when_text_consent_granted(tmp_path: Path) -> Non
     egress carries the RAW key (the get_raw() factory contract).
     """
     media = tmp_path / "talk.mp4"
-    _make_sample_mp4(media)
+    make_landscape_mp4(media)
     with MockModelServer() as server:
         svc, rpc = _wire(tmp_path)
         rpc.call("providers.upsert", {"provider": _provider_entry(server.base_url)})
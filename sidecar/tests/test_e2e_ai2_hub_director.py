@@ -45,7 +45,6 @@ Run: ``python -m pytest sidecar/tests/test_e2e_ai2_hub_director.py``.
 from __future__ import annotations
 
 import json
-import shutil
 import subprocess
 from pathlib import Path
 from typing import Any
@@ -61,10 +60,10 @@ from media_studio.models.provider import RotationEvent
 from media_studio.protocol import RpcContext
 from media_studio.settings_store import INJECTED_KEYS_FIELD
 
+from tests._ffmpeg import ffmpeg_paths, make_landscape_mp4, run_ffmpeg
 from tests.e2e_ai2_mock_model import Always429Server, MockModelServer
 
-_FFMPEG = shutil.which("ffmpeg")
-_FFPROBE = shutil.which("ffprobe")
+_FFMPEG, _FFPROBE = ffmpeg_paths()
 # OPT-IN: tagged ``e2e`` so the default sidecar gate (addopts ``-m 'not e2e'``)
 # DESELECTS this whole module (never collected/run by the 100%-coverage gate);
 # the skipif still guards the explicit ``pytest -m e2e`` run when ffmpeg is absent.
@@ -149,35 +148,6 @@ class Rpc:
 # --------------------------------------------------------------------------- #
 # real-media fixtures (real ffmpeg) + ffprobe helpers
 # --------------------------------------------------------------------------- #
-def _ffmpeg(args: list[str]) -> None:
-    res = subprocess.run([_FFMPEG, "-y", "-loglevel", "error", *args], capture_output=True, text=True)
-    assert res.returncode == 0, f"ffmpeg failed: {res.stderr}"
-
-
-def _make_sample_mp4(path: Path, *, seconds: int = 6) -> None:
-    """A real 16:9 1280x720 mp4: moving testsrc + a tone (ffprobe-valid)."""
-    _ffmpeg(
-        [
-            "-f",
-            "lavfi",
-            "-i",
-            f"testsrc=size=1280x720:rate=24:duration={seconds}",
-            "-f",
-            "lavfi",
-            "-i",
-            f"sine=frequency=440:duration={seconds}",
-            "-c:v",
-            "libx264",
-            "-pix_fmt",
-            "yuv420p",
-            "-c:a",
-            "aac",
-            "-shortest",
-            str(path),
-        ]
-    )
-
-
 def _ffprobe_ok(path: str) -> tuple[int, float]:
     """Return (video_width, duration_sec) — raises if the file is not a valid mp4."""
     res = subprocess.run(
@@ -342,7 +312,7 @@ def test_hub_planjob_is_pure_zero_egress(tmp_path: Path) -> None:
 # ========================================================================== #
 def test_hub_real_http_chat_uses_raw_key_correct_shape(tmp_path: Path) -> None:
     media = tmp_path / "talk.mp4"
-    _make_sample_mp4(media)
+    make_landscape_mp4(media)
     with MockModelServer() as server:
         svc, rpc = _wire(tmp_path)
         rpc.call("providers.upsert", {"provider": _provider_entry(server.base_url)})
@@ -373,7 +343,7 @@ def test_hub_real_http_chat_uses_raw_key_correct_shape(tmp_path: Path) -> None:
 # ========================================================================== #
 def test_hub_select_route_uses_raw_key(tmp_path: Path) -> None:
     media = tmp_path / "clip.mp4"
-    _make_sample_mp4(media)
+    make_landscape_mp4(media)
     # Inject the phase8 signal runner (the SANCTIONED test seam — the heavy
     # cv2/torch compute carries its own # pragma: no cover; tests inject a fake).
     # Empty tracks -> select_unified still runs the REAL transcript+LLM candidate
@@ -406,7 +376,7 @@ def test_hub_select_route_uses_raw_key(tmp_path: Path) -> None:
 # ========================================================================== #
 def test_hub_rotation_on_real_429(tmp_path: Path) -> None:
     media = tmp_path / "talk.mp4"
-    _make_sample_mp4(media)
+    make_landscape_mp4(media)
     with Always429Server() as bad, MockModelServer() as good:
         svc, rpc = _wire(tmp_path)
         # provider order matters: the 429 server is FIRST, the working mock SECOND.
@@ -493,7 +463,7 @@ def test_hub_usage_updates_after_real_egress(tmp_path: Path) -> None:
 # ========================================================================== #
 def test_director_preview_cost_is_pure(tmp_path: Path) -> None:
     media = tmp_path / "talk.mp4"
-    _make_sample_mp4(media)
+    make_landscape_mp4(media)
     with MockModelServer() as server:
         svc, rpc = _wire(tmp_path)
         rpc.call("providers.upsert", {"provider": _provider_entry(server.base_url)})
@@ -519,7 +489,7 @@ def test_director_preview_cost_is_pure(tmp_path: Path) -> None:
 # ========================================================================== #
 def test_hub_text_consent_gate_blocks_egress(tmp_path: Path) -> None:
     media = tmp_path / "talk.mp4"
-    _make_sample_mp4(media)
+    make_landscape_mp4(media)
     with MockModelServer() as server:
         svc, rpc = _wire(tmp_path)
         rpc.call("providers.upsert", {"provider": _provider_entry(server.base_url)})
@@ -563,7 +533,7 @@ def test_hub_director_chat_path_honors_text_consent(tmp_path: Path) -> None:
     reaching a non-consented cloud target — ZERO bytes leave the machine.
     """
     media = tmp_path / "talk.mp4"
-    _make_sample_mp4(media)
+    make_landscape_mp4(media)
     with MockModelServer() as server:
         svc, rpc = _wire(tmp_path)
         rpc.call("providers.upsert", {"provider": _provider_entry(server.base_url)})
@@ -590,7 +560,7 @@ def test_hub_director_chat_path_honors_text_consent(tmp_path: Path) -> None:
 
 def test_hub_budget_gate_refuses_unacked_cloud_run(tmp_path: Path) -> None:
     media = tmp_path / "talk.mp4"
-    _make_sample_mp4(media)
+    make_landscape_mp4(media)
     with MockModelServer() as server:
         svc, rpc = _wire(tmp_path)
         rpc.call("providers.upsert", {"provider": _provider_entry(server.base_url)})
@@ -636,7 +606,7 @@ def test_hub_budget_ack_token_admits_gated_run(tmp_path: Path) -> None:
     passing it as ``confirmBudget`` with the gate ARMED admits the run.
     """
     media = tmp_path / "talk.mp4"
-    _make_sample_mp4(media)
+    make_landscape_mp4(media)
     with MockModelServer() as server:
         svc, rpc = _wire(tmp_path)
         rpc.call("providers.upsert", {"provider": _provider_entry(server.base_url)})
@@ -680,7 +650,7 @@ def test_director_apply_default_engine_table_wires_real_engines(tmp_path: Path)
     media = tmp_path / "talk.mp4"
     # A 10s clip so the plan's trim span [2000,8000] passes the real validator (a
     # 6s clip would drop it) — exercising BOTH wired ops through the default table.
-    _make_sample_mp4(media, seconds=10)
+    make_landscape_mp4(media, seconds=10)
     with MockModelServer() as server:
         svc, rpc = _wire(tmp_path)
         rpc.call("providers.upsert", {"provider": _provider_entry(server.base_url)})
@@ -747,7 +717,7 @@ def _ffmpeg_render_engine(source_path: str, work_dir: Path) -> Any:
         start_ms, end_ms = op.span or (0, 2000)
         ss = max(0.0, float(start_ms) / 1000.0)
         to = max(ss + 0.5, float(end_ms) / 1000.0)
-        _ffmpeg(
+        run_ffmpeg(
             [
                 "-ss",
                 f"{ss:.3f}",
@@ -784,7 +754,7 @@ def test_director_apply_real_ffmpeg_over_copy_then_undo(tmp_path: Path) -> None:
     # A 10s clip so the mock plan's spans ([0,2000] + [2000,8000]) pass the real
     # validator (which drops span-exceeds-clip ops). The trackless caption op is
     # correctly DROPPED by validate_and_reject (unknown-track) — so 2 ops apply.
-    _make_sample_mp4(media, seconds=10)
+    make_landscape_mp4(media, seconds=10)
     source_bytes_before = media.read_bytes()
     work = tmp_path / "renders"
     work.mkdir()
@@ -18,7 +18,6 @@ Run: ``python -m pytest sidecar/tests/test_e2e_ai2_intel_repurpose.py``.
 from __future__ import annotations
 
 import json
-import shutil
 import subprocess
 from pathlib import Path
 from typing import Any
@@ -31,10 +30,10 @@ from media_studio.jobs import JobRegistry
 from media_studio.protocol import RpcContext
 from media_studio.settings_store import INJECTED_KEYS_FIELD
 
+from tests._ffmpeg import ffmpeg_paths, make_landscape_mp4, run_ffmpeg
 from tests.e2e_ai2_mock_model import MockModelServer
 
-_FFMPEG = shutil.which("ffmpeg")
-_FFPROBE = shutil.which("ffprobe")
+_FFMPEG, _FFPROBE = ffmpeg_paths()
 # OPT-IN: tagged ``e2e`` so the default sidecar gate (addopts ``-m 'not e2e'``)
 # DESELECTS this whole module (never collected/run by the 100%-coverage gate);
 # the skipif still guards the explicit ``pytest -m e2e`` run when ffmpeg is absent.
@@ -117,38 +116,9 @@ class Rpc:
 # --------------------------------------------------------------------------- #
 # real-media fixtures (built with real ffmpeg)
 # --------------------------------------------------------------------------- #
-def _ffmpeg(args: list[str]) -> None:
-    res = subprocess.run([_FFMPEG, "-y", "-loglevel", "error", *args], capture_output=True, text=True)
-    assert res.returncode == 0, f"ffmpeg failed: {res.stderr}"
-
-
-def _make_landscape_clip(path: Path, *, seconds: int = 6) -> None:
-    """A real 16:9 1280x720 clip: moving testsrc video + a tone, so ffprobe is happy."""
-    _ffmpeg(
-        [
-            "-f",
-            "lavfi",
-            "-i",
-            f"testsrc=size=1280x720:rate=24:duration={seconds}",
-            "-f",
-            "lavfi",
-            "-i",
-            f"sine=frequency=440:duration={seconds}",
-            "-c:v",
-            "libx264",
-            "-pix_fmt",
-            "yuv420p",
-            "-c:a",
-            "aac",
-            "-shortest",
-            str(path),
-        ]
-    )
-
-
 def _make_audio_with_silence(path: Path) -> None:
     """Real audio: tone -> silence -> tone, so silencedetect finds a real gap."""
-    _ffmpeg(
+    run_ffmpeg(
         [
             "-f",
             "lavfi",
@@ -333,7 +303,7 @@ def test_intel_semantic_positive_control_real_embedder_over_http(tmp_path: Path)
     from media_studio.models import embedder as _embedder
 
     media = tmp_path / "talk.mp4"
-    _make_landscape_clip(media)
+    make_landscape_mp4(media)
     with MockModelServer() as server:
         real_embedder = _embedder.CloudEmbedder(
             api_key="sk-e2e-ai2-mock-key",
@@ -378,7 +348,7 @@ def test_intel_semantic_settings_driven_egress_over_http(tmp_path: Path) -> None
     real client path egresses correctly when the key is injected as in production.
     """
     media = tmp_path / "talk.mp4"
-    _make_landscape_clip(media)
+    make_landscape_mp4(media)
     with MockModelServer() as server:
         svc = _new_services(tmp_path)
         protocol.clear_methods()
@@ -407,7 +377,7 @@ def test_intel_semantic_settings_driven_egress_over_http(tmp_path: Path) -> None
 # ========================================================================== #
 def test_intel_director_plan_real_chat_editplan_over_http(tmp_path: Path) -> None:
     media = tmp_path / "talk.mp4"
-    _make_landscape_clip(media)
+    make_landscape_mp4(media)
     with MockModelServer() as server:
         svc = _new_services(tmp_path)
         protocol.clear_methods()
@@ -456,7 +426,7 @@ def test_intel_recommender_real_device_detect(tmp_path: Path) -> None:
 # ========================================================================== #
 def test_intel_bestframe_thumbnail_real_jpg(tmp_path: Path) -> None:
     media = tmp_path / "clip.mp4"
-    _make_landscape_clip(media)
+    make_landscape_mp4(media)
     clip_path = str(media)
 
     # Frame markers ARE timestamps (seconds). The loader returns one stack of
@@ -475,7 +445,7 @@ def test_intel_bestframe_thumbnail_real_jpg(tmp_path: Path) -> None:
 
     def thumbnail_writer(frame: Any, out_path: str) -> None:
         ts = float(frame)
-        _ffmpeg(["-ss", f"{ts:.3f}", "-i", clip_path, "-frames:v", "1", "-q:v", "2", out_path])
+        run_ffmpeg(["-ss", f"{ts:.3f}", "-i", clip_path, "-frames:v", "1", "-q:v", "2", out_path])
 
     with MockModelServer() as server:
         svc = _new_services(
@@ -509,7 +479,7 @@ def test_intel_bestframe_thumbnail_real_jpg(tmp_path: Path) -> None:
 # ========================================================================== #
 def test_repurpose_batch_two_platform_presets(tmp_path: Path) -> None:
     media = tmp_path / "source.mp4"
-    _make_landscape_clip(media)
+    make_landscape_mp4(media)
     svc = _new_services(tmp_path)
     protocol.clear_methods()
     handlers.register_all(services=svc)
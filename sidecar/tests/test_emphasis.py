@@ -97,6 +97,13 @@ def test_pick_emoji_whole_word_only() -> None:
     assert em.pick_emoji("a firefly flew by") == ""
 
 
+def test_pick_emoji_is_case_insensitive_across_punctuation() -> None:
+    assert em.pick_emoji("That was FIRE!") == em.EMOJI_MAP[0][1]
+    assert em.pick_emoji("pure-money talk") == em.EMOJI_MAP[1][1]
+    # ``_`` is a word character, so "fire_ant" is one word, not the "fire" stem.
+    assert em.pick_emoji("a fire_ant") == ""
+
+
 def test_pick_emoji_none() -> None:
     assert em.pick_emoji("nothing special here") == ""
     assert em.pick_emoji("") == ""
@@ -24,6 +24,7 @@ from __future__ import annotations
 
 import subprocess
 import sys
+from collections.abc import Iterator
 from pathlib import Path
 from typing import Any
 
@@ -248,6 +249,41 @@ def test_missing_encoders_returns_sorted_output(tmp_path: Path):
     assert missing == ("aaa", "zzz")
 
 
+# --------------------------------------------------------------------------- #
+# hardware_h264_encoder -- the opt-in hardware encode
+# --------------------------------------------------------------------------- #
+NVENC_ENCODERS = GPL_ENCODERS + " V....D h264_nvenc           NVIDIA NVENC H.264 encoder (codec h264)\n"
+
+
+@pytest.fixture()
+def hw_exe(tmp_path: Path) -> Iterator[Path]:
+    encoders.clear_hardware_cache()
+    exe = tmp_path / f"ffmpeg{encoders_exe_suffix()}"
+    exe.write_text("stub")
+    yield exe
+    encoders.clear_hardware_cache()
+
+
+def test_hardware_encoder_is_off_unless_opted_in(hw_exe: Path):
+    run = _runner(stdout=NVENC_ENCODERS)
+    assert encoders.hardware_video_args({"ffmpegPath": str(hw_exe)}, probe_runner=run) is None
+    assert run.calls == []
+
+
+def test_hardware_encoder_picks_a_listed_encoder_and_probes_once(hw_exe: Path):
+    run = _runner(stdout=NVENC_ENCODERS)
+    settings = {"ffmpegPath": str(hw_exe), encoders.HARDWARE_ENCODE_KEY: True}
+    args = encoders.hardware_video_args(settings, probe_runner=run)
+    assert args is not None and args[:2] == ["-c:v", "h264_nvenc"]
+    assert encoders.hardware_h264_encoder(settings, probe_runner=run) == "h264_nvenc"
+    assert len(run.calls) == 1
+
+
+def test_hardware_encoder_falls_back_when_none_is_listed(hw_exe: Path):
+    settings = {"ffmpegPath": str(hw_exe), encoders.HARDWARE_ENCODE_KEY: True}
+    assert encoders.hardware_video_args(settings, probe_runner=_runner(stdout=GPL_ENCODERS)) is None
+
+
 # --------------------------------------------------------------------------- #
 # REQUIRED_ENCODERS <-> the real source tree (anti-drift)
 # --------------------------------------------------------------------------- #
@@ -60,6 +60,25 @@ def test_resolve_falls_back_to_path(monkeypatch):
     assert got == "/usr/bin/ffmpeg"
 
 
+def test_resolve_reuses_the_path_lookup_while_the_binary_exists(monkeypatch, tmp_path):
+    exe = tmp_path / "ffmpeg"
+    exe.write_text("")
+    calls: list[str] = []
+
+    def which(name):
+        calls.append(name)
+        return str(exe)
+
+    monkeypatch.delenv("MEDIA_STUDIO_FFMPEG", raising=False)
+    monkeypatch.setattr(ffmpeg.shutil, "which", which)
+    monkeypatch.setattr(ffmpeg, "_BUNDLED_DIR", Path("/nonexistent/bin"))
+    assert ffmpeg.resolve_binary("ffmpeg", {}) == ffmpeg.resolve_binary("ffmpeg", {}) == str(exe)
+    assert calls == ["ffmpeg"]
+    exe.unlink()  # a vanished binary is looked up afresh, not served stale
+    ffmpeg.resolve_binary("ffmpeg", {})
+    assert calls == ["ffmpeg", "ffmpeg"]
+
+
 def test_resolve_raises_when_nothing_found(monkeypatch):
     monkeypatch.delenv("MEDIA_STUDIO_FFMPEG", raising=False)
     monkeypatch.setattr(ffmpeg.shutil, "which", lambda name: None)
@@ -140,6 +159,16 @@ def test_build_convert_argv_omits_absent_options(bins):
     assert "-crf" not in argv
     assert "-vf" not in argv
     assert "-r" not in argv
+    assert "-threads" not in argv and "-filter_threads" not in argv
+
+
+def test_build_convert_argv_caps_threads_when_asked(bins):
+    argv = ffmpeg.build_convert_argv("/in.mp4", "/out.mp4", {"vcodec": "libx264"}, bins, threads=3)
+    # -filter_threads is global (before the input); -threads applies to the output encoder
+    assert argv.index("-filter_threads") < argv.index("-i") < argv.index("-threads")
+    assert argv[argv.index("-filter_threads") + 1] == "3"
+    assert argv[argv.index("-threads") + 1] == "3"
+    assert argv[-1] == "/out.mp4"
     assert argv[-1] == "/out.mp4"
 
 
@@ -336,6 +365,48 @@ def test_ffprobe_duration_forwards_a_timeout(bins):
     assert seen.get("timeout") == ffmpeg.PROBE_TIMEOUT_SEC
 
 
+def test_ffprobe_duration_memoizes_an_unchanged_file(bins, tmp_path):
+    ffmpeg.clear_probe_cache()
+    media = tmp_path / "v.mp4"
+    media.write_bytes(b"x")
+    calls = []
+
+    class R:
+        returncode = 0
+        stdout = json.dumps({"format": {"duration": "7.5"}})
+
+    def runner(argv, **kwargs):
+        calls.append(argv)
+        return R()
+
+    assert ffmpeg.ffprobe_duration(str(media), bins, runner=runner) == pytest.approx(7.5)
+    assert ffmpeg.ffprobe_duration(str(media), bins, runner=runner) == pytest.approx(7.5)
+    assert len(calls) == 1
+    media.write_bytes(b"longer")  # size (and mtime) change -> a fresh probe
+    ffmpeg.ffprobe_duration(str(media), bins, runner=runner)
+    assert len(calls) == 2
+    ffmpeg.clear_probe_cache()
+
+
+def test_ffprobe_duration_does_not_memoize_an_unknown_duration(bins, tmp_path):
+    ffmpeg.clear_probe_cache()
+    media = tmp_path / "v.mp4"
+    media.write_bytes(b"x")
+    calls = []
+
+    class R:
+        returncode = 1
+        stdout = ""
+
+    def runner(argv, **kwargs):
+        calls.append(argv)
+        return R()
+
+    assert ffmpeg.ffprobe_duration(str(media), bins, runner=runner) == 0.0
+    assert ffmpeg.ffprobe_duration(str(media), bins, runner=runner) == 0.0
+    assert len(calls) == 2
+
+
 def test_ffprobe_duration_returns_zero_on_timeout(bins):
     # A hung ffprobe (TimeoutExpired) is treated as "duration unknown" -> 0.0,
     # NOT propagated as a crash that would wedge the job thread.
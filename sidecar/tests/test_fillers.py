@@ -200,6 +200,18 @@ def test_malformed_words_are_skipped():
     assert fl.build_cutlist(words, "en") == [(0.0, 1.0)]
 
 
+def test_valid_words_keeps_ordered_input_and_sorts_the_rest():
+    ordered = [w("a", 0.0, 0.5), w("b", 0.5, 0.8), w("c", 0.5, 0.9)]
+    assert fl._valid_words(ordered) == ordered
+    shuffled = [ordered[2], ordered[0], ordered[1]]
+    assert fl._valid_words(shuffled) == ordered
+    # A dropped word never counts toward the order check.
+    assert fl._valid_words([w("a", 0.0, 0.5), {"text": "x"}, w("b", 0.6, 1.0)]) == [
+        w("a", 0.0, 0.5),
+        w("b", 0.6, 1.0),
+    ]
+
+
 # ---------------------------------------------------------------------------
 # stats
 # ---------------------------------------------------------------------------
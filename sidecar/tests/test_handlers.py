@@ -358,6 +358,47 @@ def test_transcribe_and_persist_rejects_unknown_video(services: Services) -> Non
     assert ei.value.code == ErrorCode.INVALID_PARAMS
 
 
+def test_transcribe_and_persist_decodes_once_for_whisper_and_alignment(
+    services: Services, video_file: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """With the alignment pass on, whisper and the aligner share ONE 16 kHz decode."""
+    from media_studio.features import ctc_align
+
+    samples = object()
+    decodes: list[str] = []
+    fed: dict[str, Any] = {}
+
+    def _decode(path: str) -> tuple[Any, int]:
+        decodes.append(path)
+        return samples, 16000
+
+    def _align(transcript: dict[str, Any], audio_path: str, *, audio_loader: Any = None, **_k: Any) -> Any:
+        fed["aligner"] = audio_loader(audio_path)[0]
+        return transcript
+
+    class _Model(FakeWhisperModel):
+        def transcribe(self, audio: Any, **kwargs: Any):
+            fed["whisper"] = audio
+            return super().transcribe(audio, **kwargs)
+
+    class _Loader:
+        def load(self, *_a: Any) -> _Model:
+            return _Model()
+
+    class _Ctx:
+        cancelled = False
+
+        def progress(self, *_a: Any, **_k: Any) -> None: ...
+
+    monkeypatch.setattr(ctc_align, "load_pcm_16k", _decode)
+    monkeypatch.setattr(ctc_align, "align_words", _align)
+    services._whisper_loader = _Loader()
+    vid = _add_video(services, video_file)
+    services._transcribe_and_persist(vid, _Ctx(), align_words=True)
+    assert fed == {"whisper": samples, "aligner": samples}
+    assert len(decodes) == 1
+
+
 # --------------------------------------------------------------------------- #
 # subtitles.* (generate/edit/export direct; translate job)
 # --------------------------------------------------------------------------- #
@@ -507,6 +548,15 @@ def test_diarize_models_present_routes_by_backend(services: Services, monkeypatc
     assert services._diarize_models_present({"diarizeBackend": "pyannote"}) == "pyannote-probe"
 
 
+def test_diarize_models_present_vad_only_probes_just_the_vad(services: Services, monkeypatch) -> None:
+    from media_studio.features import diarize as _diarize
+
+    seen: list[tuple[str, ...]] = []
+    monkeypatch.setattr(_diarize, "default_models_present", lambda s, required=(): seen.append(required) or True)
+    assert services._diarize_models_present({"diarizeBackend": "vad"}) is True
+    assert seen == [_diarize.VAD_ONLY_ASSETS]
+
+
 def test_subtitles_translate_is_a_job_resolving_to_track(services: Services, ctx: RpcContext, video_file: Path) -> None:
     vid = _add_video(services, video_file)
     _transcribe_sync(services, ctx, vid)
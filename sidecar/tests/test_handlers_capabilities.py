@@ -152,6 +152,15 @@ def test_capability_asset_names_are_deduped_and_cover_every_feature() -> None:
     assert len(names) == len(set(names))  # no duplicates
 
 
+def test_capability_asset_names_returns_a_fresh_list_over_the_frozen_set() -> None:
+    # The probe set is frozen at import; mutating one caller's list must never
+    # leak into the next readiness poll.
+    first = cap.capability_asset_names()
+    first.clear()
+    assert cap.capability_asset_names() == list(cap._CAPABILITY_ASSET_NAMES)
+    assert cap.capability_asset_names()
+
+
 # --------------------------------------------------------------------------- #
 # profile_capability_matrix — the per-PROFILE view
 # --------------------------------------------------------------------------- #
@@ -26,8 +26,7 @@ from __future__ import annotations
 
 import ast
 import json
-import shutil
-import subprocess
+from collections.abc import Callable
 from pathlib import Path
 from typing import Any
 
@@ -44,6 +43,8 @@ from media_studio.jobs import JobRegistry
 from media_studio.models.edit_plan import EditOp
 from media_studio.protocol import ErrorCode, RpcContext, RpcError
 
+from tests._ffmpeg import have_ffmpeg, probe_video_duration
+
 # --------------------------------------------------------------------------- #
 # fakes / seams (no heavy imports, no subprocess, no network)
 # --------------------------------------------------------------------------- #
@@ -511,63 +512,17 @@ def test_director_engines_logs_deferred_once(tmp_path: Path, monkeypatch: pytest
 # FIX #7 (real ffmpeg): director.apply RENDERS a real edited mp4 the persisted
 # manifest references, and director.undo round-trips — the full handler spine.
 # --------------------------------------------------------------------------- #
-_HAVE_FFMPEG = shutil.which("ffmpeg") is not None and shutil.which("ffprobe") is not None
-
-
-def _ffprobe_video_duration(path: str) -> float:
-    out = subprocess.run(  # noqa: S603 - fixed argv, no shell, test-only probe
-        [
-            "ffprobe",
-            "-v",
-            "error",
-            "-select_streams",
-            "v:0",
-            "-show_entries",
-            "format=duration",
-            "-of",
-            "csv=p=0",
-            path,
-        ],
-        check=True,
-        capture_output=True,
-        text=True,
-    ).stdout.strip()
-    return float(out)
+_HAVE_FFMPEG = have_ffmpeg()
 
 
 @pytest.mark.integration
 @pytest.mark.skipif(not _HAVE_FFMPEG, reason="ffmpeg/ffprobe not installed")
-def test_director_apply_then_undo_renders_real_media_end_to_end(tmp_path: Path) -> None:
+def test_director_apply_then_undo_renders_real_media_end_to_end(
+    tmp_path: Path, sample_clip_factory: Callable[..., Path]
+) -> None:
     # A REAL 1.5 s sample the director will edit (replaces the placeholder talk.mp4).
     svc = _services(tmp_path, provider=CannedProvider())
-    sample = tmp_path / "talk.mp4"
-    subprocess.run(  # noqa: S603 - fixed argv, no shell, test-only sample render
-        [
-            "ffmpeg",
-            "-hide_banner",
-            "-loglevel",
-            "error",
-            "-y",
-            "-f",
-            "lavfi",
-            "-i",
-            "testsrc=size=320x240:rate=15:duration=1.5",
-            "-f",
-            "lavfi",
-            "-i",
-            "sine=duration=1.5",
-            "-shortest",
-            "-c:v",
-            "libx264",
-            "-c:a",
-            "aac",
-            "-t",
-            "1.5",
-            str(sample),
-        ],
-        check=True,
-        capture_output=True,
-    )
+    sample_clip_factory(tmp_path / "talk.mp4")
     vid = _add_project(svc)  # registers the (now real) talk.mp4
     source_path = svc._load_or_create_project(vid).data["video"]["path"]
 
@@ -587,8 +542,8 @@ def test_director_apply_then_undo_renders_real_media_end_to_end(tmp_path: Path)
     copy_manifest = json.loads(Path(applied["projectCopyPath"]).read_text(encoding="utf-8"))
     edited = copy_manifest["video"]["path"]
     assert edited != source_path
-    assert _ffprobe_video_duration(edited) > 0
-    assert _ffprobe_video_duration(edited) < _ffprobe_video_duration(source_path)  # trim shortened it
+    assert probe_video_duration(edited) > 0
+    assert probe_video_duration(edited) < probe_video_duration(source_path)  # trim shortened it
     # The source manifest was never mutated.
     assert svc._load_or_create_project(vid).data["video"]["path"] == source_path
 
@@ -172,7 +172,8 @@ class TestProbeMedia:
         assert out == {"streams": [], "format": {}}
         argv = seen[0]
         assert argv[-1] == "C:/v/talk.mp4"
-        assert "-show_streams" in argv and "-show_format" in argv
+        assert argv[argv.index("-show_entries") + 1] == mc.PROBE_ENTRIES
+        assert "-show_streams" not in argv and "-show_format" not in argv
         assert "json" in argv
 
     def test_nonzero_exit_yields_empty(self, settings):
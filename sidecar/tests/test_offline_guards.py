@@ -77,7 +77,7 @@ def test_translator_forces_local_pool_when_offline(tmp_path: Path, monkeypatch)
 
     captured: dict[str, Any] = {}
 
-    def spy_get_translator(settings, *, runner=None, prefer=None, ensure=None):
+    def spy_get_translator(settings, *, runner=None, prefer=None, ensure=None, cache=None):
         captured["prefer"] = prefer
         return object()
 
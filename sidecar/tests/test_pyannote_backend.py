@@ -3,15 +3,18 @@
 The LIGHT half (HF-token resolution, asset registration, installed-state probing,
 the backend selector, the pyannote-annotation -> (regions, embeddings) converter)
 is exercised exhaustively with hand-built fakes — no pyannote / torch import, no
-audio, no real HF token. The heavy ``PyannoteDiarizer.detect_and_embed`` is
-``# pragma: no cover`` (it needs the native stack + gated weights); only its
-constructor's token plumbing is asserted via the typed-refusal path on the
-factory, which validates the token BEFORE any heavy import.
+audio, no real HF token. The heavy ``PyannoteDiarizer`` is ``# pragma: no cover``
+(it needs the native stack + gated weights); its constructor's token plumbing is
+asserted via the typed-refusal path on the factory, and ``detect_and_embed`` is
+driven once with a fake ``torchaudio`` and pipeline to pin what the pipeline
+receives (decoded samples on its device, never the path).
 """
 
 from __future__ import annotations
 
+import sys
 from pathlib import Path
+from types import SimpleNamespace
 from typing import Any
 
 import pytest
@@ -91,28 +94,122 @@ class TestRequireHfToken:
 
 
 # --------------------------------------------------------------------------- #
-# regions_and_embeddings (pure converter into the diarize seam shape)
+# collect_tracks (single-pass itertracks stream -> the diarize seam shape)
 # --------------------------------------------------------------------------- #
-class TestRegionsAndEmbeddings:
-    def test_normalizes_spans_and_vectors(self):
-        spans = [{"start": 0.0, "end": 1.5}, {"start": 1.5, "end": 3.0}]
-        embs = [[1, 0], [0, 1]]
-        regions, vecs = pb.regions_and_embeddings(spans, embs)
-        assert regions == [{"start": 0.0, "end": 1.5}, {"start": 1.5, "end": 3.0}]
-        assert vecs == [[1.0, 0.0], [0.0, 1.0]]
+def _track(start: float, end: float, label: str) -> tuple[Any, str, str]:
+    return SimpleNamespace(start=start, end=end), "_", label
+
+
+class TestCollectTracks:
+    def test_streams_rows_with_per_speaker_embeddings(self):
+        tracks = iter([_track(0, 1, "B"), _track(1, 2, "A"), _track(2, 3, "B")])
+        regions, vecs = pb.collect_tracks(tracks, [[1, 0], [0, 1]], total=3)
+        assert regions == [{"start": 0.0, "end": 1.0}, {"start": 1.0, "end": 2.0}, {"start": 2.0, "end": 3.0}]
+        # Speaker rows follow first-appearance order: B -> row 0, A -> row 1.
+        assert vecs == [[1.0, 0.0], [0.0, 1.0], [1.0, 0.0]]
         assert all(isinstance(x, float) for v in vecs for x in v)
 
-    def test_missing_keys_default_to_zero(self):
-        regions, vecs = pb.regions_and_embeddings([{}], [[0.5]])
-        assert regions == [{"start": 0.0, "end": 0.0}]
-        assert vecs == [[0.5]]
+    def test_empty_stream_is_empty(self):
+        assert pb.collect_tracks(iter([]), [], total=0) == ([], [])
+
+    def test_progress_is_clamped_to_total(self):
+        seen: list[tuple[float, str]] = []
+        tracks = [_track(0, 1, "A"), _track(0, 1, "B")]  # two tracks on ONE segment
+        pb.collect_tracks(tracks, [[1.0], [2.0]], total=1, on_progress=lambda p, m: seen.append((p, m)))
+        assert seen == [(80.0, "segment 1/1"), (80.0, "segment 1/1")]
+
+    def test_cancel_keeps_rows_collected_so_far(self):
+        calls = iter([False, True])
+        regions, vecs = pb.collect_tracks(
+            [_track(0, 1, "A"), _track(1, 2, "A")], [[1.0]], total=2, should_cancel=lambda: next(calls)
+        )
+        assert regions == [{"start": 0.0, "end": 1.0}]
+        assert vecs == [[1.0]]
+
+
+# --------------------------------------------------------------------------- #
+# pipeline_batch_sizes (segmentation / embedding inference batches)
+# --------------------------------------------------------------------------- #
+class TestPipelineBatchSizes:
+    def test_defaults_when_unset(self):
+        assert pb.pipeline_batch_sizes(None) == (pb.DEFAULT_BATCH_SIZE, pb.DEFAULT_BATCH_SIZE)
+        assert pb.pipeline_batch_sizes({}) == (32, 32)
+
+    def test_reads_each_key_independently(self):
+        settings = {pb.SEGMENTATION_BATCH_KEY: 128, pb.EMBEDDING_BATCH_KEY: 4}
+        assert pb.pipeline_batch_sizes(settings) == (128, 4)
+
+    @pytest.mark.parametrize(("raw", "expected"), [(0, 1), (-8, 1), (10_000, pb.MAX_BATCH_SIZE)])
+    def test_explicit_values_are_clamped(self, raw: int, expected: int):
+        settings = {pb.SEGMENTATION_BATCH_KEY: raw, pb.EMBEDDING_BATCH_KEY: raw}
+        assert pb.pipeline_batch_sizes(settings) == (expected, expected)
+
+    @pytest.mark.parametrize("bad", [2.5, "64", True, None])
+    def test_invalid_values_keep_the_default(self, bad: Any):
+        settings = {pb.SEGMENTATION_BATCH_KEY: bad, pb.EMBEDDING_BATCH_KEY: bad}
+        assert pb.pipeline_batch_sizes(settings) == (pb.DEFAULT_BATCH_SIZE, pb.DEFAULT_BATCH_SIZE)
+
+
+# --------------------------------------------------------------------------- #
+# in_memory_audio (the pre-decoded pipeline input)
+# --------------------------------------------------------------------------- #
+def test_in_memory_audio_is_the_pyannote_waveform_mapping():
+    waveform = object()
+    audio = pb.in_memory_audio(waveform, 16000)
+    assert audio == {"waveform": waveform, "sample_rate": 16000}
+    assert isinstance(audio["sample_rate"], int)
+
+
+class FakeWaveform:
+    """A decoded ``(channel, time)`` tensor stand-in that records ``.to(device)``."""
+
+    def __init__(self, samples: list[list[float]], device: str = "cpu") -> None:
+        self.samples = samples
+        self.device = device
 
-    def test_empty_is_empty(self):
-        assert pb.regions_and_embeddings([], []) == ([], [])
+    def to(self, device: str) -> FakeWaveform:
+        return FakeWaveform(self.samples, device)
 
-    def test_length_mismatch_raises(self):
-        with pytest.raises(ValueError, match="length mismatch"):
-            pb.regions_and_embeddings([{"start": 0.0, "end": 1.0}], [])
+
+class FakeAnnotation:
+    def __init__(self, tracks: list[tuple[Any, str, str]]) -> None:
+        self._tracks = tracks
+
+    def __len__(self) -> int:
+        return len(self._tracks)
+
+    def itertracks(self, yield_label: bool = False) -> Any:
+        return iter(self._tracks)
+
+
+def test_detect_and_embed_hands_the_pipeline_decoded_samples(monkeypatch):
+    decoded = FakeWaveform([[0.0, 0.25, -0.5]])
+    loaded: list[str] = []
+
+    def fake_load(path: str) -> tuple[FakeWaveform, int]:
+        loaded.append(path)
+        return decoded, 44100
+
+    monkeypatch.setitem(sys.modules, "torchaudio", SimpleNamespace(load=fake_load))
+    received: list[Any] = []
+
+    def fake_pipeline(audio: Any, *, return_embeddings: bool) -> tuple[FakeAnnotation, list[list[float]]]:
+        received.append(audio)
+        return FakeAnnotation([_track(0.0, 1.0, "A")]), [[1.0, 0.0]]
+
+    diarizer = pb.PyannoteDiarizer({}, env={"HF_TOKEN": "hf_test"})
+    monkeypatch.setattr(diarizer, "_ensure_pipeline", lambda: None)
+    diarizer._pipeline = fake_pipeline
+
+    regions, vecs = diarizer.detect_and_embed("/media/clip.wav")
+    assert loaded == ["/media/clip.wav"]  # decoded once, by us
+    [audio] = received
+    assert not isinstance(audio, str)  # never the file path
+    assert set(audio) == {"waveform", "sample_rate"}
+    assert audio["sample_rate"] == 44100
+    assert audio["waveform"].samples == [[0.0, 0.25, -0.5]]
+    assert audio["waveform"] is decoded and decoded.device == "cpu"  # never moved whole to the GPU
+    assert regions == [{"start": 0.0, "end": 1.0}] and vecs == [[1.0, 0.0]]
 
 
 # --------------------------------------------------------------------------- #
@@ -125,6 +222,9 @@ class TestSelectedBackendName:
     def test_pyannote_case_insensitive_and_trimmed(self):
         assert pb.selected_backend_name({"diarizeBackend": "  PyAnnote "}) == pb.PYANNOTE_BACKEND
 
+    def test_vad_selected(self):
+        assert pb.selected_backend_name({"diarizeBackend": " VAD "}) == pb.VAD_BACKEND
+
     def test_default_is_speechbrain(self):
         assert pb.selected_backend_name({}) == pb.SPEECHBRAIN_BACKEND
 
@@ -157,6 +257,22 @@ class TestSelectBackendFactory:
         assert isinstance(backend, FakeBackend)
         assert backend.settings["kind"] == "pyannote"
 
+    def test_vad_selected_uses_injected_factory(self):
+        backend = pb.select_backend_factory(
+            {"diarizeBackend": "vad"},
+            speechbrain_factory=_speechbrain_factory,
+            pyannote_factory=_pyannote_factory,
+            vad_factory=lambda s: FakeBackend({**s, "kind": "vad"}),
+        )
+        assert isinstance(backend, FakeBackend)
+        assert backend.settings["kind"] == "vad"
+
+    def test_vad_default_factory_builds_the_vad_only_diarizer(self):
+        from media_studio.features.diarize_backend import SpeechBrainVadOnlyDiarizer
+
+        backend = pb.select_backend_factory({"diarizeBackend": "vad"}, speechbrain_factory=_speechbrain_factory)
+        assert isinstance(backend, SpeechBrainVadOnlyDiarizer)
+
     def test_pyannote_default_factory_validates_token(self, monkeypatch):
         # No pyannote_factory injected -> real pyannote_backend_factory runs,
         # which builds PyannoteDiarizer, which requires an HF token in env.
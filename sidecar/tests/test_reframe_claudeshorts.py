@@ -344,6 +344,17 @@ def test_build_reframe_argv_one_pass_shape(fake_bins):
     assert "C:\\in\\a clip.mp4" in argv and argv[-1] == "C:\\out\\b clip.mp4"
 
 
+def test_build_reframe_argv_uses_the_opted_in_hardware_encoder(fake_bins, monkeypatch):
+    from media_studio import encoders
+
+    monkeypatch.setattr(encoders, "hardware_video_args", lambda _settings: ["-c:v", "h264_nvenc", "-cq", "19"])
+    crop = {"x": 437, "y": 0, "w": 405, "h": 720}
+    argv = cs.build_reframe_argv("/in.mp4", "/out.mp4", crop, None, "9:16", fake_bins)
+    assert argv[argv.index("-c:v") + 1] == "h264_nvenc"
+    assert "libx264" not in argv and "-crf" not in argv
+    assert argv.index("-hwaccel") < argv.index("-i")
+
+
 def test_build_reframe_argv_keyframed_x(fake_bins):
     crop = {"x": 437, "y": 0, "w": 405, "h": 720}
     kfs = cs.build_keyframes([1.0, 3.0], [100, 300])
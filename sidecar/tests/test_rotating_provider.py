@@ -22,6 +22,8 @@ headers), and that the live key never reaches a log line or an error body.
 from __future__ import annotations
 
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 import pytest
@@ -522,3 +524,47 @@ def test_local_server_provider_still_works_standalone() -> None:
     t = RecordingTransport(_ok("legacy"))
     p = LocalServerProvider(transport=t)
     assert p.chat([{"role": "user", "content": "q"}]) == "legacy"
+
+
+# --------------------------------------------------------------------------- #
+# is_local_provider + sharing one pool across threads
+# --------------------------------------------------------------------------- #
+def test_is_local_provider_only_for_all_local_pools() -> None:
+    backstop = _spec(provider="local", kind="local", keys=[], local=True)
+    assert prov.is_local_provider(LocalServerProvider())
+    assert prov.is_local_provider(_build([backstop], ScriptedTransport({})))
+    assert not prov.is_local_provider(_build([_spec(keys=["k1"]), backstop], ScriptedTransport({})))
+    assert not prov.is_local_provider(None)
+
+
+def test_concurrent_successes_are_all_counted() -> None:
+    rp = _build([_spec(keys=["k1"])], ScriptedTransport({"k1": [_ok()]}))
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(lambda _: rp.chat([{"role": "user", "content": "q"}]), range(200)))
+    assert rp.usage()[0]["used"] == 200
+
+
+def test_llama_backstop_calls_are_serialized() -> None:
+    state = {"active": 0, "peak": 0}
+    lock = threading.Lock()
+
+    def transport(url: str, body: dict[str, Any], headers: dict[str, str], timeout: float) -> dict[str, Any]:
+        with lock:
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+        threading.Event().wait(0.01)
+        with lock:
+            state["active"] -= 1
+        return _ok()
+
+    backstop = _spec(provider=prov.LOCAL_PROVIDER_ID, kind="local", keys=[], local=True)
+    rp = _build([backstop], transport)
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        list(pool.map(lambda _: rp.chat([{"role": "user", "content": "q"}]), range(8)))
+    assert state["peak"] == 1
+
+
+def test_provider_identity_names_every_pool_entry() -> None:
+    rp = _build([_spec(provider="Groq", keys=["k1"], model="a"), _spec(provider="Mistral", keys=["k2"], model="b")], {})
+    assert prov.provider_identity(rp) == ("Groq+Mistral", "a+b")
+    assert prov.provider_identity(LocalServerProvider(model="m")) == (prov.LOCAL_PROVIDER_ID, "m")
@@ -101,6 +101,29 @@ def test_pool_instantaneous_signal_overlaps_when_inside_window():
     assert scorer.pool_signals_for_window(tracks, 2.0, 3.0) == {}
 
 
+def _reference_pool(signals: list[tuple[float, float, float]], start: float, end: float) -> float | None:
+    """The per-Signal overlap-and-mean loop the column pooling replaced (oracle)."""
+    vals = [min(max(v, 0.0), 1.0) for s, e, v in signals if ((s < end and e > start) if e > s else (start <= s < end))]
+    return sum(vals) / len(vals) if vals else None
+
+
+def test_pool_columns_match_per_signal_reference():
+    rng = np.random.default_rng(7)
+    signals = []
+    for _ in range(60):
+        s = float(rng.uniform(0.0, 20.0))
+        e = s if rng.random() < 0.2 else s + float(rng.uniform(-1.0, 3.0))
+        signals.append((s, e, float(rng.uniform(-0.5, 1.5))))
+    tracks = {"motion": _track("motion", signals)}
+    for start in np.arange(0.0, 22.0, 1.5):
+        expected = _reference_pool(signals, float(start), float(start) + 2.0)
+        got = scorer.pool_signals_for_window(tracks, float(start), float(start) + 2.0)
+        if expected is None:
+            assert got == {}
+        else:
+            assert got == {"motion": pytest.approx(expected)}
+
+
 # ---------------------------------------------------------------------------
 # clip_signal_map — restricted to ranker feature columns (no sceneCut)
 # ---------------------------------------------------------------------------
@@ -2798,10 +2798,11 @@ class TestLazyCutStage:
         assert out == "/out.cut.mp4"
         argv = ran["argv"]
         assert argv[0] == "/bin/ffmpeg"
-        # accurate seek: -ss/-to AFTER -i (decode-then-trim).
-        assert argv.index("-i") < argv.index("-ss") < argv.index("-to")
+        # input-side seek (keyframe jump + accurate re-encode), bounded by -t.
+        assert argv.index("-ss") < argv.index("-i") < argv.index("-t")
+        assert "-to" not in argv
         assert argv[argv.index("-ss") + 1] == "10.000"
-        assert argv[argv.index("-to") + 1] == "40.000"
+        assert argv[argv.index("-t") + 1] == "30.000"
         assert argv[argv.index("-c:v") + 1] == "libx264"
         assert argv[-1] == "/out.cut.mp4"
 
@@ -2948,6 +2949,64 @@ class TestLazyExportStage:
         assert seen["codecs"] == {"vcodec": "libx264", "acodec": "aac"}
         assert seen["argv"][-1] == "/final.mp4"
 
+    def test_stream_copies_a_clip_that_is_already_the_deliverable(self, monkeypatch):
+        from media_studio import ffmpeg
+
+        ran: dict[str, Any] = {}
+        monkeypatch.setattr(ffmpeg, "ffmpeg_path", lambda settings=None: "/bin/ffmpeg")
+        monkeypatch.setattr(ffmpeg, "run", lambda argv, **kw: ran.setdefault("argv", argv) and 0 or 0)
+        settings = {"exportRemux": True}
+        out = sm._lazy_export("/in.mp4", "/final.mp4", settings=settings, probe=lambda path, settings: _H264_AAC_MP4)
+        assert out == "/final.mp4"
+        argv = ran["argv"]
+        assert argv[argv.index("-c") + 1] == "copy"
+        assert "libx264" not in argv and "+faststart" in argv
+        assert argv[-1] == "/final.mp4"
+
+    @pytest.mark.parametrize("settings", [{}, {"exportRemux": False}, {"exportRemux": "yes"}])
+    def test_re_encodes_a_deliverable_clip_unless_remux_is_opted_in(self, monkeypatch, settings):
+        from media_studio import ffmpeg
+
+        seen: dict[str, Any] = {}
+        monkeypatch.setattr(ffmpeg, "build_convert_argv", lambda i, o, codecs, s: seen.update(codecs=codecs) or ["ff"])
+        monkeypatch.setattr(ffmpeg, "run", lambda argv, **kw: 0)
+
+        def probe(path, settings):
+            seen["probed"] = True
+            return _H264_AAC_MP4
+
+        sm._lazy_export("/in.mp4", "/final.mp4", settings=settings, probe=probe)
+        assert seen == {"codecs": {"vcodec": "libx264", "acodec": "aac"}}  # never probed, baseline encode
+
+
+_H264_AAC_MP4 = {
+    "streams": [
+        {"codec_type": "video", "codec_name": "h264", "pix_fmt": "yuv420p", "disposition": {"attached_pic": 0}},
+        {"codec_type": "audio", "codec_name": "aac"},
+    ],
+    "format": {"format_name": "mov,mp4,m4a,3gp,3g2,mj2"},
+}
+
+
+@pytest.mark.parametrize(
+    ("probe", "expected"),
+    [
+        (_H264_AAC_MP4, True),
+        ({**_H264_AAC_MP4, "streams": _H264_AAC_MP4["streams"][:1]}, True),  # silent clip
+        ({}, False),  # unreadable probe
+        ({**_H264_AAC_MP4, "format": {"format_name": "matroska,webm"}}, False),
+        ({**_H264_AAC_MP4, "streams": [{**_H264_AAC_MP4["streams"][0], "pix_fmt": "yuv444p"}]}, False),
+        ({**_H264_AAC_MP4, "streams": [{**_H264_AAC_MP4["streams"][0], "codec_name": "hevc"}]}, False),
+        (
+            {**_H264_AAC_MP4, "streams": [_H264_AAC_MP4["streams"][0], {"codec_type": "audio", "codec_name": "opus"}]},
+            False,
+        ),
+        ({**_H264_AAC_MP4, "streams": [{"codec_type": "audio", "codec_name": "aac"}]}, False),  # no video
+    ],
+)
+def test_export_can_remux_only_an_h264_aac_mp4(probe, expected):
+    assert sm.export_can_remux(probe) is expected
+
 
 # ---------------------------------------------------------------------------
 # pure helper edge cases
@@ -11,6 +11,7 @@ exposing a ``chat`` method; whisper/llama are never loaded. Covers:
 
 from __future__ import annotations
 
+import random
 from pathlib import Path
 from typing import Any
 
@@ -274,6 +275,8 @@ def test_make_provider_translator_blank_short_circuits():
         (1.5, "00:00:01,500"),
         (3661.234, "01:01:01,234"),
         (-5.0, "00:00:00,000"),  # negatives clamp to zero
+        (59.9996, "00:01:00,000"),  # ms rounding carries into the minute
+        (360000.0, "100:00:00,000"),  # hours are not wrapped
     ],
 )
 def test_format_timestamp_srt(seconds, expected):
@@ -295,6 +298,9 @@ def test_format_timestamp_ass_uses_centiseconds():
         ("00:00:01.500", 1.5),
         ("1:01:01.23", 3661.23),  # ass centiseconds
         ("01:01:01,234", 3661.234),
+        ("  00:00:02,000\t", 2.0),  # surrounding whitespace
+        ("00:00:03", 3.0),  # no fraction
+        (" 00:00:04,500 X1:40 X2:600 Y1:20 Y2:50", 4.5),  # trailing SRT position
     ],
 )
 def test_parse_timestamp(text, expected):
@@ -316,6 +322,12 @@ def test_to_srt_format(simple_track):
     assert text.endswith("\n")
 
 
+def test_to_srt_numbers_blocks_by_position_not_input_index():
+    cues = [S.make_cue(7, 0.0, 1.0, "a"), S.make_cue(3, 1.0, 2.0, "b\n")]
+    assert S.to_srt(cues) == "1\n00:00:00,000 --> 00:00:01,000\na\n\n2\n00:00:01,000 --> 00:00:02,000\nb\n"
+    assert S.to_vtt(cues) == "WEBVTT\n\n00:00:00.000 --> 00:00:01.000\na\n\n00:00:01.000 --> 00:00:02.000\nb\n"
+
+
 def test_srt_round_trip(simple_track):
     text = S.to_srt(simple_track["cues"])
     cues = S.read_srt(text)
@@ -345,6 +357,27 @@ def test_read_srt_without_index_lines():
     assert cues[0]["text"] == "No index here"
 
 
+def test_read_srt_loose_timing_lines_match_the_canonical_form():
+    # Canonical "HH:MM:SS,mmm" lines take the direct-arithmetic path; short or
+    # padded forms fall back to parse_timestamp — both must agree.
+    raw = (
+        "1\n01:02:03,450 --> 01:02:04,005 X1:10\nfast\n\n"
+        "2\n1:2:3.45 --> 1:2:4.005\nloose\n\n"
+        "00:00:09.999-->00:00:10.000\ndot separator\n"
+    )
+    cues = S.read_srt(raw)
+    assert [(c["start"], c["end"]) for c in cues[:2]] == [(3723.45, 3724.005)] * 2
+    assert (cues[2]["start"], cues[2]["end"]) == (9.999, 10.0)
+    assert [c["text"] for c in cues] == ["fast", "loose", "dot separator"]
+
+
+def test_read_srt_numbers_cues_by_position_not_source_index():
+    raw = "7\n00:00:00,000 --> 00:00:01,000\nA\n\n3\n00:00:01,000 --> 00:00:02,000\nB\n"
+    cues = S.read_srt(raw)
+    assert [c["index"] for c in cues] == [1, 2]
+    assert cues == S.reindex(cues)
+
+
 def test_read_srt_empty_returns_empty():
     assert S.read_srt("") == []
     assert S.read_srt("   \n\n  ") == []
@@ -381,6 +414,36 @@ def test_read_vtt_with_cue_id_and_settings():
     assert cues[0]["end"] == pytest.approx(1.0)
 
 
+def test_read_vtt_block_rules():
+    raw = (
+        "WEBVTT\n\n"
+        "00:00:00.000 --> 00:00:01.000\nline one\nline --> two\n \t\n"  # whitespace-only line ends a cue
+        "a\nb\n00:00:02.000 --> 00:00:03.000\nskipped: timing is not in the first two lines\n\n"
+        "00:00:04.000 --> 00:00:05.000\n00:00:06.000 --> 00:00:07.000\n\n"  # 2nd timing line is body
+        "00:00:08.000 --> 00:00:09.000"  # empty body at end of file
+    )
+    cues = S.read_vtt(raw)
+    assert [(c["start"], c["end"], c["text"]) for c in cues] == [
+        (0.0, 1.0, "line one\nline --> two"),
+        (4.0, 5.0, "00:00:06.000 --> 00:00:07.000"),
+        (8.0, 9.0, ""),
+    ]
+
+
+@pytest.mark.parametrize(
+    ("raw", "expected"),
+    [
+        ("WEBVTT", []),
+        ("00:00:01.000 --> 00:00:02.000\nno header", [(1.0, 2.0, "no header")]),
+        ("WEBVTT - Kind: captions", []),
+        ("WEBVTT Title\n\n00:00:01.000 --> 00:00:02.500 line:0 align:start\nhi", [(1.0, 2.5, "hi")]),
+        ("\ufeffWEBVTT\r\n\r\n00:00:03.000 --> 00:00:04.000\r\nyo", [(3.0, 4.0, "yo")]),
+    ],
+)
+def test_read_vtt_header_line_and_cue_settings(raw, expected):
+    assert [(c["start"], c["end"], c["text"]) for c in S.read_vtt(raw)] == expected
+
+
 # --------------------------------------------------------------------------- #
 # ASS round-trip + escaping
 # --------------------------------------------------------------------------- #
@@ -483,6 +546,30 @@ def test_export_writes_file_and_returns_path(simple_track, tmp_path: Path, fmt):
     assert out.read_text(encoding="utf-8").strip() != ""
 
 
+@pytest.mark.parametrize("fmt", ["srt", "vtt", "ass"])
+@pytest.mark.parametrize("n_cues", [0, 1, 2])
+def test_export_streams_exactly_the_serialized_text(simple_track, tmp_path: Path, fmt, n_cues):
+    track = {**simple_track, "cues": simple_track["cues"][:n_cues]}
+    out = tmp_path / f"track.{fmt}"
+    S.export(track, fmt, out)
+    assert out.read_text(encoding="utf-8") == S.serialize(track, fmt)
+
+
+def test_failed_export_keeps_the_previous_file(simple_track, tmp_path: Path, monkeypatch):
+    out = tmp_path / "track.srt"
+    out.write_text("previous export\n", encoding="utf-8")
+
+    def broken_writer(cues, fh):
+        fh.write("1\n00:00:00,000 --> ")
+        raise RuntimeError("disk went away")
+
+    monkeypatch.setitem(S._WRITERS, "srt", broken_writer)
+    with pytest.raises(RuntimeError):
+        S.export(simple_track, "srt", out)
+    assert out.read_text(encoding="utf-8") == "previous export\n"
+    assert [p.name for p in tmp_path.iterdir()] == ["track.srt"]  # temp sibling cleaned up
+
+
 @pytest.mark.parametrize("fmt", ["srt", "vtt", "ass"])
 def test_load_reads_back_exported_file(simple_track, tmp_path: Path, fmt):
     out = tmp_path / f"track.{fmt}"
@@ -652,6 +739,40 @@ def test_split_segment_inherits_speaker():
     assert all(c["speaker"] == "SPEAKER_02" for c in cues)
 
 
+def _reference_split(words, max_chars, max_duration):
+    """The re-join-every-word packing loop the running char count replaced (oracle)."""
+    groups, cur = [], []
+    for w in words:
+        tentative = cur + [w]
+        text = " ".join(str(x.get("text", "")).strip() for x in tentative).strip()
+        span = float(tentative[-1].get("end", 0.0)) - float(tentative[0].get("start", 0.0))
+        if cur and (len(text) > max_chars or span > max_duration):
+            groups.append(cur)
+            cur = [w]
+        else:
+            cur = tentative
+    groups.append(cur)
+    out = []
+    for group in groups:
+        text = " ".join(str(w.get("text", "")).strip() for w in group).strip()
+        if group and text:
+            out.append((float(group[0].get("start", 0.0)), float(group[-1].get("end", 0.0)), text))
+    return out
+
+
+@pytest.mark.parametrize("seed", range(8))
+def test_split_segment_running_length_matches_rejoin_reference(seed):
+    rng = random.Random(seed)
+    vocab = ["a", "word", "longer-token", "", "  ", " pad ", "x" * 14, "mid"]
+    words, t = [], 0.0
+    for _ in range(40):
+        dur = rng.uniform(0.05, 0.6)
+        words.append({"text": rng.choice(vocab), "start": t, "end": t + dur})
+        t += dur
+    cues = S._split_segment(words, 16, 2.5)
+    assert [(c["start"], c["end"], c["text"]) for c in cues] == _reference_split(words, 16, 2.5)
+
+
 def test_split_segment_without_speaker_omits_key():
     words = [
         {"text": w, "start": i * 1.0, "end": i * 1.0 + 0.9}
@@ -210,6 +210,7 @@ def test_ass_escape_newlines_become_soft_breaks():
 def test_ass_escape_handles_none_and_empty():
     assert tracks.ass_escape("") == ""
     assert tracks.ass_escape(None) == ""  # type: ignore[arg-type]
+    assert tracks.ass_escape(0) == ""  # type: ignore[arg-type]  # any falsy text -> ""
 
 
 def test_ass_escape_injection_attempt_is_inert():
@@ -239,6 +240,14 @@ def test_build_ass_timestamp_centiseconds():
     assert tracks._ass_timestamp(0) == "0:00:00.00"
     assert tracks._ass_timestamp(3661.5) == "1:01:01.50"
     assert tracks._ass_timestamp(-5) == "0:00:00.00"  # clamped
+    assert tracks._ass_timestamp(59.995) == "0:01:00.00"  # centisecond carry into the minute
+    assert tracks._ass_timestamp(36000) == "10:00:00.00"  # hours are not zero-padded or wrapped
+
+
+def test_build_ass_timestamp_clamps_nan_instead_of_raising():
+    assert tracks._ass_timestamp(float("nan")) == "0:00:00.00"
+    doc = tracks.build_ass_document([_cue(1, 1.0, float("nan"), "A")], source_start=0.0)
+    assert "Dialogue: 0,0:00:01.00," in doc
 
 
 def test_build_ass_document_rebases_by_source_start():
@@ -427,6 +436,28 @@ def test_write_ass_sidecar_writes_file(tmp_path: Path):
     assert "Dialogue:" in text and "hello" in text
 
 
+def test_write_ass_sidecar_streams_the_built_document(tmp_path: Path):
+    cues = [_cue(1, 48.0, 53.0, "straddle"), _cue(2, 10.0, 20.0, "gone"), _cue(3, 55.0, 57.5, "ünï {x}")]
+    got = tracks.write_ass_sidecar(cues, tmp_path / "subs.ass", width=720, height=1280, source_start=50.0)
+    expected = tracks.build_ass_document(cues, width=720, height=1280, source_start=50.0)
+    assert Path(got).read_text(encoding="utf-8") == expected
+
+
+def test_failed_ass_sidecar_write_keeps_the_previous_file(tmp_path: Path, monkeypatch):
+    out = tmp_path / "subs.ass"
+    out.write_text("previous sidecar\n", encoding="utf-8")
+
+    def broken_writer(cues, fh, **_kwargs):
+        fh.write("[Script Info]\n")
+        raise RuntimeError("disk went away")
+
+    monkeypatch.setattr(tracks, "write_ass_document", broken_writer)
+    with pytest.raises(RuntimeError):
+        tracks.write_ass_sidecar([_cue(1, 0, 1.5, "hello")], out)
+    assert out.read_text(encoding="utf-8") == "previous sidecar\n"
+    assert [p.name for p in tmp_path.iterdir()] == ["subs.ass"]  # temp sibling cleaned up
+
+
 # =========================================================================== #
 # high-level ops — burn / soft-mux / strip with the run seam mocked
 # =========================================================================== #
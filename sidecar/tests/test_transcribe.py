@@ -130,6 +130,34 @@ def test_transcribe_file_requests_word_timestamps():
     assert model.calls[0]["audio"] == "/v.mp4"
 
 
+def test_transcribe_file_feeds_shared_pcm_instead_of_the_path():
+    samples = object()
+    seen: list[str] = []
+
+    def pcm(path: str) -> tuple[Any, int]:
+        seen.append(path)
+        return samples, 16000
+
+    model = _two_segment_model()
+    t = transcribe.transcribe_file("/v.mp4", loader=FakeLoader(model), pcm_loader=pcm)
+    assert seen == ["/v.mp4"]
+    assert model.calls[0]["audio"] is samples
+    assert len(t["segments"]) == 2
+
+
+@pytest.mark.parametrize(
+    "pcm",
+    [
+        lambda path: (_ for _ in ()).throw(RuntimeError("ffmpeg failed")),
+        lambda path: (object(), 8000),  # not whisper's rate
+    ],
+)
+def test_transcribe_file_falls_back_to_the_path_when_pcm_is_unusable(pcm):
+    model = _two_segment_model()
+    transcribe.transcribe_file("/v.mp4", loader=FakeLoader(model), pcm_loader=pcm)
+    assert model.calls[0]["audio"] == "/v.mp4"
+
+
 # --------------------------------------------------------------------------- #
 # language auto-detect vs explicit
 # --------------------------------------------------------------------------- #
@@ -185,6 +213,96 @@ def test_normalizer_defaults_missing_word_and_segment_fields():
     assert w == {"text": "", "start": 0.0, "end": 0.0}
 
 
+class _Bare:
+    def __init__(self, **kw: Any) -> None:
+        self.__dict__.update(kw)
+
+
+def _reference_word(word: Any) -> dict[str, Any]:
+    text = transcribe._attr(word, "word", "text")
+    return {
+        "text": "" if text is None else str(text),
+        "start": float(transcribe._attr(word, "start") or 0.0),
+        "end": float(transcribe._attr(word, "end") or 0.0),
+    }
+
+
+def _reference_segment(seg: Any) -> dict[str, Any]:
+    return {
+        "start": float(transcribe._attr(seg, "start") or 0.0),
+        "end": float(transcribe._attr(seg, "end") or 0.0),
+        "text": str(transcribe._attr(seg, "text") or ""),
+        "words": [_reference_word(w) for w in transcribe._attr(seg, "words") or []],
+    }
+
+
+@pytest.mark.parametrize(
+    "word",
+    [
+        {"word": " hi", "text": "ignored", "start": 1, "end": 2},
+        {"word": None, "text": "not used", "start": None},
+        {"text": "only text", "end": 3.5},
+        {},
+        _Bare(word=" hi", text="ignored", start=1.0, end=2.0),
+        _Bare(word=None, text="not used"),
+        _Bare(text="only text", start=0.5),
+        _Bare(),
+    ],
+)
+def test_word_normalizer_matches_attr_reference(word):
+    # The isinstance-branched fast path keeps _attr's first-PRESENT semantics:
+    # a present-but-None ``word`` does not fall through to ``text``.
+    assert transcribe._word_to_dict(word) == _reference_word(word)
+
+
+@pytest.mark.parametrize(
+    "seg",
+    [
+        {"start": 1, "end": 2, "text": "a", "words": [{"word": "a", "start": 1, "end": 2}]},
+        {"words": None},
+        {},
+        _Bare(start=1.0, end=2.0, text="b", words=[_Bare(word="b", start=1.0, end=2.0), {"text": "c"}]),
+        _Bare(words=[]),
+        _Bare(),
+    ],
+)
+def test_segment_normalizer_matches_attr_reference(seg):
+    assert transcribe._segment_to_dict(seg) == _reference_segment(seg)
+
+
+class _OneShotSegments:
+    """A segment iterable that raises if iterated a second time.
+
+    faster-whisper's segments are a lazy generator: a second pass silently yields
+    nothing, so any normalizer that walks them twice (e.g. a trailing
+    ``" ".join(s.text for s in segments)``) would quietly lose data.
+    """
+
+    def __init__(self, segments):
+        self._segments = segments
+        self.passes = 0
+
+    def __iter__(self):
+        self.passes += 1
+        if self.passes > 1:
+            raise AssertionError("segment generator iterated twice")
+        return iter(self._segments)
+
+
+class _OneShotModel(FakeModel):
+    def transcribe(self, audio: str, **kwargs: Any):
+        self.calls.append({"audio": audio, **kwargs})
+        return self._segments, self._info
+
+
+def test_transcribe_file_consumes_segments_in_one_pass():
+    segments = _OneShotSegments(_two_segment_model()._segments)
+    t = transcribe.transcribe_file("/v.mp4", loader=FakeLoader(_OneShotModel(segments, _Info("en", 10.0))))
+    assert segments.passes == 1
+    assert [s["text"] for s in t["segments"]] == [" Hello world", " second part"]
+    assert [w["text"] for w in t["segments"][1]["words"]] == [" second", " part"]
+
+
 # --------------------------------------------------------------------------- #
 # CPU fallback
 # --------------------------------------------------------------------------- #
@@ -833,6 +951,29 @@ def test_resolve_target_non_string_device_value_falls_back_to_auto():
     assert model == transcribe.DEFAULT_MODEL
 
 
+@pytest.mark.parametrize(
+    ("settings", "probe", "expected"),
+    [
+        ({"transcribeComputeType": "int8_float16"}, True, ("cuda", "int8_float16")),
+        ({"transcribeComputeType": " Float32 "}, False, ("cpu", "float32")),
+        ({"transcribeComputeType": "auto"}, True, ("cuda", transcribe.DEFAULT_GPU_COMPUTE)),
+        ({"transcribeComputeType": "int4"}, False, ("cpu", transcribe.CPU_COMPUTE)),  # unknown -> default
+        ({"transcribeComputeType": 8}, False, ("cpu", transcribe.CPU_COMPUTE)),
+    ],
+)
+def test_resolve_target_compute_type_override(settings, probe, expected):
+    _model, device, compute = transcribe.resolve_transcribe_target(settings, probe=lambda: probe)
+    assert (device, compute) == expected
+
+
+def test_transcribe_with_engine_forwards_compute_override():
+    loader = FakeLoader(_two_segment_model())
+    transcribe.transcribe_with_engine(
+        "/v.mp4", loader=loader, settings={"transcribeComputeType": "int8_float16"}, detect_probe=lambda: True
+    )
+    assert loader.loads == [(transcribe.DEFAULT_MODEL, "cuda", "int8_float16")]
+
+
 def test_transcribe_with_engine_no_cuda_loads_cpu_int8_only():
     loader = FakeLoader(_two_segment_model())
     t = transcribe.transcribe_with_engine("/v.mp4", loader=loader, settings={}, detect_probe=lambda: False)
@@ -939,3 +1080,102 @@ def test_resolve_target_auto_literal_model_keeps_auto_model():
     # transcribeModel == "auto" (the sentinel) is ignored -> auto model stands.
     model, _, _ = transcribe.resolve_transcribe_target({"transcribeModel": "AUTO"}, probe=lambda: True)
     assert model == transcribe.DEFAULT_MODEL
+
+
+# --------------------------------------------------------------------------- #
+# batched decoding — resolve_batch_size + the BatchedInferencePipeline seam
+# --------------------------------------------------------------------------- #
+class _FakeBatchedPipeline:
+    """Stand-in BatchedInferencePipeline: forwards to the wrapped model's transcribe."""
+
+    def __init__(self, *, model: FakeModel):
+        self.model = model
+
+    def transcribe(self, audio: str, **kwargs: Any):
+        return self.model.transcribe(audio, batched=True, **kwargs)
+
+
+@pytest.fixture()
+def _stub_batched_pipeline(monkeypatch):
+    fake_mod = types.ModuleType("faster_whisper")
+    fake_mod.BatchedInferencePipeline = _FakeBatchedPipeline  # type: ignore[attr-defined]
+    monkeypatch.setitem(sys.modules, "faster_whisper", fake_mod)
+    return fake_mod
+
+
+@pytest.mark.parametrize(
+    ("settings", "expected"),
+    [
+        ({}, None),  # opt-in: no setting -> sequential, even on CUDA
+        ({"transcribeBatchSize": 8}, 8),
+        ({"transcribeBatchSize": 1}, None),  # 1 == sequential
+        ({"transcribeBatchSize": 0}, None),  # clamped up to 1 -> sequential
+        ({"transcribeBatchSize": 500}, transcribe.MAX_BATCH_SIZE),
+        ({"transcribeBatchSize": True}, None),  # bool is not a size
+        ({"transcribeBatchSize": "8"}, None),  # non-int -> sequential
+    ],
+)
+def test_resolve_batch_size(settings, expected):
+    assert transcribe.resolve_batch_size(settings) == expected
+
+
+def test_transcribe_file_batches_through_pipeline(_stub_batched_pipeline):
+    model = _two_segment_model()
+    t = transcribe.transcribe_file("/v.mp4", loader=FakeLoader(model), batch_size=12)
+    assert len(t["segments"]) == 2
+    assert model.calls == [
+        {"audio": "/v.mp4", "batched": True, "language": None, "word_timestamps": True, "batch_size": 12}
+    ]
+
+
+def test_transcribe_file_sequential_when_pipeline_unavailable(monkeypatch):
+    monkeypatch.setitem(sys.modules, "faster_whisper", types.ModuleType("faster_whisper"))
+    model = _two_segment_model()
+    transcribe.transcribe_file("/v.mp4", loader=FakeLoader(model), batch_size=12)
+    assert model.calls == [{"audio": "/v.mp4", "language": None, "word_timestamps": True}]
+
+
+def test_sequential_decode_keeps_whisper_defaults_unless_skip_silence():
+    model = _two_segment_model()
+    transcribe.transcribe_file("/v.mp4", loader=FakeLoader(model), language="de")
+    assert model.calls[0] == {"audio": "/v.mp4", "language": "de", "word_timestamps": True}
+    model = _two_segment_model()
+    transcribe.transcribe_file("/v.mp4", loader=FakeLoader(model), language="de", skip_silence=True)
+    call = model.calls[0]
+    assert call["language"] == "de"
+    assert call["vad_filter"] is True
+    assert call["condition_on_previous_text"] is False
+
+
+@pytest.mark.parametrize(("raw", "expected"), [(None, False), (True, True), (False, False), ("yes", False), (1, False)])
+def test_resolve_skip_silence_only_on_explicit_true(raw, expected):
+    settings = {} if raw is None else {transcribe.TRANSCRIBE_SKIP_SILENCE_KEY: raw}
+    assert transcribe.resolve_skip_silence(settings) is expected
+
+
+def test_transcribe_with_engine_batches_only_when_opted_in(_stub_batched_pipeline):
+    gpu = _two_segment_model()
+    transcribe.transcribe_with_engine("/v.mp4", loader=FakeLoader(gpu), settings={}, detect_probe=lambda: True)
+    assert "batch_size" not in gpu.calls[0]
+    opted = _two_segment_model()
+    transcribe.transcribe_with_engine(
+        "/v.mp4",
+        loader=FakeLoader(opted),
+        settings={transcribe.TRANSCRIBE_BATCH_KEY: 12},
+        detect_probe=lambda: False,
+    )
+    assert opted.calls[0]["batch_size"] == 12
+
+
+def test_transcribe_with_engine_reads_the_skip_silence_setting():
+    cpu = _two_segment_model()
+    transcribe.transcribe_with_engine(
+        "/v.mp4",
+        loader=FakeLoader(cpu),
+        settings={transcribe.TRANSCRIBE_SKIP_SILENCE_KEY: True},
+        detect_probe=lambda: False,
+    )
+    assert cpu.calls[0]["vad_filter"] is True
+    cpu = _two_segment_model()
+    transcribe.transcribe_with_engine("/v.mp4", loader=FakeLoader(cpu), settings={}, detect_probe=lambda: False)
+    assert "vad_filter" not in cpu.calls[0]
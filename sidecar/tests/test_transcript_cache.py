@@ -0,0 +1,254 @@
+"""Unit tests for media_studio.features.transcript_cache.
+
+The cache short-circuits a repeat transcription of byte-identical media under
+the same resolved ASR config. These tests pin:
+
+  * ``key()`` joins the media content digest with a canonical config hash: the
+    same bytes under a different name hit, any config change misses, and media
+    that cannot be hashed yields no key at all (never an exception); an
+    unchanged file is not re-hashed;
+  * ``get`` / ``put`` round-trip through an injected store dir, with corrupt or
+    unwritable entries degrading to a miss, and least-recently-used eviction;
+  * ``transcribe_with_engine(cache=...)`` returns a stored transcript without
+    loading a model, never stores a cancelled or degraded run, and files a
+    GPU->CPU fallback under the config that actually ran;
+  * the Services wiring honours ``transcriptCache`` / ``transcriptCacheDir``.
+
+The whole-file hasher is injected (a sha256 of the bytes) so no ``blake3`` and
+no real media are needed.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+from pathlib import Path
+from typing import Any
+
+import pytest
+from media_studio.features import transcribe
+from media_studio.features import transcript_cache as cache_mod
+from media_studio.features.transcript_cache import TranscriptCache
+from media_studio.handlers import Services
+from media_studio.relink import RelinkError
+
+from tests.test_transcribe import FakeLoader, _two_segment_model
+
+
+# --------------------------------------------------------------------------- #
+# fixtures / helpers
+# --------------------------------------------------------------------------- #
+def _sha_file(path: str) -> str:
+    return hashlib.sha256(Path(path).read_bytes()).hexdigest()
+
+
+@pytest.fixture
+def store(tmp_path: Path) -> TranscriptCache:
+    return TranscriptCache(store_dir=tmp_path / "transcript-cache", hash_file=_sha_file)
+
+
+@pytest.fixture
+def media(tmp_path: Path) -> Path:
+    path = tmp_path / "clip.mp4"
+    path.write_bytes(b"fake media bytes")
+    return path
+
+
+_CONFIG = {"engine": "whisper", "model": "large-v3-turbo", "device": "cuda", "language": None}
+
+
+# --------------------------------------------------------------------------- #
+# key()
+# --------------------------------------------------------------------------- #
+def test_key_is_content_addressed(store: TranscriptCache, media: Path, tmp_path: Path) -> None:
+    copy = tmp_path / "renamed.mkv"
+    copy.write_bytes(media.read_bytes())
+    key = store.key(str(media), _CONFIG)
+    assert key is not None
+    assert key == store.key(str(copy), dict(reversed(list(_CONFIG.items()))))
+    assert key.startswith(_sha_file(str(media)) + "-")
+
+
+def test_key_changes_with_content_or_config(store: TranscriptCache, media: Path, tmp_path: Path) -> None:
+    key = store.key(str(media), _CONFIG)
+    other = tmp_path / "other.mp4"
+    other.write_bytes(b"different bytes")
+    assert store.key(str(other), _CONFIG) != key
+    assert store.key(str(media), {**_CONFIG, "language": "de"}) != key
+    assert store.key(str(media), {**_CONFIG, "model": "small"}) != key
+
+
+def test_key_none_for_missing_file(store: TranscriptCache, tmp_path: Path) -> None:
+    assert store.key(str(tmp_path / "gone.mp4"), _CONFIG) is None
+
+
+def test_key_rehashes_only_when_the_file_changes(tmp_path: Path, media: Path) -> None:
+    hashed: list[str] = []
+
+    def counting(path: str) -> str:
+        hashed.append(path)
+        return _sha_file(path)
+
+    cache = TranscriptCache(store_dir=tmp_path / "c", hash_file=counting)
+    key = cache.key(str(media), _CONFIG)
+    assert TranscriptCache(store_dir=tmp_path / "c", hash_file=counting).key(str(media), _CONFIG) == key
+    assert len(hashed) == 1  # the second key came from the (realpath, mtime_ns, size) memo
+    media.write_bytes(b"edited media bytes!")
+    assert cache.key(str(media), _CONFIG) != key
+    assert len(hashed) == 2
+
+
+def test_key_none_when_hasher_unavailable(tmp_path: Path, media: Path) -> None:
+    def no_blake3(path: str) -> str:
+        raise RelinkError("the 'blake3' package is required")
+
+    cache = TranscriptCache(store_dir=tmp_path / "c", hash_file=no_blake3)
+    assert cache.key(str(media), _CONFIG) is None
+
+
+# --------------------------------------------------------------------------- #
+# get / put
+# --------------------------------------------------------------------------- #
+def test_get_miss_then_roundtrip(store: TranscriptCache) -> None:
+    transcript = {"language": "en", "segments": [{"text": "hi"}], "durationSec": 1.0}
+    assert store.get("k") is None
+    store.put("k", transcript)
+    assert store.get("k") == transcript
+    assert store.path_for("k").name == "k.json"
+
+
+@pytest.mark.parametrize("raw", ["{not json", "[1, 2]"])
+def test_corrupt_or_non_object_entry_is_a_miss(store: TranscriptCache, raw: str) -> None:
+    store.put("k", {"segments": []})
+    store.path_for("k").write_text(raw, encoding="utf-8")
+    assert store.get("k") is None
+
+
+def test_put_failure_is_swallowed(tmp_path: Path) -> None:
+    blocker = tmp_path / "not-a-dir"
+    blocker.write_text("x", encoding="utf-8")
+    cache = TranscriptCache(store_dir=blocker / "sub")
+    cache.put("k", {"segments": []})  # mkdir under a file -> OSError, logged
+    assert cache.get("k") is None
+
+
+def test_put_is_atomic_and_evicts_least_recently_used(tmp_path: Path) -> None:
+    cache = TranscriptCache(store_dir=tmp_path / "c", max_entries=2)
+    for n, key in enumerate(("a", "b")):
+        cache.put(key, {"segments": []})
+        os.utime(cache.path_for(key), ns=(n * 10**9, n * 10**9))
+    assert cache.get("a") is not None  # refreshes "a": "b" is now the oldest
+    cache.put("c", {"segments": []})
+    assert sorted(p.name for p in (tmp_path / "c").iterdir()) == ["a.json", "c.json"]
+
+
+def test_default_dirname() -> None:
+    assert cache_mod.DEFAULT_CACHE_DIRNAME == "transcript-cache"
+
+
+# --------------------------------------------------------------------------- #
+# transcribe_with_engine(cache=...)
+# --------------------------------------------------------------------------- #
+_CPU = {"transcribeDevice": "cpu"}
+
+
+def test_engine_second_call_hits_without_loading(store: TranscriptCache, media: Path) -> None:
+    first_loader = FakeLoader(_two_segment_model())
+    first = transcribe.transcribe_with_engine(str(media), loader=first_loader, settings=_CPU, cache=store)
+    assert first_loader.loads
+
+    second_loader = FakeLoader(_two_segment_model())
+    second = transcribe.transcribe_with_engine(str(media), loader=second_loader, settings=_CPU, cache=store)
+    assert second == first
+    assert second_loader.loads == []
+
+
+def test_engine_gpu_fallback_is_stored_under_the_cpu_config(store: TranscriptCache, media: Path) -> None:
+    def run(loader: FakeLoader) -> None:
+        transcribe.transcribe_with_engine(
+            str(media), loader=loader, settings={}, detect_probe=lambda: True, cache=store
+        )
+
+    run(FakeLoader(_two_segment_model(), fail_on={"cuda"}))  # falls back to cpu/int8
+    assert len(list(store.path_for("x").parent.glob("*.json"))) == 1
+    gpu_loader = FakeLoader(_two_segment_model())
+    run(gpu_loader)
+    assert gpu_loader.loads  # the CPU result was not filed under the cuda key
+    assert len(list(store.path_for("x").parent.glob("*.json"))) == 2
+
+
+def test_engine_config_change_misses(store: TranscriptCache, media: Path) -> None:
+    transcribe.transcribe_with_engine(str(media), loader=FakeLoader(_two_segment_model()), settings=_CPU, cache=store)
+    loader = FakeLoader(_two_segment_model())
+    transcribe.transcribe_with_engine(str(media), loader=loader, settings=_CPU, language="de", cache=store)
+    assert loader.loads
+
+
+def test_engine_cancelled_run_is_not_stored(store: TranscriptCache, media: Path) -> None:
+    transcribe.transcribe_with_engine(
+        str(media),
+        loader=FakeLoader(_two_segment_model()),
+        settings=_CPU,
+        should_cancel=lambda: True,
+        cache=store,
+    )
+    assert list(store.path_for("x").parent.glob("*.json")) == []
+
+
+def test_engine_unhashable_media_runs_uncached(tmp_path: Path) -> None:
+    cache = TranscriptCache(store_dir=tmp_path / "c", hash_file=_sha_file)
+    loader = FakeLoader(_two_segment_model())
+    t = transcribe.transcribe_with_engine(str(tmp_path / "gone.mp4"), loader=loader, settings=_CPU, cache=cache)
+    assert len(t["segments"]) == 2
+    assert not (tmp_path / "c").exists()
+
+
+def test_engine_parakeet_result_is_stored(store: TranscriptCache, media: Path) -> None:
+    settings = {**_CPU, "asrEngine": "parakeet"}
+    calls: list[str] = []
+
+    def fake_parakeet(audio_path: str, **kwargs: Any) -> dict[str, Any]:
+        calls.append(audio_path)
+        return {"language": "en", "segments": [{"start": 0.0, "end": 1.0, "text": "hi", "words": []}]}
+
+    loader = FakeLoader(_two_segment_model())
+    for _ in range(2):
+        transcribe.transcribe_with_engine(
+            str(media), loader=loader, settings=settings, parakeet_runner=fake_parakeet, cache=store
+        )
+    assert calls == [str(media)]
+
+
+def test_engine_parakeet_degrade_fallback_is_not_stored(store: TranscriptCache, media: Path) -> None:
+    settings = {**_CPU, "asrEngine": "parakeet"}
+
+    def empty_parakeet(audio_path: str, **kwargs: Any) -> dict[str, Any]:
+        return {"language": "", "segments": [], "durationSec": 0.0}
+
+    t = transcribe.transcribe_with_engine(
+        str(media),
+        loader=FakeLoader(_two_segment_model()),
+        settings=settings,
+        parakeet_runner=empty_parakeet,
+        cache=store,
+    )
+    assert len(t["segments"]) == 2  # whisper fallback ran
+    assert list(store.path_for("x").parent.glob("*.json")) == []  # ...but was not cached
+
+
+# --------------------------------------------------------------------------- #
+# Services wiring
+# --------------------------------------------------------------------------- #
+def test_services_cache_under_data_dir(tmp_path: Path) -> None:
+    svc = Services(data_dir=tmp_path / "d")
+    cache = svc._transcript_cache()
+    assert isinstance(cache, TranscriptCache)
+    assert cache.path_for("k").parent == tmp_path / "d" / "transcript-cache"
+
+
+def test_services_cache_dir_override_and_off(tmp_path: Path) -> None:
+    svc = Services(data_dir=tmp_path / "d")
+    svc.settings.set({"transcriptCacheDir": str(tmp_path / "elsewhere")})
+    assert svc._transcript_cache().path_for("k").parent == tmp_path / "elsewhere"
+    svc.settings.set({"transcriptCache": False})
+    assert svc._transcript_cache() is None
@@ -10,6 +10,7 @@ settings, and the U4 manifest registration of the chosen MT GGUFs.
 
 from __future__ import annotations
 
+import threading
 from typing import Any
 
 import pytest
@@ -17,11 +18,17 @@ from media_studio.assets import manifest
 from media_studio.models.provider import (
     CloudProvider,
     LocalServerProvider,
+    PoolEntrySpec,
     ProviderError,
+    RotatingProvider,
 )
 from media_studio.models.runner import ModelRunner
 from media_studio.models.translation import (
+    DEFAULT_HOSTED_BATCH_SIZE,
+    DEFAULT_HOSTED_CONCURRENCY,
     DEFAULT_TIER,
+    MAX_BATCH_SIZE,
+    MAX_CONCURRENCY,
     ROUTING_TABLE,
     TIER1_ASSET_NAME,
     TIER1_GGUF_NAME,
@@ -35,10 +42,12 @@ from media_studio.models.translation import (
     TieredTranslator,
     TierUnavailableError,
     TranslationError,
+    build_batch_messages,
     build_messages,
     fallback_chain,
     get_translator,
     normalize_lang,
+    parse_numbered_reply,
     route,
 )
 
@@ -195,6 +204,221 @@ def test_build_messages_includes_source_lang_when_given():
     assert "source language" not in no_src[0]["content"]
 
 
+def test_build_messages_reuses_the_prompt_for_a_language_pair():
+    first = build_messages("hello", "fr", "en")[0]["content"]
+    again = build_messages("bye", "fr", "en")[0]["content"]
+    assert first is again
+    assert build_messages("hello", "de", "en")[0]["content"] != first
+
+
+# --------------------------------------------------------------------------- #
+# batching: numbered-list prompt + reply parse
+# --------------------------------------------------------------------------- #
+class NumberedProvider(FakeProvider):
+    """Answers a numbered-list prompt with a numbered list (the well-behaved model)."""
+
+    def chat(self, messages, **kwargs: Any) -> str:
+        self.chats.append([dict(m) for m in messages])
+        lines = messages[-1]["content"].split("\n")
+        if len(lines) == 1:
+            return f"{self.prefix}:{lines[0]}"
+        return "\n".join(f"{n}. {self.prefix}:{line.split('. ', 1)[1]}" for n, line in enumerate(lines, 1))
+
+
+def cues_n(n: int) -> list[dict[str, Any]]:
+    return [{"index": i, "start": float(i), "end": i + 1.0, "text": f"line {i}"} for i in range(1, n + 1)]
+
+
+def test_build_batch_messages_numbers_each_text():
+    msgs = build_batch_messages(["hi", "bye"], "fr", "en")
+    assert [m["role"] for m in msgs] == ["system", "user"]
+    assert "fr" in msgs[0]["content"] and "source language is en" in msgs[0]["content"]
+    assert msgs[1]["content"] == "1. hi\n2. bye"
+
+
+@pytest.mark.parametrize(
+    ("reply", "expected"),
+    [
+        ("1. hola\n2. adios", ["hola", "adios"]),
+        ("  1) hola \n2.adios\n", ["hola", "adios"]),
+        ("1. first line\nsecond line\n2. x", ["first line\nsecond line", "x"]),
+        ("1. hola", None),  # too few entries
+        ("1. a\n2. b\n3. c", None),  # too many
+        ("2. a\n1. b", None),  # out of order
+        ("Sure! Here you go:\n1. a\n2. b", None),  # preamble
+        ("1. a\n2.", None),  # empty entry
+    ],
+)
+def test_parse_numbered_reply(reply, expected):
+    assert parse_numbered_reply(reply, 2) == expected
+
+
+def test_hosted_tier_batches_cues_into_one_call():
+    hosted = NumberedProvider(prefix="CLOUD")
+    seen: list[Any] = []
+    t = make_translator(runner=None, hosted=[hosted])
+    out = t.translate(cues_n(3), "yo", progress=lambda pct, msg: seen.append((pct, msg)))
+    assert [c["text"] for c in out] == ["CLOUD:line 1", "CLOUD:line 2", "CLOUD:line 3"]
+    assert [(c["index"], c["start"]) for c in out] == [(1, 1.0), (2, 2.0), (3, 3.0)]
+    assert len(hosted.chats) == 1
+    assert seen == [(100, "tier3: translated 3/3")]
+
+
+def test_batch_groups_follow_the_batch_size_setting():
+    hosted = NumberedProvider(prefix="CLOUD")
+    t = make_translator(runner=None, settings={"translateBatchSize": 2}, hosted=[hosted])
+    out = t.translate(cues_n(5), "yo")
+    assert [c["text"] for c in out][-1] == "CLOUD:line 5"
+    assert [m[-1]["content"].count("\n") + 1 for m in hosted.chats] == [2, 2, 1]
+
+
+def test_batch_blank_cues_pass_through_outside_the_list():
+    hosted = NumberedProvider(prefix="CLOUD")
+    cues = cues_n(3)
+    cues[1]["text"] = "  "
+    out = make_translator(runner=None, hosted=[hosted]).translate(cues, "yo")
+    assert [c["text"] for c in out] == ["CLOUD:line 1", "  ", "CLOUD:line 3"]
+    assert hosted.chats[0][-1]["content"] == "1. line 1\n2. line 3"
+
+
+class ListTranslatingProvider(FakeProvider):
+    """Reads EVERY numbered line of a batch prompt as an entry (as a model would)."""
+
+    def chat(self, messages, **kwargs: Any) -> str:
+        self.chats.append([dict(m) for m in messages])
+        content = messages[-1]["content"]
+        if "numbered list" not in messages[0]["content"]:
+            return f"{self.prefix}:{content}"
+        lines = content.split("\n")
+        return "\n".join(f"{n}. {self.prefix}:{line.split('. ', 1)[1]}" for n, line in enumerate(lines, 1))
+
+
+def test_multi_line_or_digit_led_cues_are_never_batched():
+    hosted = ListTranslatingProvider(prefix="CLOUD")
+    texts = ["Ingredients:\n2. eggs", "Hello", "3) go", "Bye"]
+    cues = [{"index": i, "start": float(i), "end": i + 1.0, "text": t} for i, t in enumerate(texts, 1)]
+    out = make_translator(runner=None, hosted=[hosted]).translate(cues, "yo")
+    assert [c["text"] for c in out] == [f"CLOUD:{t}" for t in texts]
+    assert [m[-1]["content"] for m in hosted.chats] == ["1. Hello\n2. Bye", "Ingredients:\n2. eggs", "3) go"]
+
+
+def test_unparseable_batch_reply_retries_each_line():
+    hosted = FakeProvider(prefix="CLOUD")  # echoes the whole list back, unnumbered
+    out = make_translator(runner=None, hosted=[hosted]).translate(cues2(), "yo")
+    assert [c["text"] for c in out] == ["CLOUD:hello there", "CLOUD:good night"]
+    assert len(hosted.chats) == 3  # one batched attempt + one call per line
+
+
+def test_batch_cancel_is_checked_between_groups():
+    hosted = NumberedProvider(prefix="CLOUD")
+    settings = {"translateBatchSize": 2, "translateConcurrency": 1}
+    t = make_translator(runner=None, settings=settings, hosted=[hosted])
+    out = t.translate(cues_n(5), "yo", cancelled=lambda: len(hosted.chats) >= 1)
+    assert [c["index"] for c in out] == [1, 2]
+
+
+# --------------------------------------------------------------------------- #
+# concurrency: several groups in flight, collected in order
+# --------------------------------------------------------------------------- #
+class GatedProvider(NumberedProvider):
+    """Blocks every chat until ``expected`` calls are in flight at once."""
+
+    def __init__(self, expected: int, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.barrier = threading.Barrier(expected, timeout=5)
+        self.lock = threading.Lock()
+
+    def chat(self, messages, **kwargs: Any) -> str:
+        self.barrier.wait()
+        with self.lock:
+            return super().chat(messages, **kwargs)
+
+
+def test_hosted_groups_run_concurrently_and_keep_cue_order():
+    hosted = GatedProvider(3, prefix="CLOUD")  # deadlocks (times out) unless 3 overlap
+    seen: list[Any] = []
+    t = make_translator(runner=None, settings={"translateBatchSize": 2, "translateConcurrency": 3}, hosted=[hosted])
+    out = t.translate(cues_n(6), "yo", progress=lambda pct, msg: seen.append(msg))
+    assert [c["text"] for c in out] == [f"CLOUD:line {i}" for i in range(1, 7)]
+    assert [c["index"] for c in out] == [1, 2, 3, 4, 5, 6]
+    assert seen == ["tier3: translated 2/6", "tier3: translated 4/6", "tier3: translated 6/6"]
+
+
+def test_concurrent_cancel_stops_sending_new_groups():
+    hosted = NumberedProvider(prefix="CLOUD")
+    flag = {"cancel": False}
+    t = make_translator(runner=None, settings={"translateBatchSize": 1, "translateConcurrency": 2}, hosted=[hosted])
+    out = t.translate(
+        cues_n(6),
+        "yo",
+        progress=lambda pct, msg: flag.__setitem__("cancel", True),
+        cancelled=lambda: flag["cancel"],
+    )
+    # Two groups were in flight when the first one landed; both are kept.
+    assert [c["index"] for c in out] == [1, 2]
+    assert len(hosted.chats) == 2
+
+
+def test_concurrent_group_failure_fails_the_tier_and_falls_back():
+    hosted = FakeProvider(prefix="CLOUD", fail_at=1)
+    local = NumberedProvider(prefix="LOCAL")
+    runner = FakeRunner()
+    t = make_translator(
+        runner=runner,
+        settings={**SETTINGS, "translateBatchSize": 1, "translateConcurrency": 2},
+        local=[local],
+        hosted=[hosted],
+    )
+    out = t.translate(cues_n(4), "yo")
+    assert [c["text"] for c in out] == [f"LOCAL:line {i}" for i in range(1, 5)]
+
+
+LOCAL_BACKSTOP_SPEC = PoolEntrySpec(
+    provider="local", kind="local", base_url="http://127.0.0.1:8088/v1", model="m", keys=(), local=True
+)
+
+
+def test_concurrency_defaults_and_clamp():
+    t = make_translator()
+    assert t.concurrency(TIER_HOSTED) == DEFAULT_HOSTED_CONCURRENCY
+    assert t.concurrency(TIER_LOCAL) == 1
+    assert t.concurrency(TIER_LOCAL_HEAVY) == 1
+    assert make_translator(settings={"translateConcurrency": 99}).concurrency(TIER_HOSTED) == MAX_CONCURRENCY
+    # local work stays serial even when a count is set explicitly
+    assert make_translator(settings={"translateConcurrency": 8}).concurrency(TIER_LOCAL) == 1
+    assert make_translator(settings={"translateConcurrency": -3}).concurrency(TIER_HOSTED) == 1
+    assert make_translator(settings={"translateConcurrency": False}).concurrency(TIER_HOSTED) == 4
+
+
+def test_hosted_tier_resolved_to_a_local_pool_runs_one_group_at_a_time():
+    local_pool = RotatingProvider(pool=[LOCAL_BACKSTOP_SPEC], transport=lambda *a: {})
+    t = make_translator(settings={"translateConcurrency": 8})
+    assert t.concurrency(TIER_HOSTED, local_pool) == 1
+    assert t.concurrency(TIER_HOSTED, LocalServerProvider()) == 1
+    assert t.concurrency(TIER_HOSTED, CloudProvider(api_key="k")) == 8
+
+
+def test_batch_size_defaults_and_clamp():
+    t = make_translator()
+    assert t.batch_size(TIER_HOSTED) == DEFAULT_HOSTED_BATCH_SIZE
+    assert t.batch_size(TIER_LOCAL) == 1
+    assert t.batch_size(TIER_LOCAL_HEAVY) == 1
+    assert make_translator(settings={"translateBatchSize": 999}).batch_size(TIER_HOSTED) == MAX_BATCH_SIZE
+    # local tiers stay one cue per call even when a size is set explicitly
+    assert make_translator(settings={"translateBatchSize": 8}).batch_size(TIER_LOCAL_HEAVY) == 1
+    assert make_translator(settings={"translateBatchSize": 0}).batch_size(TIER_HOSTED) == 1
+    # a bool / non-int is not an explicit size -> per-tier default
+    assert make_translator(settings={"translateBatchSize": True}).batch_size(TIER_HOSTED) == DEFAULT_HOSTED_BATCH_SIZE
+    assert make_translator(settings={"translateBatchSize": "8"}).batch_size(TIER_LOCAL) == 1
+
+
+def test_hosted_tier_resolved_to_a_local_pool_goes_one_cue_per_call():
+    local_pool = RotatingProvider(pool=[LOCAL_BACKSTOP_SPEC], transport=lambda *a: {})
+    assert make_translator().batch_size(TIER_HOSTED, local_pool) == 1
+    assert make_translator(settings={"translateBatchSize": 8}).batch_size(TIER_HOSTED, local_pool) == 1
+    assert make_translator().batch_size(TIER_HOSTED, CloudProvider(api_key="k")) == DEFAULT_HOSTED_BATCH_SIZE
+
+
 # --------------------------------------------------------------------------- #
 # tier1: routed local translation
 # --------------------------------------------------------------------------- #
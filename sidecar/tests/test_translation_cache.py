@@ -0,0 +1,196 @@
+"""Unit tests for media_studio.models.translation_cache.
+
+The cache answers an identical ``(tier, provider, model, source, target, text)``
+without a chat call. These tests pin:
+
+  * ``get`` / ``put`` / ``flush`` round-trip through an injected store dir, one
+    shard file per tier + model + language pair, with corrupt or unwritable
+    shards degrading to a miss;
+  * the per-shard LRU cap, and a flush that merges with the shard on disk and
+    replaces it atomically;
+  * ``TieredTranslator`` sends each distinct uncached line once, fills repeats
+    and hits in place, and flushes even when a tier fails;
+  * the Services wiring honours ``translationCache`` / ``translationCacheDir``.
+
+Providers are the fakes from ``test_translation`` — no network, no model.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+
+import pytest
+from media_studio.handlers import Services
+from media_studio.models.provider import CloudProvider
+from media_studio.models.translation import TIER_HOSTED, TieredTranslator, TranslationError
+from media_studio.models.translation_cache import TranslationCache
+
+from tests.test_translation import FakeProvider, NumberedProvider, make_factory
+
+
+@pytest.fixture
+def store(tmp_path: Path) -> TranslationCache:
+    return TranslationCache(store_dir=tmp_path / "translation-cache")
+
+
+def _reply(content: str) -> Any:
+    return lambda url, body, headers, timeout: {"choices": [{"message": {"content": content}}]}
+
+
+def cues_of(*texts: str) -> list[dict[str, Any]]:
+    return [{"index": i, "start": float(i), "end": i + 1.0, "text": t} for i, t in enumerate(texts, 1)]
+
+
+def hosted_translator(provider: Any, cache: TranslationCache | None = None) -> TieredTranslator:
+    return TieredTranslator(settings={}, hosted_provider_factory=make_factory([provider] * 3), cache=cache)
+
+
+# --------------------------------------------------------------------------- #
+# the store
+# --------------------------------------------------------------------------- #
+def test_put_then_get_is_keyed_on_tier_and_pair(store: TranslationCache) -> None:
+    store.put("tier3", "en", "fr", "Yes.", "Oui.")
+    assert store.get("tier3", "en", "fr", "Yes.") == "Oui."
+    assert store.get("tier3", "en", "de", "Yes.") is None
+    assert store.get("tier1", "en", "fr", "Yes.") is None
+    assert store.get("tier3", None, "fr", "Yes.") is None
+
+
+def test_flush_persists_one_shard_per_pair(store: TranslationCache, tmp_path: Path) -> None:
+    store.put("tier3", "en", "fr", "Yes.", "Oui.")
+    store.put("tier3", "en", "fr", "No.", "Non.")
+    store.put("tier3", None, "de", "Yes.", "Ja.")
+    store.flush()
+    assert len(list((tmp_path / "translation-cache").glob("*.json"))) == 2
+    reopened = TranslationCache(store_dir=tmp_path / "translation-cache")
+    assert reopened.get("tier3", "en", "fr", "No.") == "Non."
+    assert reopened.get("tier3", "", "de", "Yes.") == "Ja."
+
+
+def test_shard_name_is_a_digest_never_the_raw_tag(store: TranslationCache, tmp_path: Path) -> None:
+    path = store.path_for(store.shard_key("tier3", "../../etc", "fr"))
+    assert path is not None and path.parent == tmp_path / "translation-cache"
+
+
+def test_corrupt_shard_is_a_miss(store: TranslationCache, tmp_path: Path) -> None:
+    path = store.path_for(store.shard_key("tier3", "en", "fr"))
+    assert path is not None
+    path.parent.mkdir(parents=True)
+    path.write_text("{not json", encoding="utf-8")
+    assert store.get("tier3", "en", "fr", "Yes.") is None
+
+
+def test_unwritable_store_is_logged_not_raised(tmp_path: Path) -> None:
+    blocker = tmp_path / "blocker"
+    blocker.write_text("a file, not a dir", encoding="utf-8")
+    cache = TranslationCache(store_dir=blocker / "sub")
+    cache.put("tier3", "en", "fr", "Yes.", "Oui.")
+    cache.flush()
+    assert cache.get("tier3", "en", "fr", "Yes.") == "Oui."
+
+
+def test_key_carries_provider_and_model(store: TranslationCache) -> None:
+    store.put("tier3", "en", "fr", "Yes.", "Oui.", provider="groq", model="a")
+    assert store.get("tier3", "en", "fr", "Yes.", provider="groq", model="a") == "Oui."
+    assert store.get("tier3", "en", "fr", "Yes.", provider="groq", model="b") is None
+    assert store.get("tier3", "en", "fr", "Yes.", provider="other", model="a") is None
+
+
+def test_shard_is_capped_least_recently_used_first(tmp_path: Path) -> None:
+    cache = TranslationCache(store_dir=tmp_path, max_entries=2)
+    cache.put("tier3", "en", "fr", "a", "A")
+    cache.put("tier3", "en", "fr", "b", "B")
+    assert cache.get("tier3", "en", "fr", "a") == "A"  # "b" is now the oldest
+    cache.put("tier3", "en", "fr", "c", "C")
+    cache.flush()
+    reopened = TranslationCache(store_dir=tmp_path)
+    assert [reopened.get("tier3", "en", "fr", t) for t in "abc"] == ["A", None, "C"]
+
+
+def test_flush_merges_with_a_concurrent_writer_and_leaves_no_temp(tmp_path: Path) -> None:
+    one = TranslationCache(store_dir=tmp_path)
+    two = TranslationCache(store_dir=tmp_path)
+    assert one.get("tier3", "en", "fr", "Yes.") is None  # both load the (empty) shard
+    assert two.get("tier3", "en", "fr", "Yes.") is None
+    one.put("tier3", "en", "fr", "Yes.", "Oui.")
+    two.put("tier3", "en", "fr", "No.", "Non.")
+    one.flush()
+    two.flush()
+    reopened = TranslationCache(store_dir=tmp_path)
+    assert reopened.get("tier3", "en", "fr", "Yes.") == "Oui."
+    assert reopened.get("tier3", "en", "fr", "No.") == "Non."
+    assert [p.suffix for p in tmp_path.iterdir()] == [".json"]
+
+
+def test_memory_only_cache_never_touches_disk() -> None:
+    cache = TranslationCache()
+    cache.put("tier3", "en", "fr", "Yes.", "Oui.")
+    cache.flush()
+    assert cache.path_for(cache.shard_key("tier3", "en", "fr")) is None
+    assert cache.get("tier3", "en", "fr", "Yes.") == "Oui."
+
+
+# --------------------------------------------------------------------------- #
+# TieredTranslator integration
+# --------------------------------------------------------------------------- #
+def test_repeated_lines_are_sent_once() -> None:
+    hosted = NumberedProvider(prefix="CLOUD")
+    out = hosted_translator(hosted).translate(cues_of("Yes.", "Who?", "Yes.", "Yes."), "yo")
+    assert [c["text"] for c in out] == ["CLOUD:Yes.", "CLOUD:Who?", "CLOUD:Yes.", "CLOUD:Yes."]
+    assert [m[-1]["content"] for m in hosted.chats] == ["1. Yes.\n2. Who?"]
+
+
+def test_second_run_is_served_from_the_persisted_cache(tmp_path: Path) -> None:
+    first = NumberedProvider(prefix="CLOUD")
+    hosted_translator(first, TranslationCache(store_dir=tmp_path)).translate(cues_of("Yes.", "Who?"), "yo")
+    second = NumberedProvider(prefix="OTHER")
+    out = hosted_translator(second, TranslationCache(store_dir=tmp_path)).translate(
+        cues_of("Who?", "Thanks.", "Yes."), "yo"
+    )
+    assert [c["text"] for c in out] == ["CLOUD:Who?", "OTHER:Thanks.", "CLOUD:Yes."]
+    assert [m[-1]["content"] for m in second.chats] == ["Thanks."]
+
+
+def test_failed_tier_still_flushes_completed_lines(tmp_path: Path) -> None:
+    hosted = FakeProvider(prefix="CLOUD", fail_at=1)
+    translator = TieredTranslator(
+        settings={"translateBatchSize": 1},
+        hosted_provider_factory=make_factory([hosted]),
+        cache=TranslationCache(store_dir=tmp_path),
+    )
+    with pytest.raises(TranslationError):
+        translator.translate(cues_of("Yes.", "Who?"), "yo")
+    cached = TranslationCache(store_dir=tmp_path).get(TIER_HOSTED, None, "yo", "Yes.", provider="FakeProvider")
+    assert cached == "CLOUD:Yes."
+
+
+def test_a_different_model_is_not_served_the_cached_lines(tmp_path: Path) -> None:
+    first = CloudProvider(api_key="k", base_url="https://api.example/v1", model="big", transport=_reply("BIG"))
+    hosted_translator(first, TranslationCache(store_dir=tmp_path)).translate(cues_of("Yes."), "yo")
+    second = CloudProvider(api_key="k", base_url="https://api.example/v1", model="small", transport=_reply("SMALL"))
+    out = hosted_translator(second, TranslationCache(store_dir=tmp_path)).translate(cues_of("Yes."), "yo")
+    assert [c["text"] for c in out] == ["SMALL"]
+    again = CloudProvider(api_key="k", base_url="https://api.example/v1", model="big", transport=_reply("NEW"))
+    out = hosted_translator(again, TranslationCache(store_dir=tmp_path)).translate(cues_of("Yes."), "yo")
+    assert [c["text"] for c in out] == ["BIG"]
+
+
+# --------------------------------------------------------------------------- #
+# Services wiring
+# --------------------------------------------------------------------------- #
+def test_services_cache_under_data_dir(tmp_path: Path) -> None:
+    svc = Services(data_dir=tmp_path / "d")
+    cache = svc._translation_cache()
+    assert isinstance(cache, TranslationCache)
+    path = cache.path_for(cache.shard_key("tier3", "en", "fr"))
+    assert path is not None and path.parent == tmp_path / "d" / "translation-cache"
+
+
+def test_services_cache_dir_override_and_off(tmp_path: Path) -> None:
+    svc = Services(data_dir=tmp_path / "d")
+    svc.settings.set({"translationCacheDir": str(tmp_path / "elsewhere")})
+    cache = svc._translation_cache()
+    assert cache.path_for(cache.shard_key("tier3", "en", "fr")).parent == tmp_path / "elsewhere"
+    svc.settings.set({"translationCache": False})
+    assert svc._translation_cache() is None
@@ -541,7 +541,7 @@ def test_translator_for_function_forces_local_when_routing_local(tmp_path: Path,
 
     captured: dict[str, Any] = {}
 
-    def spy(settings: Any, *, runner: Any = None, prefer: Any = None, ensure: Any = None) -> Any:
+    def spy(settings: Any, *, runner: Any = None, prefer: Any = None, ensure: Any = None, cache: Any = None) -> Any:
         captured["prefer"] = prefer
         return object()
 
@@ -564,7 +564,7 @@ def test_translator_for_function_keeps_routed_prefer_when_routing_cloud(tmp_path
 
     captured: dict[str, Any] = {}
 
-    def spy(settings: Any, *, runner: Any = None, prefer: Any = None, ensure: Any = None) -> Any:
+    def spy(settings: Any, *, runner: Any = None, prefer: Any = None, ensure: Any = None, cache: Any = None) -> Any:
         captured["prefer"] = prefer
         return object()
 
@@ -587,7 +587,7 @@ def test_translator_for_function_forces_local_when_offline(tmp_path: Path, monke
 
     captured: dict[str, Any] = {}
 
-    def spy(settings: Any, *, runner: Any = None, prefer: Any = None, ensure: Any = None) -> Any:
+    def spy(settings: Any, *, runner: Any = None, prefer: Any = None, ensure: Any = None, cache: Any = None) -> Any:
         captured["prefer"] = prefer
         return object()
 
@@ -611,7 +611,7 @@ def test_translator_for_function_drops_non_text_consented_cloud(tmp_path: Path,
 
     captured: dict[str, Any] = {}
 
-    def spy(settings: Any, *, runner: Any = None, prefer: Any = None, ensure: Any = None) -> Any:
+    def spy(settings: Any, *, runner: Any = None, prefer: Any = None, ensure: Any = None, cache: Any = None) -> Any:
         captured["providers"] = [str(p.get("provider")) for p in settings.get("providers", [])]
         return object()
 
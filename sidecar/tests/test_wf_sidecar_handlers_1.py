@@ -179,6 +179,7 @@ def test_maybe_align_words_forwards_progress_and_cancel(tmp_path: Path, monkeypa
         audio_path: str,
         *,
         settings: Any = None,
+        audio_loader: Any = None,
         on_progress: Any = None,
         should_cancel: Any = None,
     ) -> dict[str, Any]:
@@ -210,7 +211,9 @@ def test_dub_translator_forces_local_pool_when_offline(tmp_path: Path, monkeypat
 
     captured: dict[str, Any] = {}
 
-    def spy_get_translator(settings: Any, *, runner: Any = None, prefer: Any = None, ensure: Any = None):
+    def spy_get_translator(
+        settings: Any, *, runner: Any = None, prefer: Any = None, ensure: Any = None, cache: Any = None
+    ):
         captured["prefer"] = prefer
         return object()
 
@@ -244,7 +247,9 @@ def test_dub_translator_threads_routed_prefer_when_online(tmp_path: Path, monkey
 
     captured: dict[str, Any] = {}
 
-    def spy_get_translator(settings: Any, *, runner: Any = None, prefer: Any = None, ensure: Any = None):
+    def spy_get_translator(
+        settings: Any, *, runner: Any = None, prefer: Any = None, ensure: Any = None, cache: Any = None
+    ):
         captured["prefer"] = prefer
         return object()
 
@@ -0,0 +1,47 @@
+"""Unit tests for the shared vectorized window grid (``features._window_grid``).
+
+The oracle is the ``while start < d: ... start += hop`` loop every module ran
+before the grid was vectorized; the grid must match it bit-for-bit (same window
+count, same float starts/ends) so no module's window index shifts.
+"""
+
+from __future__ import annotations
+
+import pytest
+from media_studio.features._window_grid import stride_windows
+
+
+def _reference_windows(duration: float, win: float, hop: float, tail: float = 0.0) -> list[tuple[float, float]]:
+    """The sequential ``start += hop`` loop the vectorized grid replaced (oracle)."""
+    windows: list[tuple[float, float]] = []
+    start = 0.0
+    while start < duration - tail:
+        windows.append((start, min(start + win, duration)))
+        start += hop
+    return windows
+
+
+@pytest.mark.parametrize(
+    ("duration", "win", "hop", "tail"),
+    [
+        (10.0, 1.0, 1.0, 0.0),
+        (10.5, 2.0, 1.0, 0.0),
+        (0.3, 0.1, 0.1, 0.0),
+        (0.3, 0.1, 0.1, 1e-9),
+        (7.0, 0.7, 0.7, 1e-9),
+        (1.0, 1e-3, 1e-3, 0.0),
+        (3600.0, 2.0, 0.5, 1e-9),
+        (0.25, 5.0, 5.0, 0.0),
+    ],
+)
+def test_stride_windows_matches_sequential_loop(duration, win, hop, tail):
+    assert stride_windows(duration, win, hop, tail=tail) == _reference_windows(duration, win, hop, tail)
+
+
+def test_stride_windows_clamps_last_end_to_duration():
+    assert stride_windows(2.5, 1.0, 1.0) == [(0.0, 1.0), (1.0, 2.0), (2.0, 2.5)]
+
+
+@pytest.mark.parametrize(("duration", "tail"), [(0.0, 0.0), (-1.0, 0.0), (1e-10, 1e-9)])
+def test_stride_windows_empty_when_limit_not_positive(duration, tail):
+    assert stride_windows(duration, 1.0, 1.0, tail=tail) == []